@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Laufzeiten bei wachsender Datenmenge
+
+Erzeugt für jede Größe (Anzahl Aufträge, Standard 1k/10k/100k/1M) eine
+Datenbank mit synthetischer Werkstatt-Historie (db.demo_data.generate_workshop_data)
+und misst in einem eigenen Python-Prozess
+  - das Laden der Tabs (load_*_data, update_dashboard_data, update_finanzen_data),
+  - die Filter- und Suchfunktionen (filter_*, search_kunden),
+  - die Abfragen der Tabs ohne Oberfläche (services.*),
+  - die Berichte (ErweitertesBerichtswesen.generate_*),
+  - die Erstellung einer Rechnungs-PDF (generate_invoice_pdf).
+
+Gemessen wird jeweils bis die Oberfläche aktualisiert ist, also einschließlich
+der Abfragen im Hintergrund-Thread. Das Hauptfenster wird dabei nicht
+angezeigt; ohne Bildschirm (z.B. auf einem Server: xvfb-run) werden nur die
+Messungen ohne Tk ausgeführt.
+
+Aufruf (im Programmverzeichnis):
+    python benchmarks/scaling.py [--scales 1000 10000] [--runs 3] [--json ergebnis.json]
+                                 [--data-dir daten/] [--check-plans]
+
+Vor den Messungen wird geprüft, dass keine der häufigen Abfragen
+(db.indexes.HOT_QUERIES und die Übersichtslisten aus services.*) eine
+Tabelle vollständig durchläuft; andernfalls bricht das Skript mit Exit-Code 1
+ab. Mit --check-plans wird nur diese Prüfung ausgeführt.
+
+Mit --data-dir werden die erzeugten Datenbanken dort abgelegt und bei
+weiteren Läufen wiederverwendet (die Erzeugung von 1M Aufträgen dauert
+mehrere Minuten). Die JSON-Ausgabe ist für den Vergleich über die Zeit gedacht.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+# Anzahl Aufträge je Messreihe
+DEFAULT_SCALES = (1000, 10000, 100000, 1000000)
+
+# Zeitraum der erzeugten Historie in Jahren
+HISTORY_YEARS = 10
+
+# Wartezeit beim Abarbeiten der Hintergrundabfragen in Sekunden
+IDLE_POLL_S = 0.001
+
+
+def generate_database(path, auftraege, seed):
+    """Legt eine neue Datenbank an und füllt sie mit der synthetischen Historie"""
+    from db.database import ConnectionManager, create_database
+    from db.demo_data import generate_workshop_data
+
+    manager = ConnectionManager(path)
+    try:
+        conn = create_database(manager)
+        start = time.perf_counter()
+        counts = generate_workshop_data(conn, auftraege, HISTORY_YEARS, seed)
+        elapsed = time.perf_counter() - start
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        manager.close()
+    return counts, elapsed
+
+
+def list_plan_queries():
+    """Blätterabfragen aller Übersichtslisten mit den Filtern der Tabs als [(SQL, Parameter)]"""
+    from services.listen import plan_queries
+    from services.kunden import KUNDEN_LISTE
+    from services.auftraege import AUFTRAEGE_LISTE, auftraege_filter
+    from services.ersatzteile import ERSATZTEILE_LISTE, ersatzteile_filter
+    from services.rechnungen import RECHNUNGEN_LISTE, rechnungen_filter
+
+    filters = [
+        (KUNDEN_LISTE, ("", ())),
+        (AUFTRAEGE_LISTE, auftraege_filter()),
+        (AUFTRAEGE_LISTE, auftraege_filter("Offen")),
+        (ERSATZTEILE_LISTE, ersatzteile_filter()),
+        (ERSATZTEILE_LISTE, ersatzteile_filter("Filter")),
+        (ERSATZTEILE_LISTE, ersatzteile_filter("Filter", True)),
+        (RECHNUNGEN_LISTE, rechnungen_filter()),
+        (RECHNUNGEN_LISTE, rechnungen_filter("Offen")),
+        (RECHNUNGEN_LISTE, rechnungen_filter("Alle", "Dieses Jahr")),
+        (RECHNUNGEN_LISTE, rechnungen_filter("Bezahlt", "Dieses Jahr")),
+    ]
+    queries = []
+    for liste, (where_clause, params) in filters:
+        queries.extend(plan_queries(liste, where_clause, params))
+    return queries
+
+
+def check_query_plans():
+    """Legt eine neue Datenbank an und gibt alle vollständigen Tabellendurchläufe
+    der häufigen Abfragen zurück: [(SQL, Planzeile)], leer wenn alles über Indizes läuft"""
+    from db.database import ConnectionManager, create_database
+    from db.indexes import HOT_QUERIES, find_full_table_scans
+
+    work_dir = tempfile.mkdtemp(prefix='automeister_plans_')
+    manager = ConnectionManager(os.path.join(work_dir, 'autowerkstatt.db'))
+    try:
+        # create_database führt auch update_database_schema (inkl. Indizes) aus
+        conn = create_database(manager)
+        return find_full_table_scans(conn, HOT_QUERIES + list_plan_queries())
+    finally:
+        manager.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def timed(func, runs, wait=None):
+    """Führt func runs-mal aus; Rückgabe {'median_ms', 'runs_ms'} oder {'error'}"""
+    times = []
+    try:
+        for _ in range(runs):
+            start = time.perf_counter()
+            result = func()
+            if wait:
+                wait()
+            times.append((time.perf_counter() - start) * 1000)
+            if isinstance(result, tuple) and result and result[0] is False:
+                # z.B. generate_invoice_pdf: (False, Fehlermeldung)
+                return {'error': str(result[1])}
+    except Exception as e:
+        return {'error': f"{type(e).__name__}: {e}"}
+    return {'median_ms': round(statistics.median(times), 2), 'runs_ms': [round(t, 2) for t in times]}
+
+
+def service_cases(conn):
+    """Abfragen der Tabs ohne Oberfläche (services.*): {Name: Funktion}"""
+    from services.listen import first_page
+    from services.kunden import KUNDEN_LISTE
+    from services.auftraege import AUFTRAEGE_LISTE, auftraege_filter, get_auftrag_details
+    from services.ersatzteile import ERSATZTEILE_LISTE, ersatzteile_filter
+    from services.rechnungen import RECHNUNGEN_LISTE, rechnungen_filter, get_rechnung_details
+    from services.finanzen import BERICHT_TYPEN, list_einnahmen, list_ausgaben, create_finanzbericht
+    from services.dashboard import get_dashboard_daten
+
+    cursor = conn.cursor()
+    cursor.execute("SELECT MAX(id) FROM auftraege")
+    auftrag_id = cursor.fetchone()[0]
+    cursor.execute("SELECT MAX(id) FROM rechnungen")
+    rechnung_id = cursor.fetchone()[0]
+
+    cases = {
+        'services.kunden': lambda: first_page(conn, KUNDEN_LISTE),
+        'services.auftraege': lambda: first_page(conn, AUFTRAEGE_LISTE),
+        'services.auftraege[status]': lambda: first_page(conn, AUFTRAEGE_LISTE, *auftraege_filter("Offen")),
+        'services.ersatzteile[filter]': lambda: first_page(conn, ERSATZTEILE_LISTE,
+                                                           *ersatzteile_filter("Filter", True)),
+        'services.rechnungen[filter]': lambda: first_page(conn, RECHNUNGEN_LISTE,
+                                                          *rechnungen_filter("Offen", "Dieses Jahr")),
+        'services.get_auftrag_details': lambda: get_auftrag_details(conn, auftrag_id),
+        'services.get_rechnung_details': lambda: get_rechnung_details(conn, rechnung_id),
+        'services.list_einnahmen': lambda: list_einnahmen(conn, "Dieses Jahr"),
+        'services.list_ausgaben': lambda: list_ausgaben(conn, "Alle", "Dieses Jahr"),
+        'services.get_dashboard_daten': lambda: get_dashboard_daten(conn),
+    }
+    for bericht_typ in BERICHT_TYPEN:
+        cases[f"services.create_finanzbericht[{bericht_typ}]"] = (
+            lambda bericht_typ=bericht_typ: create_finanzbericht(conn, bericht_typ, "Dieses Jahr"))
+    return cases
+
+
+def invoice_cases(conn, work_dir):
+    """Erstellung einer Rechnungs-PDF (ohne Tk)"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT id FROM rechnungen ORDER BY id DESC LIMIT 1")
+    row = cursor.fetchone()
+    if row is None:
+        return {}
+
+    try:
+        from utils.pdf_generator import generate_invoice_pdf
+    except ImportError as e:
+        # reportlab fehlt: als Fehler der Messung ausweisen
+        error = e
+        def generate_invoice_pdf(*args):
+            raise error
+
+    pdf_path = os.path.join(work_dir, 'rechnung.pdf')
+    return {'generate_invoice_pdf': lambda: generate_invoice_pdf(conn, row[0], pdf_path)}
+
+
+def gui_cases(app):
+    """Messungen mit dem (unsichtbaren) Hauptfenster: {Name: Funktion}"""
+    from gui.kunden import load_kunden_data, search_kunden
+    from gui.auftraege import load_auftraege_data, filter_auftraege
+    from gui.ersatzteile import load_ersatzteile_data, filter_ersatzteile
+    from gui.rechnungen import load_rechnungen_data, filter_rechnungen
+    from gui.finanzen import update_finanzen_data, filter_einnahmen, filter_ausgaben
+    from gui.dashboard_modern import update_dashboard_data
+
+    def with_vars(widgets, values, func):
+        def run():
+            for key, value in values.items():
+                widgets[key].set(value)
+            return func(app)
+        return run
+
+    kunden = app.kunden_widgets
+    auftraege = app.auftraege_widgets
+    ersatzteile = app.ersatzteile_widgets
+    rechnungen = app.rechnungen_widgets
+    finanzen = app.finanzen_widgets
+
+    return {
+        'load_kunden_data': lambda: load_kunden_data(app),
+        'load_auftraege_data': lambda: load_auftraege_data(app),
+        'load_ersatzteile_data': lambda: load_ersatzteile_data(app),
+        'load_rechnungen_data': lambda: load_rechnungen_data(app),
+        'update_dashboard_data': lambda: update_dashboard_data(app),
+        'update_finanzen_data': with_vars(finanzen, {'finanzen_zeitraum_var': "Dieses Jahr"}, update_finanzen_data),
+        'search_kunden': with_vars(kunden, {'kunden_search_var': "Müller"}, search_kunden),
+        'filter_auftraege[status]': with_vars(
+            auftraege, {'status_filter_var': "Offen", 'auftraege_search_var': ""}, filter_auftraege),
+        'filter_auftraege[suche]': with_vars(
+            auftraege, {'status_filter_var': "Alle", 'auftraege_search_var': "Bremsen"}, filter_auftraege),
+        'filter_ersatzteile': with_vars(
+            ersatzteile, {'kategorie_filter_var': "Filter", 'low_stock_var': True, 'ersatzteile_search_var': ""},
+            filter_ersatzteile),
+        'filter_rechnungen': with_vars(
+            rechnungen, {'rechnung_status_var': "Offen", 'rechnung_zeitraum_var': "Dieses Jahr",
+                         'rechnungen_search_var': ""}, filter_rechnungen),
+        'filter_einnahmen': with_vars(finanzen, {'einnahmen_zeitraum_var': "Dieses Jahr"}, filter_einnahmen),
+        'filter_ausgaben': with_vars(finanzen, {'ausgaben_zeitraum_var': "Dieses Jahr"}, filter_ausgaben),
+    }
+
+
+def report_cases(root, conn):
+    """Alle generate_*-Methoden des Berichtswesens für das laufende Jahr, monatlich"""
+    import inspect
+    from gui.reports import ErweitertesBerichtswesen
+
+    berichte = ErweitertesBerichtswesen(root, conn)
+    berichte.dialog.withdraw()
+    berichte.period_var.set("Dieses Jahr")
+    berichte.detail_var.set("Monatlich")
+
+    def call(method):
+        def run():
+            args = {'detail': "Monatlich"}
+            args['where_clause'], args['date_values'] = berichte.get_time_period_sql()
+            names = inspect.signature(method).parameters
+            return method(**{name: args[name] for name in names})
+        return run
+
+    return {f"ErweitertesBerichtswesen.{name}": call(getattr(berichte, name))
+            for name in sorted(dir(berichte))
+            if name.startswith('generate_') and name != 'generate_report'}
+
+
+def run_worker(runs):
+    """Läuft im Kindprozess (Arbeitsverzeichnis mit autowerkstatt.db) und gibt JSON aus"""
+    work_dir = os.getcwd()
+    results = {}
+
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception as e:
+        # Ohne Bildschirm nur die Messungen ohne Tk
+        from db.database import ConnectionManager, create_database
+        manager = ConnectionManager()
+        conn = create_database(manager)
+        cases = service_cases(conn)
+        cases.update(invoice_cases(conn, work_dir))
+        for name, func in cases.items():
+            results[name] = timed(func, runs)
+        manager.close()
+        print(json.dumps({'cases': results, 'gui_error': str(e)}))
+        return
+
+    from gui.main_window import ModernAutowerkstattApp, TABS
+
+    root.withdraw()
+    app = ModernAutowerkstattApp(root)
+
+    def wait_idle():
+        # Hintergrundabfragen abwarten und ihre Ergebnisse in die Oberfläche übernehmen
+        while app.executor.pending:
+            root.update()
+            time.sleep(IDLE_POLL_S)
+        root.update_idletasks()
+
+    wait_idle()
+    for index in range(len(TABS)):
+        app.build_tab(index)
+
+    cases = gui_cases(app)
+    try:
+        cases.update(report_cases(root, app.conn))
+    except Exception as e:
+        results['ErweitertesBerichtswesen'] = {'error': f"{type(e).__name__}: {e}"}
+    cases.update(service_cases(app.conn))
+    cases.update(invoice_cases(app.conn, work_dir))
+
+    for name, func in cases.items():
+        results[name] = timed(func, runs, wait_idle)
+
+    app.on_close()
+    print(json.dumps({'cases': results}))
+
+
+def measure_scale(auftraege, runs, seed, data_dir):
+    """Erzeugt (oder übernimmt) die Datenbank einer Größe und misst im Kindprozess"""
+    work_dir = tempfile.mkdtemp(prefix='automeister_scale_')
+    db_path = os.path.join(work_dir, 'autowerkstatt.db')
+    result = {'auftraege': auftraege}
+    try:
+        cached = os.path.join(data_dir, f"werkstatt_{auftraege}_{seed}.db") if data_dir else None
+        if cached and os.path.exists(cached):
+            shutil.copy(cached, db_path)
+            result['generate_s'] = None
+        else:
+            counts, elapsed = generate_database(db_path, auftraege, seed)
+            result['generate_s'] = round(elapsed, 2)
+            if cached:
+                os.makedirs(data_dir, exist_ok=True)
+                shutil.copy(db_path, cached)
+
+        conn = sqlite3.connect(db_path)
+        tables = ('kunden', 'fahrzeuge', 'ersatzteile', 'auftraege', 'auftrag_ersatzteile', 'rechnungen',
+                  'ausgaben', 'termine', 'bestandsaenderungen')
+        result['rows'] = {table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in tables}
+        conn.close()
+        result['db_mb'] = round(os.path.getsize(db_path) / 1024 / 1024, 1)
+
+        proc = subprocess.run([sys.executable, os.path.abspath(__file__), '--worker', '--runs', str(runs)],
+                              cwd=work_dir, capture_output=True, text=True)
+        if proc.returncode != 0:
+            result['error'] = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "Abbruch"
+            result['cases'] = {}
+        else:
+            result.update(json.loads(proc.stdout.strip().splitlines()[-1]))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return result
+
+
+def print_table(results):
+    """Gibt die Mediane als Tabelle (Messung x Größe) aus"""
+    names = sorted({name for result in results for name in result.get('cases', {})})
+    scales = [result['auftraege'] for result in results]
+    width = max([len(name) for name in names] + [10])
+
+    print(f"{'Aufträge':<{width}}" + ''.join(f"{scale:>12,}" for scale in scales))
+    for name in names:
+        cells = []
+        for result in results:
+            case = result.get('cases', {}).get(name)
+            if case is None:
+                cells.append(f"{'-':>12}")
+            elif 'error' in case:
+                cells.append(f"{'Fehler':>12}")
+            else:
+                cells.append(f"{case['median_ms']:>9.1f} ms")
+        print(f"{name:<{width}}" + ''.join(cells))
+
+    for result in results:
+        for name, case in result.get('cases', {}).items():
+            if 'error' in case:
+                print(f"  {result['auftraege']:,} / {name}: {case['error']}")
+        for key in ('error', 'gui_error'):
+            if key in result:
+                print(f"  {result['auftraege']:,}: {result[key]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Misst Ladezeiten, Filter, Berichte und PDF bei wachsender Datenmenge")
+    parser.add_argument('--scales', type=int, nargs='+', default=list(DEFAULT_SCALES), help="Anzahl Aufträge je Messreihe")
+    parser.add_argument('--runs', type=int, default=3, help="Anzahl der Messungen je Funktion (Median wird ausgegeben)")
+    parser.add_argument('--seed', type=int, default=42, help="Startwert für die erzeugten Daten")
+    parser.add_argument('--data-dir', help="Verzeichnis für die erzeugten Datenbanken (werden wiederverwendet)")
+    parser.add_argument('--json', help="Ergebnis zusätzlich als JSON-Datei speichern")
+    parser.add_argument('--check-plans', action='store_true',
+                        help="Nur prüfen, dass die häufigen Abfragen keine Tabelle vollständig durchlaufen")
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.runs)
+        return 0
+
+    full_scans = check_query_plans()
+    for query, detail in full_scans:
+        print(f"Vollständiger Tabellendurchlauf ({detail}):\n    {' '.join(query.split())}")
+    if full_scans:
+        return 1
+    if args.check_plans:
+        print("Alle häufigen Abfragen verwenden Indizes.")
+        return 0
+
+    results = []
+    for auftraege in args.scales:
+        print(f"Messreihe mit {auftraege:,} Aufträgen ...", flush=True)
+        results.append(measure_scale(auftraege, args.runs, args.seed, args.data_dir))
+
+    print()
+    print_table(results)
+
+    if args.json:
+        report = {
+            'zeitpunkt': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'plattform': platform.platform(),
+            'runs': args.runs,
+            'seed': args.seed,
+            'scales': results,
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    return 1 if any('error' in result for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
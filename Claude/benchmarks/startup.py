@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Messung der Startzeit der Anwendung
+
+Misst in getrennten Python-Prozessen
+  - die Importzeit des Hauptfensters (python -X importtime) und die langsamsten Module,
+  - die Zeit vom Programmstart bis zum ersten Durchlauf der Tk-Ereignisschleife.
+
+Zusätzlich wird geprüft, dass die schweren Bibliotheken (matplotlib, numpy,
+pandas, reportlab, PIL) beim Start nicht geladen werden.
+
+Aufruf (im Programmverzeichnis):
+    python benchmarks/startup.py [--runs 5] [--json ergebnis.json]
+
+Die Anwendung arbeitet dabei auf einer Kopie der Datenbank in einem
+temporären Verzeichnis.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Module, die erst bei Bedarf geladen werden sollen
+HEAVY_MODULES = ('matplotlib', 'numpy', 'pandas', 'reportlab', 'PIL')
+
+# Anzahl der langsamsten Module in der Ausgabe
+TOP_MODULES = 15
+
+# Wird im Kindprozess ausgeführt: startet die Anwendung und beendet sie beim ersten Leerlauf
+MAINLOOP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {app_dir!r})
+
+import tkinter as tk
+from gui.main_window import ModernAutowerkstattApp
+
+root = tk.Tk()
+app = ModernAutowerkstattApp(root)
+
+def first_idle():
+    result = {{
+        'mainloop_s': time.perf_counter() - start,
+        'heavy_modules': sorted(m for m in {heavy!r} if m in sys.modules),
+    }}
+    print(json.dumps(result))
+    app.on_close()
+
+root.after_idle(first_idle)
+root.mainloop()
+"""
+
+
+def measure_importtime(work_dir):
+    """Importiert das Hauptfenster mit -X importtime und wertet die Ausgabe aus"""
+    code = f"import sys; sys.path.insert(0, {APP_DIR!r}); import gui.main_window"
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                          cwd=work_dir, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    modules = []
+    for line in proc.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+
+    total_us = sum(self_us for name, self_us, cumulative_us in modules)
+    loaded = {name.strip() for name, self_us, cumulative_us in modules}
+    slowest = sorted(modules, key=lambda m: m[2], reverse=True)[:TOP_MODULES]
+
+    return {
+        'total_ms': round(total_us / 1000, 1),
+        'heavy_modules': sorted(m for m in HEAVY_MODULES if m in loaded),
+        'slowest': [{'module': name, 'self_ms': round(s / 1000, 1), 'cumulative_ms': round(c / 1000, 1)}
+                    for name, s, c in slowest],
+    }
+
+
+def measure_mainloop(work_dir):
+    """Startet die Anwendung und misst die Zeit bis zum ersten Leerlauf der Ereignisschleife"""
+    script = MAINLOOP_SCRIPT.format(app_dir=APP_DIR, heavy=HEAVY_MODULES)
+    proc = subprocess.run([sys.executable, '-c', script], cwd=work_dir,
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Misst die Startzeit der Anwendung")
+    parser.add_argument('--runs', type=int, default=5, help="Anzahl der Messungen (Median wird ausgegeben)")
+    parser.add_argument('--db', default=os.path.join(APP_DIR, 'autowerkstatt.db'), help="Datenbank, deren Kopie verwendet wird")
+    parser.add_argument('--json', help="Ergebnis zusätzlich als JSON-Datei speichern")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix='automeister_start_')
+    try:
+        if os.path.exists(args.db):
+            shutil.copy(args.db, os.path.join(work_dir, 'autowerkstatt.db'))
+
+        imports = [measure_importtime(work_dir) for _ in range(args.runs)]
+        result = {
+            'runs': args.runs,
+            'import_ms': statistics.median(run['total_ms'] for run in imports),
+            'import_heavy_modules': imports[-1]['heavy_modules'],
+            'slowest_imports': imports[-1]['slowest'],
+        }
+
+        try:
+            mainloop = [measure_mainloop(work_dir) for _ in range(args.runs)]
+            result['mainloop_ms'] = round(statistics.median(run['mainloop_s'] for run in mainloop) * 1000, 1)
+            result['mainloop_heavy_modules'] = mainloop[-1]['heavy_modules']
+        except RuntimeError as e:
+            # z.B. ohne Bildschirm (kein DISPLAY)
+            result['mainloop_ms'] = None
+            result['mainloop_error'] = str(e)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"Import Hauptfenster:   {result['import_ms']:.1f} ms (Median aus {args.runs})")
+    if result['mainloop_ms'] is not None:
+        print(f"Start bis Mainloop:    {result['mainloop_ms']:.1f} ms")
+    else:
+        print(f"Start bis Mainloop:    nicht messbar ({result['mainloop_error']})")
+
+    print("\nLangsamste Importe (kumuliert):")
+    for entry in result['slowest_imports']:
+        print(f"  {entry['cumulative_ms']:8.1f} ms  {entry['module']}")
+
+    heavy = set(result['import_heavy_modules']) | set(result.get('mainloop_heavy_modules', []))
+    if heavy:
+        print(f"\nWARNUNG: Beim Start geladen: {', '.join(sorted(heavy))}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+
+    return 1 if heavy else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Monatliche Finanzkennzahlen (materialisiert)
+
+Die Tabelle finanz_monatswerte enthält je (Jahr, Monat, Kennzahl, Kategorie)
+die Summe und Anzahl der zugrunde liegenden Datensätze. Trigger auf
+rechnungen, ausgaben, auftrag_ersatzteile und ersatzteile passen die Werte
+bei jeder Änderung um die Differenz an, so dass Dashboard, Finanzen und
+Berichte nicht mehr die gesamte Historie aggregieren müssen.
+
+Beträge werden je Datensatz und nach jeder Addition auf Rappen gerundet
+(ROUND(..., 2)); so ergeben die Trigger genau dieselben Werte wie
+rebuild_monthly_rollup, ohne Rundungsreste aus der Gleitkomma-Addition.
+
+Kennzahlen:
+    umsatz          Rechnungsbeträge nach Rechnungsdatum (Kategorie 'bezahlt' oder 'offen')
+    ausgaben        Ausgaben nach Datum (Kategorie = Ausgabenkategorie)
+    materialkosten  Einkaufswert der Teile verrechneter Aufträge nach Rechnungsdatum
+"""
+
+from datetime import date
+
+ROLLUP_TABLE = "finanz_monatswerte"
+
+# Gruppierungen, die sich aus Monatswerten berechnen lassen (SQL-Ausdruck der Periode)
+GRANULARITIES = {
+    'month': "printf('%04d-%02d', jahr, monat)",
+    'quarter': "printf('%04d-%d', jahr, (monat - 1) / 3 + 1)",
+    'year': "printf('%04d', jahr)",
+}
+
+
+def _year(column):
+    return f"CAST(strftime('%Y', {column}) AS INTEGER)"
+
+
+def _month(column):
+    return f"CAST(strftime('%m', {column}) AS INTEGER)"
+
+
+def _upsert_sql(select_sql):
+    """Addiert die Zeilen (jahr, monat, kennzahl, kategorie, betrag, anzahl) auf die Monatswerte"""
+    # "WHERE true" ist nötig, damit SQLite ON CONFLICT nicht als JOIN-Bedingung liest
+    return f"""
+        INSERT INTO {ROLLUP_TABLE} (jahr, monat, kennzahl, kategorie, betrag, anzahl)
+        SELECT * FROM ({select_sql}) WHERE true
+        ON CONFLICT (jahr, monat, kennzahl, kategorie)
+        DO UPDATE SET betrag = ROUND(betrag + excluded.betrag, 2), anzahl = anzahl + excluded.anzahl;
+    """
+
+
+def _umsatz_delta(row, sign):
+    """Beitrag einer Rechnung zum Umsatz"""
+    return _upsert_sql(f"""
+        SELECT {_year(f'{row}.datum')}, {_month(f'{row}.datum')}, 'umsatz',
+               CASE WHEN {row}.bezahlt = 1 THEN 'bezahlt' ELSE 'offen' END,
+               ROUND({sign} * COALESCE({row}.gesamtbetrag, 0), 2), {sign}
+        WHERE {row}.datum IS NOT NULL
+    """)
+
+
+def _ausgaben_delta(row, sign):
+    """Beitrag einer Ausgabe"""
+    return _upsert_sql(f"""
+        SELECT {_year(f'{row}.datum')}, {_month(f'{row}.datum')}, 'ausgaben',
+               COALESCE({row}.kategorie, ''),
+               ROUND({sign} * COALESCE({row}.betrag, 0), 2), {sign}
+        WHERE {row}.datum IS NOT NULL
+    """)
+
+
+def _material_position_delta(row, sign):
+    """Beitrag einer Auftragsposition zu den Materialkosten (falls der Auftrag verrechnet ist)"""
+    return _upsert_sql(f"""
+        SELECT {_year('r.datum')}, {_month('r.datum')}, 'materialkosten', '',
+               ROUND({sign} * COALESCE({row}.menge * e.einkaufspreis, 0), 2), {sign}
+        FROM rechnungen r
+        JOIN ersatzteile e ON e.id = {row}.ersatzteil_id
+        WHERE r.auftrag_id = {row}.auftrag_id AND r.datum IS NOT NULL
+    """)
+
+
+def _material_rechnung_delta(row, sign):
+    """Beitrag aller Positionen eines Auftrags zu den Materialkosten im Monat der Rechnung"""
+    return _upsert_sql(f"""
+        SELECT {_year(f'{row}.datum')}, {_month(f'{row}.datum')}, 'materialkosten', '',
+               ROUND({sign} * COALESCE(SUM(ROUND(ae.menge * e.einkaufspreis, 2)), 0), 2), {sign} * COUNT(*)
+        FROM auftrag_ersatzteile ae
+        JOIN ersatzteile e ON ae.ersatzteil_id = e.id
+        WHERE ae.auftrag_id = {row}.auftrag_id AND {row}.datum IS NOT NULL
+        GROUP BY ae.auftrag_id
+    """)
+
+
+def _material_preis_delta(new_price, old_price, count_sign, part_id):
+    """Änderung der Materialkosten, wenn sich der Einkaufspreis eines Teils ändert oder es gelöscht wird"""
+    return _upsert_sql(f"""
+        SELECT {_year('r.datum')}, {_month('r.datum')}, 'materialkosten', '',
+               ROUND(SUM(ROUND(ae.menge * COALESCE({new_price}, 0), 2)
+                         - ROUND(ae.menge * COALESCE({old_price}, 0), 2)), 2),
+               {count_sign} * COUNT(*)
+        FROM auftrag_ersatzteile ae
+        JOIN rechnungen r ON r.auftrag_id = ae.auftrag_id
+        WHERE ae.ersatzteil_id = {part_id} AND r.datum IS NOT NULL
+        GROUP BY 1, 2
+    """)
+
+
+# Monatswerte ohne zugrunde liegende Datensätze entfernen
+_CLEANUP_SQL = f"DELETE FROM {ROLLUP_TABLE} WHERE anzahl <= 0;"
+
+# (Tabelle, Ereignis, WHEN-Bedingung, Anweisungen)
+ROLLUP_TRIGGERS = (
+    ('rechnungen', 'INSERT', None,
+     [_umsatz_delta('NEW', 1), _material_rechnung_delta('NEW', 1)]),
+    ('rechnungen', 'UPDATE OF datum, gesamtbetrag, bezahlt, auftrag_id', None,
+     [_umsatz_delta('OLD', -1), _umsatz_delta('NEW', 1),
+      _material_rechnung_delta('OLD', -1), _material_rechnung_delta('NEW', 1), _CLEANUP_SQL]),
+    ('rechnungen', 'DELETE', None,
+     [_umsatz_delta('OLD', -1), _material_rechnung_delta('OLD', -1), _CLEANUP_SQL]),
+
+    ('ausgaben', 'INSERT', None, [_ausgaben_delta('NEW', 1)]),
+    ('ausgaben', 'UPDATE OF datum, betrag, kategorie', None,
+     [_ausgaben_delta('OLD', -1), _ausgaben_delta('NEW', 1), _CLEANUP_SQL]),
+    ('ausgaben', 'DELETE', None, [_ausgaben_delta('OLD', -1), _CLEANUP_SQL]),
+
+    ('auftrag_ersatzteile', 'INSERT', None, [_material_position_delta('NEW', 1)]),
+    ('auftrag_ersatzteile', 'UPDATE OF menge, ersatzteil_id, auftrag_id', None,
+     [_material_position_delta('OLD', -1), _material_position_delta('NEW', 1), _CLEANUP_SQL]),
+    ('auftrag_ersatzteile', 'DELETE', None, [_material_position_delta('OLD', -1), _CLEANUP_SQL]),
+
+    ('ersatzteile', 'UPDATE OF einkaufspreis', "OLD.einkaufspreis IS NOT NEW.einkaufspreis",
+     [_material_preis_delta('NEW.einkaufspreis', 'OLD.einkaufspreis', 0, 'NEW.id')]),
+    ('ersatzteile', 'DELETE', None,
+     [_material_preis_delta('0', 'OLD.einkaufspreis', -1, 'OLD.id'), _CLEANUP_SQL]),
+)
+
+
+def create_monthly_rollup(cursor):
+    """Legt die Tabelle der Monatswerte samt Triggern an und berechnet sie aus dem Datenbestand"""
+    cursor.execute(f"""
+    CREATE TABLE IF NOT EXISTS {ROLLUP_TABLE} (
+        jahr INTEGER NOT NULL,
+        monat INTEGER NOT NULL,
+        kennzahl TEXT NOT NULL,
+        kategorie TEXT NOT NULL DEFAULT '',
+        betrag REAL NOT NULL DEFAULT 0,
+        anzahl INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (jahr, monat, kennzahl, kategorie)
+    ) WITHOUT ROWID
+    """)
+
+    for table, event, when, statements in ROLLUP_TRIGGERS:
+        trigger_name = f"{ROLLUP_TABLE}_{table}_{event.split()[0].lower()}"
+        when_clause = f"WHEN {when}" if when else ""
+
+        cursor.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
+        cursor.execute(f"""
+        CREATE TRIGGER {trigger_name} AFTER {event} ON {table}
+        {when_clause}
+        BEGIN
+            {"".join(statements)}
+        END
+        """)
+
+    rebuild_monthly_rollup(cursor)
+
+
+def rebuild_monthly_rollup(cursor):
+    """Berechnet alle Monatswerte neu aus den Basistabellen"""
+    cursor.execute(f"DELETE FROM {ROLLUP_TABLE}")
+
+    cursor.execute(f"""
+    INSERT INTO {ROLLUP_TABLE} (jahr, monat, kennzahl, kategorie, betrag, anzahl)
+    SELECT {_year('datum')}, {_month('datum')}, 'umsatz',
+           CASE WHEN bezahlt = 1 THEN 'bezahlt' ELSE 'offen' END,
+           ROUND(SUM(ROUND(COALESCE(gesamtbetrag, 0), 2)), 2), COUNT(*)
+    FROM rechnungen
+    WHERE datum IS NOT NULL
+    GROUP BY 1, 2, 4
+    """)
+
+    cursor.execute(f"""
+    INSERT INTO {ROLLUP_TABLE} (jahr, monat, kennzahl, kategorie, betrag, anzahl)
+    SELECT {_year('datum')}, {_month('datum')}, 'ausgaben', COALESCE(kategorie, ''),
+           ROUND(SUM(ROUND(COALESCE(betrag, 0), 2)), 2), COUNT(*)
+    FROM ausgaben
+    WHERE datum IS NOT NULL
+    GROUP BY 1, 2, 4
+    """)
+
+    cursor.execute(f"""
+    INSERT INTO {ROLLUP_TABLE} (jahr, monat, kennzahl, kategorie, betrag, anzahl)
+    SELECT {_year('r.datum')}, {_month('r.datum')}, 'materialkosten', '',
+           ROUND(COALESCE(SUM(ROUND(ae.menge * e.einkaufspreis, 2)), 0), 2), COUNT(*)
+    FROM auftrag_ersatzteile ae
+    JOIN ersatzteile e ON ae.ersatzteil_id = e.id
+    JOIN rechnungen r ON r.auftrag_id = ae.auftrag_id
+    WHERE r.datum IS NOT NULL
+    GROUP BY 1, 2
+    """)
+
+
+def is_month_aligned(start, end):
+    """Prüft, ob sich der Zeitraum [start, end) vollständig aus Monatswerten berechnen lässt"""
+    return all(bound is None or bound.day == 1 for bound in (start, end))
+
+
+def _range_condition(start, end, kennzahl, kategorie):
+    conditions = ["kennzahl = ?"]
+    params = [kennzahl]
+
+    if kategorie is not None:
+        conditions.append("kategorie = ?")
+        params.append(kategorie)
+    if start is not None:
+        conditions.append("(jahr, monat) >= (?, ?)")
+        params.extend([start.year, start.month])
+    if end is not None:
+        conditions.append("(jahr, monat) < (?, ?)")
+        params.extend([end.year, end.month])
+
+    return " AND ".join(conditions), params
+
+
+def get_rollup_total(conn, kennzahl, start=None, end=None, kategorie=None):
+    """Summe einer Kennzahl für die Monate im Zeitraum [start, end)"""
+    condition, params = _range_condition(start, end, kennzahl, kategorie)
+
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT COALESCE(SUM(betrag), 0) FROM {ROLLUP_TABLE} WHERE {condition}", params)
+    return round(cursor.fetchone()[0], 2)
+
+
+def get_rollup_series(conn, kennzahl, granularity='month', start=None, end=None, kategorie=None):
+    """Summen einer Kennzahl je Monat, Quartal oder Jahr
+
+    Rückgabe: Liste von (Periode, Betrag), aufsteigend sortiert. Die Periode hat
+    das Format 'JJJJ-MM' (Monat), 'JJJJ-Q' (Quartal) bzw. 'JJJJ' (Jahr).
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Unbekannte Gruppierung: {granularity}")
+
+    period = GRANULARITIES[granularity]
+
+    condition, params = _range_condition(start, end, kennzahl, kategorie)
+
+    cursor = conn.cursor()
+    cursor.execute(f"""
+    SELECT {period} AS periode, SUM(betrag)
+    FROM {ROLLUP_TABLE}
+    WHERE {condition}
+    GROUP BY periode
+    ORDER BY periode
+    """, params)
+
+    return [(periode, round(betrag, 2)) for periode, betrag in cursor.fetchall()]
+
+
+def month_range_start(months, today=None):
+    """Erster Tag des Monats, der (months - 1) Monate vor dem aktuellen liegt"""
+    today = today or date.today()
+    index = today.year * 12 + today.month - 1 - (months - 1)
+    return date(index // 12, index % 12 + 1, 1)
\ No newline at end of file
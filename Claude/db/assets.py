@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Binäre Dateien (Bilder) in der Datenbank
+
+Bilder wie das Firmenlogo werden einmal als BLOB in der Tabelle assets
+abgelegt, adressiert über ihren SHA-256-Hash. Die Konfiguration verweist
+nur noch auf den Hash (z.B. firmenlogo_asset), statt das ganze Bild als
+Base64-Text zu enthalten.
+
+Für die Anzeige werden verkleinerte PNG-Fassungen in asset_thumbnails
+zwischengespeichert (Vorschau im Einstellungsdialog, Rechnungskopf im
+PDF). Sie werden beim Speichern erzeugt oder, falls dabei PIL fehlte, beim
+ersten Abruf nachgerechnet.
+"""
+
+import hashlib
+import sqlite3
+from io import BytesIO
+
+from utils.lazy_imports import pil_image
+
+ASSET_TABLE = "assets"
+THUMBNAIL_TABLE = "asset_thumbnails"
+
+# Vorberechnete Größen: Name -> längste Seite in Pixeln
+THUMBNAIL_SIZES = {
+    'vorschau': 150,
+    'pdf': 400,
+}
+
+# Konfigurationsschlüssel mit dem Hash des Firmenlogos
+LOGO_CONFIG_KEY = 'firmenlogo_asset'
+
+
+def create_asset_tables(cursor):
+    """Legt die Tabellen für Bilder und ihre Vorschaubilder an"""
+    cursor.execute(f"""
+    CREATE TABLE IF NOT EXISTS {ASSET_TABLE} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        sha256 TEXT NOT NULL UNIQUE,
+        mime_type TEXT,
+        breite INTEGER,
+        hoehe INTEGER,
+        daten BLOB NOT NULL,
+        erstellt_am TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+
+    cursor.execute(f"""
+    CREATE TABLE IF NOT EXISTS {THUMBNAIL_TABLE} (
+        asset_id INTEGER NOT NULL,
+        groesse TEXT NOT NULL,
+        breite INTEGER NOT NULL,
+        hoehe INTEGER NOT NULL,
+        daten BLOB NOT NULL,
+        PRIMARY KEY (asset_id, groesse),
+        FOREIGN KEY (asset_id) REFERENCES {ASSET_TABLE} (id) ON DELETE CASCADE
+    )
+    """)
+
+
+def render_thumbnail(data, max_pixels):
+    """Verkleinert ein Bild (Seitenverhältnis bleibt erhalten) und gibt (png, breite, hoehe) zurück"""
+    Image, ImageTk = pil_image()
+    image = Image.open(BytesIO(data))
+    image.load()
+    if image.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+        image = image.convert('RGBA')
+    image.thumbnail((max_pixels, max_pixels), Image.LANCZOS)
+
+    buffer = BytesIO()
+    image.save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue(), image.width, image.height
+
+
+def _image_info(data):
+    """(MIME-Typ, Breite, Hoehe) des Bildes; None-Werte, wenn PIL fehlt"""
+    try:
+        Image, ImageTk = pil_image()
+    except ImportError:
+        return None, None, None
+    image = Image.open(BytesIO(data))
+    return Image.MIME.get(image.format), image.width, image.height
+
+
+def store_asset(conn, data):
+    """Speichert ein Bild und gibt seinen Hash zurück
+
+    Ist das Bild bereits gespeichert, wird nichts geschrieben. Die Vorschaubilder
+    werden direkt erzeugt, sofern PIL verfügbar ist. Läuft in der Transaktion des
+    Aufrufers (kein Commit); ist das Bild nicht lesbar, wird eine Ausnahme ausgelöst.
+    """
+    sha256 = hashlib.sha256(data).hexdigest()
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT id FROM {ASSET_TABLE} WHERE sha256 = ?", (sha256,))
+    if cursor.fetchone():
+        return sha256
+
+    mime_type, breite, hoehe = _image_info(data)
+    cursor.execute(f"""
+    INSERT INTO {ASSET_TABLE} (sha256, mime_type, breite, hoehe, daten)
+    VALUES (?, ?, ?, ?, ?)
+    """, (sha256, mime_type, breite, hoehe, sqlite3.Binary(data)))
+    asset_id = cursor.lastrowid
+
+    if mime_type is not None:
+        for groesse, max_pixels in THUMBNAIL_SIZES.items():
+            png, breite, hoehe = render_thumbnail(data, max_pixels)
+            cursor.execute(f"""
+            INSERT INTO {THUMBNAIL_TABLE} (asset_id, groesse, breite, hoehe, daten)
+            VALUES (?, ?, ?, ?, ?)
+            """, (asset_id, groesse, breite, hoehe, sqlite3.Binary(png)))
+
+    return sha256
+
+
+def get_asset(conn, sha256):
+    """Originaldaten eines Bildes: (mime_type, daten) oder None"""
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT mime_type, daten FROM {ASSET_TABLE} WHERE sha256 = ?", (sha256,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    return row[0], bytes(row[1])
+
+
+def get_thumbnail(conn, sha256, groesse):
+    """Vorschaubild als (png, breite, hoehe) oder None, wenn das Bild fehlt
+
+    Fehlt das Vorschaubild, wird es aus dem Original erzeugt und, sofern die
+    Verbindung schreiben darf, für spätere Aufrufe gespeichert.
+    """
+    if not sha256:
+        return None
+
+    cursor = conn.cursor()
+    cursor.execute(f"""
+    SELECT t.daten, t.breite, t.hoehe
+    FROM {THUMBNAIL_TABLE} t
+    JOIN {ASSET_TABLE} a ON t.asset_id = a.id
+    WHERE a.sha256 = ? AND t.groesse = ?
+    """, (sha256, groesse))
+    row = cursor.fetchone()
+    if row:
+        return bytes(row[0]), row[1], row[2]
+
+    cursor.execute(f"SELECT id, daten FROM {ASSET_TABLE} WHERE sha256 = ?", (sha256,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+
+    asset_id, data = row
+    png, breite, hoehe = render_thumbnail(bytes(data), THUMBNAIL_SIZES[groesse])
+    try:
+        cursor.execute(f"""
+        INSERT OR REPLACE INTO {THUMBNAIL_TABLE} (asset_id, groesse, breite, hoehe, daten)
+        VALUES (?, ?, ?, ?, ?)
+        """, (asset_id, groesse, breite, hoehe, sqlite3.Binary(png)))
+        conn.commit()
+    except sqlite3.Error:
+        # Schreibgeschützte Lese-Verbindung: Vorschaubild nur zurückgeben
+        pass
+    return png, breite, hoehe
+
+
+def delete_unused_assets(conn):
+    """Löscht Bilder, auf die kein Konfigurationswert mehr verweist (kein Commit)"""
+    cursor = conn.cursor()
+    cursor.execute(f"""
+    DELETE FROM {ASSET_TABLE}
+    WHERE sha256 NOT IN (SELECT wert FROM konfiguration WHERE wert IS NOT NULL)
+    """)
+    return cursor.rowcount
\ No newline at end of file
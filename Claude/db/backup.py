@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Online-Datensicherung über die SQLite-Backup-API
+
+Die Sicherung kopiert die Datenbank seitenweise (Connection.backup) über
+eine eigene Lese-Verbindung in einem Hintergrund-Thread. Die Verbindungen
+der Anwendung bleiben offen und nutzbar.
+
+Im WAL-Modus sorgt eine Lesetransaktion auf der Quellverbindung dafür, dass
+alle Schritte denselben Stand kopieren, während weiter gespeichert wird.
+Mit dem Rollback-Journal (Standard, siehe db.database) würde dieselbe
+Transaktion das Speichern aller Arbeitsplätze für die ganze Dauer der Kopie
+sperren; nach dem busy timeout schlägt es dann mit "database is locked"
+fehl. Ohne WAL wird die Sperre daher nur während eines Schritts gehalten;
+speichert eine andere Verbindung zwischen zwei Schritten, beginnt die
+Backup-API die Kopie von vorn, so dass sie trotzdem einen einheitlichen
+Stand enthält.
+
+Geplante Sicherungen werden übersprungen, wenn sich die Datenbank seit der
+letzten Sicherung nicht geändert hat. Ältere Sicherungen werden rotiert,
+so dass nur die neuesten BACKUP_KEEP Dateien erhalten bleiben.
+"""
+
+import glob
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+# Verzeichnis und Dateinamen der Sicherungen
+BACKUP_DIR = 'backups'
+BACKUP_PREFIX = 'autowerkstatt_backup_'
+
+# Anzahl aufbewahrter Sicherungen (0 = unbegrenzt)
+BACKUP_KEEP = 10
+
+# Seiten pro Schritt der Backup-API (Fortschrittsmeldung nach jedem Schritt)
+PAGES_PER_STEP = 256
+
+
+class BackupAborted(Exception):
+    """Die Sicherung wurde abgebrochen (z.B. beim Beenden der Anwendung)"""
+
+
+def new_backup_path(directory=BACKUP_DIR):
+    """Dateiname für eine neue Sicherung mit Zeitstempel"""
+    return os.path.join(directory, f"{BACKUP_PREFIX}{datetime.now().strftime('%Y%m%d_%H%M%S')}.db")
+
+
+def list_backups(directory=BACKUP_DIR):
+    """Vorhandene Sicherungen, älteste zuerst"""
+    # Der Zeitstempel im Namen sortiert chronologisch
+    return sorted(glob.glob(os.path.join(directory, f"{BACKUP_PREFIX}*.db")))
+
+
+def rotate_backups(directory=BACKUP_DIR, keep=BACKUP_KEEP):
+    """Löscht die ältesten Sicherungen und liegen gebliebene Teildateien
+
+    Gibt die gelöschten Pfade zurück.
+    """
+    removed = glob.glob(os.path.join(directory, f"{BACKUP_PREFIX}*.db.part"))
+    if keep:
+        removed.extend(list_backups(directory)[:-keep])
+
+    for path in removed:
+        os.remove(path)
+    return removed
+
+
+def backup_connection(source, backup_path, pages=PAGES_PER_STEP, progress=None):
+    """Kopiert die Datenbank der Verbindung source schrittweise nach backup_path
+
+    progress(status, remaining, total) wird nach jedem Schritt aufgerufen; löst
+    der Callback eine Ausnahme aus, wird die Sicherung abgebrochen. Die Kopie
+    wird zunächst in eine Teildatei geschrieben und erst am Ende umbenannt.
+    """
+    directory = os.path.dirname(backup_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    part_path = backup_path + '.part'
+    if os.path.exists(part_path):
+        os.remove(part_path)
+
+    target = sqlite3.connect(part_path)
+    try:
+        if source.execute("PRAGMA journal_mode").fetchone()[0].lower() == 'wal':
+            # Lesetransaktion öffnen: alle Schritte sehen denselben Stand, Schreibvorgänge
+            # der Anwendung erzwingen keinen Neustart der Kopie
+            source.execute("BEGIN")
+            source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+            try:
+                source.backup(target, pages=pages, progress=progress)
+            finally:
+                source.rollback()
+        else:
+            # Rollback-Journal: zwischen den Schritten keine Sperre halten (siehe Moduldokumentation)
+            source.backup(target, pages=pages, progress=progress)
+    except BaseException:
+        target.close()
+        os.remove(part_path)
+        raise
+
+    # Die Kopie übernimmt den Journal-Modus (evtl. WAL); als eigenständige Einzeldatei ablegen
+    target.execute("PRAGMA journal_mode = DELETE")
+    target.close()
+    os.replace(part_path, backup_path)
+    return backup_path
+
+
+class BackupEngine:
+    """Führt Sicherungen in einem Hintergrund-Thread aus
+
+    Der Zustand (running, progress, result) wird vom Tk-Hauptthread abgefragt;
+    die Engine selbst ruft keine Widgets auf.
+    """
+
+    def __init__(self, db_manager, directory=BACKUP_DIR, keep=BACKUP_KEEP, pages=PAGES_PER_STEP):
+        self.db_manager = db_manager
+        self.directory = directory
+        self.keep = keep
+        self.pages = pages
+
+        # Eigene Lese-Verbindung; PRAGMA data_version erkennt Änderungen seit der letzten Sicherung
+        self._conn = None
+        self._data_version = None
+
+        self._thread = None
+        self._abort = threading.Event()
+
+        # (kopierte Seiten, Seiten gesamt) der laufenden Sicherung
+        self.progress = (0, 0)
+        # Ergebnis der letzten Sicherung: (Pfad oder None wenn übersprungen, Fehler oder None)
+        self.result = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, backup_path=None, only_if_changed=False):
+        """Startet eine Sicherung im Hintergrund
+
+        Gibt False zurück, wenn bereits eine Sicherung läuft. Mit only_if_changed=True
+        (geplante Sicherungen) wird nichts kopiert, wenn seit der letzten Sicherung
+        nichts gespeichert wurde.
+        """
+        if self.running:
+            return False
+
+        self.progress = (0, 0)
+        self.result = None
+        self._abort.clear()
+        self._thread = threading.Thread(target=self._run, args=(backup_path, only_if_changed),
+                                        name="db-backup", daemon=True)
+        self._thread.start()
+        return True
+
+    def close(self):
+        """Bricht eine laufende Sicherung ab und schließt die Lese-Verbindung"""
+        self._abort.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _run(self, backup_path, only_if_changed):
+        try:
+            if self._conn is None:
+                self._conn = self.db_manager.open_reader()
+
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if only_if_changed and data_version == self._data_version:
+                self.result = (None, None)
+                return
+
+            path = backup_connection(self._conn, backup_path or new_backup_path(self.directory),
+                                     self.pages, self._on_progress)
+            self._data_version = data_version
+            rotate_backups(self.directory, self.keep)
+            self.result = (path, None)
+        except Exception as e:
+            self.result = (None, e)
+
+    def _on_progress(self, status, remaining, total):
+        if self._abort.is_set():
+            raise BackupAborted("Datensicherung abgebrochen")
+        self.progress = (total - remaining, total)
\ No newline at end of file
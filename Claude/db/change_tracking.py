@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Änderungsprotokoll (für das gezielte Neuladen der Tabs)
+
+Trigger auf den Stammdaten- und Vorgangstabellen schreiben jede Änderung mit
+Tabelle, Zeilen-ID und Aktion in die Tabelle aenderungsprotokoll. Deren
+Spalte version wächst monoton, unabhängig davon, welcher Arbeitsplatz
+geschrieben hat.
+
+Ein Client merkt sich die zuletzt gesehene Version und fragt nur die
+neueren Einträge ab (changes_since), um gezielt die betroffenen Tabs und
+Zeilen neu zu laden. Ob überhaupt abgefragt werden muss, verrät vorher
+PRAGMA data_version ohne Lesezugriff auf die Tabellen.
+"""
+
+from db.schema import has_table
+
+CHANGE_LOG_TABLE = "aenderungsprotokoll"
+
+# Tabellen, deren Änderungen protokolliert werden
+LOGGED_TABLES = ("kunden", "fahrzeuge", "auftraege", "auftrag_ersatzteile", "ersatzteile",
+                 "rechnungen", "termine", "ausgaben", "todos", "konfiguration")
+
+# Tabellen ohne Spalte id: Ausdruck für die protokollierte Zeilen-ID
+ROW_ID_COLUMNS = {"konfiguration": "rowid"}
+
+# Anzahl Einträge, die beim Aufräumen mindestens erhalten bleiben
+CHANGE_LOG_KEEP = 10000
+
+# Aktionen im Protokoll
+ACTIONS = {"INSERT": "I", "UPDATE": "U", "DELETE": "D"}
+
+
+def create_change_log(cursor):
+    """Legt das Änderungsprotokoll und die Trigger auf den protokollierten Tabellen an"""
+    cursor.execute(f"""
+    CREATE TABLE IF NOT EXISTS {CHANGE_LOG_TABLE} (
+        version INTEGER PRIMARY KEY AUTOINCREMENT,
+        tabelle TEXT NOT NULL,
+        zeilen_id INTEGER,
+        aktion TEXT NOT NULL,
+        zeitpunkt TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+    cursor.execute(f"""
+    CREATE INDEX IF NOT EXISTS idx_{CHANGE_LOG_TABLE}_tabelle
+    ON {CHANGE_LOG_TABLE} (tabelle, version)
+    """)
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    existing = {row[0] for row in cursor.fetchall()}
+
+    for table in LOGGED_TABLES:
+        if table not in existing:
+            continue
+        row_id = ROW_ID_COLUMNS.get(table, "id")
+        for event, aktion in ACTIONS.items():
+            row = "OLD" if event == "DELETE" else "NEW"
+            cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_{event.lower()}_protokoll
+            AFTER {event} ON {table}
+            BEGIN
+                INSERT INTO {CHANGE_LOG_TABLE} (tabelle, zeilen_id, aktion)
+                VALUES ('{table}', {row}.{row_id}, '{aktion}');
+            END
+            """)
+
+
+def prune_change_log(conn, keep=CHANGE_LOG_KEEP):
+    """Löscht alte Protokolleinträge, die letzten keep bleiben erhalten (kein Commit)
+
+    Clients, deren letzte Version danach vor dem ältesten Eintrag liegt,
+    laden beim nächsten Abgleich alles neu (siehe changes_since).
+    """
+    cursor = conn.cursor()
+    cursor.execute(f"""
+    DELETE FROM {CHANGE_LOG_TABLE}
+    WHERE version <= (SELECT MAX(version) FROM {CHANGE_LOG_TABLE}) - ?
+    """, (keep,))
+    return cursor.rowcount
+
+
+def current_change_version(conn):
+    """Neueste Version im Protokoll (0, wenn leer)"""
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT COALESCE(MAX(version), 0) FROM {CHANGE_LOG_TABLE}")
+    return cursor.fetchone()[0]
+
+
+def changes_since(conn, version):
+    """Änderungen nach der angegebenen Version
+
+    Gibt (neue_version, aenderungen) zurück; aenderungen ist
+    {Tabelle: {Zeilen-ID: Aktionen}}, wobei Aktionen die Buchstaben I/U/D in
+    zeitlicher Reihenfolge enthält (z.B. "IU"). Ist die Version bereits aus
+    dem Protokoll gelöscht, ist aenderungen None: der Aufrufer muss alles neu laden.
+    """
+    cursor = conn.cursor()
+    cursor.execute(f"""
+    SELECT version, tabelle, zeilen_id, aktion
+    FROM {CHANGE_LOG_TABLE}
+    WHERE version > ?
+    ORDER BY version
+    """, (version,))
+    rows = cursor.fetchall()
+    if not rows:
+        return version, {}
+
+    # Lücke zwischen der letzten gesehenen Version und dem ältesten Eintrag: aufgeräumt
+    cursor.execute(f"SELECT MIN(version) FROM {CHANGE_LOG_TABLE}")
+    if cursor.fetchone()[0] > version + 1:
+        return rows[-1][0], None
+
+    changes = {}
+    for row_version, table, row_id, aktion in rows:
+        table_changes = changes.setdefault(table, {})
+        table_changes[row_id] = table_changes.get(row_id, "") + aktion
+    return rows[-1][0], changes
+
+
+def table_snapshot(conn, tables):
+    """Liefert einen vergleichbaren Stand der Tabellen
+
+    Zwei Stände sind gleich, wenn zwischen den Aufrufen keine der Tabellen
+    geändert wurde, egal über welche Verbindung. Nicht protokollierte
+    Tabellen werden ignoriert.
+    """
+    cursor = conn.cursor()
+    snapshot = []
+    for table in tables:
+        if table in LOGGED_TABLES and has_table(conn, table):
+            cursor.execute(f"SELECT MAX(version) FROM {CHANGE_LOG_TABLE} WHERE tabelle = ?", (table,))
+            snapshot.append(cursor.fetchone()[0] or 0)
+        else:
+            snapshot.append(0)
+    return tuple(snapshot)
\ No newline at end of file
@@ -1,154 +1,322 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-Datenbankfunktionen für die Autowerkstatt-Anwendung von Gianni Schnyder und Claude
-"""
-
-import os
-import sqlite3
-from datetime import datetime
-
-from db.demo_data import insert_demo_data
-from db.schema_updates import update_database_schema
-
-def create_database():
-    """Datenbank erstellen oder verbinden"""
-    db_path = 'autowerkstatt.db'
-    db_exists = os.path.exists(db_path)
-    
-    conn = sqlite3.connect(db_path)
-    
-    if not db_exists:
-        print("Erstelle neue Datenbank...")
-        cursor = conn.cursor()
-        
-        # Konfiguration Tabelle
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS konfiguration (
-            schluessel TEXT PRIMARY KEY,
-            wert TEXT NOT NULL,
-            beschreibung TEXT
-        )
-        ''')
-        
-        # Kunden Tabelle
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS kunden (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            vorname TEXT NOT NULL,
-            nachname TEXT NOT NULL,
-            telefon TEXT,
-            email TEXT,
-            anschrift TEXT,
-            fahrzeug_typ TEXT,
-            kennzeichen TEXT,
-            fahrgestellnummer TEXT,
-            erstellt_am TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        ''')
-        
-        # Aufträge Tabelle
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS auftraege (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            kunden_id INTEGER,
-            beschreibung TEXT NOT NULL,
-            status TEXT DEFAULT 'Offen',
-            prioritaet TEXT DEFAULT 'Normal',
-            erstellt_am TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            abgeschlossen_am TIMESTAMP,
-            arbeitszeit REAL DEFAULT 0,
-            notizen TEXT,
-            FOREIGN KEY (kunden_id) REFERENCES kunden (id)
-        )
-        ''')
-        
-        # Ersatzteile Tabelle
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS ersatzteile (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            artikelnummer TEXT UNIQUE,
-            bezeichnung TEXT NOT NULL,
-            kategorie TEXT,
-            lagerbestand INTEGER DEFAULT 0,
-            mindestbestand INTEGER DEFAULT 1,
-            einkaufspreis REAL,
-            verkaufspreis REAL,
-            lieferant TEXT,
-            lagerort TEXT,
-            erstellt_am TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        ''')
-        
-        # Aufträge-Ersatzteile Verknüpfungstabelle
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS auftrag_ersatzteile (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            auftrag_id INTEGER,
-            ersatzteil_id INTEGER,
-            menge INTEGER DEFAULT 1,
-            einzelpreis REAL,
-            FOREIGN KEY (auftrag_id) REFERENCES auftraege (id),
-            FOREIGN KEY (ersatzteil_id) REFERENCES ersatzteile (id)
-        )
-        ''')
-        
-        # Rechnungen Tabelle
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS rechnungen (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            auftrag_id INTEGER UNIQUE,
-            rechnungsnummer TEXT UNIQUE,
-            datum TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            gesamtbetrag REAL,
-            bezahlt BOOLEAN DEFAULT 0,
-            bezahlt_am TIMESTAMP,
-            zahlungsart TEXT,
-            notizen TEXT,
-            FOREIGN KEY (auftrag_id) REFERENCES auftraege (id)
-        )
-        ''')
-        
-        # Ausgaben Tabelle für die Finanzen
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS ausgaben (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            kategorie TEXT NOT NULL,
-            betrag REAL NOT NULL,
-            datum TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            beschreibung TEXT,
-            beleg_nr TEXT
-        )
-        ''')
-        
-        # Beispieldaten einfügen
-        insert_demo_data(cursor)
-        
-        conn.commit()
-        print("Datenbank erfolgreich erstellt und mit Beispieldaten gefüllt")
-    else:
-        print(f"Verbinde mit vorhandener Datenbank: {db_path}")
-    
-    # Schema-Updates durchführen (falls nötig)
-    update_database_schema(conn)
-    
-    return conn
-
-def backup_database(conn, backup_path=None):
-    """Sichert die Datenbank"""
-    import shutil
-    
-    if backup_path is None:
-        backup_path = f"autowerkstatt_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
-    
-    # Verbindung schließen, um Datei zu sichern
-    conn.close()
-    
-    # Datei sichern
-    shutil.copy2('autowerkstatt.db', backup_path)
-    
-    # Verbindung wieder herstellen
-    conn = sqlite3.connect('autowerkstatt.db')
-    
-    return conn, backup_path
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Datenbankfunktionen für die Autowerkstatt-Anwendung von Gianni Schnyder und Claude
+
+Journal-Modus: Standard ist das klassische Rollback-Journal (DELETE). Es
+funktioniert auch, wenn mehrere Arbeitsplätze dieselbe autowerkstatt.db auf
+einer Netzwerkfreigabe öffnen, sofern die Freigabe Dateisperren zuverlässig
+unterstützt. Der WAL-Modus ist schneller und lässt Lesen und Schreiben
+parallel zu, benötigt aber gemeinsamen Speicher auf einem einzigen Rechner;
+auf Netzwerkfreigaben werden WAL-Datei, PRAGMA data_version und damit das
+Änderungsprotokoll unzuverlässig, und die Datenbank kann beschädigt werden.
+WAL daher nur einschalten (AUTOMEISTER_JOURNAL_MODE=WAL), wenn alle
+Programme auf demselben Rechner laufen, auf dem die Datei liegt.
+
+Ohne WAL halten lesende Verbindungen während jeder Abfrage eine gemeinsame
+Sperre. Auch Hintergrundabfragen aus dem Lese-Pool (TaskExecutor, Berichte,
+Datensicherung) halten dann das Speichern auf allen Arbeitsplätzen auf, bis
+die jeweilige Abfrage fertig ist. Alle Verbindungen warten deshalb bis zu
+BUSY_TIMEOUT_S Sekunden auf eine Sperre, bevor "database is locked" gemeldet
+wird.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from db.demo_data import insert_demo_data
+from db.profiling import connect
+from db.schema_updates import update_database_schema
+
+# Standardpfad der Datenbankdatei
+DB_PATH = 'autowerkstatt.db'
+
+# Seiten-Cache pro Verbindung in KiB (wird als negativer Wert an PRAGMA cache_size übergeben)
+CACHE_SIZE_KB = 65536
+
+# Größe des Memory-Mappings in Bytes (0 = deaktiviert)
+MMAP_SIZE = 256 * 1024 * 1024
+
+# Maximale Anzahl gleichzeitig geöffneter Lese-Verbindungen
+READ_POOL_SIZE = 3
+
+# Wartezeit auf Sperren anderer Verbindungen und Arbeitsplätze in Sekunden (siehe
+# Moduldokumentation); deckt lange Berichtsabfragen und Sicherungsschritte ab, ohne
+# dass die Oberfläche bei einem hängenden Arbeitsplatz unbegrenzt wartet
+BUSY_TIMEOUT_S = 15.0
+
+# Journal-Modus der Datenbankdatei (siehe Moduldokumentation)
+JOURNAL_MODE = 'DELETE'
+JOURNAL_MODES = ('DELETE', 'TRUNCATE', 'PERSIST', 'WAL')
+
+# Umgebungsvariable zum Umstellen des Journal-Modus
+JOURNAL_MODE_ENV = 'AUTOMEISTER_JOURNAL_MODE'
+
+def journal_mode_from_environment(environ=None):
+    """Journal-Modus aus AUTOMEISTER_JOURNAL_MODE (unbekannte Werte: Standard)"""
+    environ = os.environ if environ is None else environ
+    value = environ.get(JOURNAL_MODE_ENV, "").strip().upper()
+    if not value:
+        return JOURNAL_MODE
+    if value not in JOURNAL_MODES:
+        print(f"Unbekannter Journal-Modus in {JOURNAL_MODE_ENV}: {value} (erlaubt: {', '.join(JOURNAL_MODES)})")
+        return JOURNAL_MODE
+    return value
+
+def configure_connection(conn, cache_size_kb=CACHE_SIZE_KB, mmap_size=MMAP_SIZE, foreign_keys=True):
+    """Setzt die Pragmas, die für jede Verbindung gelten"""
+    cursor = conn.cursor()
+    cursor.execute(f"PRAGMA cache_size = -{int(cache_size_kb)}")
+    cursor.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+    cursor.execute(f"PRAGMA foreign_keys = {'ON' if foreign_keys else 'OFF'}")
+    cursor.execute("PRAGMA temp_store = MEMORY")
+    return conn
+
+class ConnectionManager:
+    """Verwaltet die Schreibverbindung der Anwendung und einen Pool von Lese-Verbindungen
+    
+    Die Schreibverbindung setzt den journal_mode (Standard DELETE mit
+    synchronous=FULL, bei WAL synchronous=NORMAL). Lesende Verbindungen aus dem
+    Pool können auch in Hintergrund-Threads (z.B. für Berichte) verwendet werden;
+    nur im WAL-Modus blockieren sie den Schreiber nicht, sonst wartet das
+    Speichern bis zum Ende der laufenden Leseabfrage (höchstens busy_timeout_s).
+    
+    Mit einem profiler (db.profiling.QueryProfiler) werden alle Verbindungen
+    instrumentiert und ihre Anweisungen gemessen.
+    """
+    def __init__(self, db_path=DB_PATH, cache_size_kb=CACHE_SIZE_KB, mmap_size=MMAP_SIZE,
+                 read_pool_size=READ_POOL_SIZE, foreign_keys=True, profiler=None, journal_mode=JOURNAL_MODE,
+                 busy_timeout_s=BUSY_TIMEOUT_S):
+        self.db_path = db_path
+        self.busy_timeout_s = busy_timeout_s
+        self.journal_mode = journal_mode.upper()
+        self.cache_size_kb = cache_size_kb
+        self.mmap_size = mmap_size
+        self.read_pool_size = read_pool_size
+        self.foreign_keys = foreign_keys
+        self.profiler = profiler
+        
+        self._writer = None
+        self._idle_readers = queue.LifoQueue()
+        self._reader_count = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def writer(self):
+        """Die (einzige) Schreibverbindung, wird beim ersten Zugriff geöffnet"""
+        if self._writer is None:
+            self._writer = self.open_writer()
+        return self._writer
+    
+    def open_writer(self):
+        """Öffnet und konfiguriert die Schreibverbindung"""
+        conn = connect(self.db_path, self.profiler, timeout=self.busy_timeout_s)
+        # Der Wechsel (z.B. von WAL zurück zu DELETE) gelingt nur, wenn kein anderer
+        # Arbeitsplatz die Datei gerade verwendet; sonst bleibt der bisherige Modus aktiv
+        try:
+            mode = conn.execute(f"PRAGMA journal_mode = {self.journal_mode}").fetchone()[0].upper()
+        except sqlite3.OperationalError:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0].upper()
+        if mode != self.journal_mode:
+            print(f"Warnung: Journal-Modus {self.journal_mode} konnte nicht gesetzt werden, aktiv ist {mode}")
+        conn.execute(f"PRAGMA synchronous = {'NORMAL' if mode == 'WAL' else 'FULL'}")
+        return configure_connection(conn, self.cache_size_kb, self.mmap_size, self.foreign_keys)
+    
+    def open_reader(self):
+        """Öffnet eine schreibgeschützte Verbindung, die in beliebigen Threads genutzt werden darf"""
+        uri = f"file:{os.path.abspath(self.db_path)}?mode=ro"
+        conn = connect(uri, self.profiler, uri=True, check_same_thread=False, timeout=self.busy_timeout_s)
+        return configure_connection(conn, self.cache_size_kb, self.mmap_size, self.foreign_keys)
+    
+    def acquire_reader(self, timeout=None):
+        """Holt eine Lese-Verbindung aus dem Pool
+        
+        Sind alle Verbindungen belegt, wird bis zu timeout Sekunden gewartet
+        (None = unbegrenzt). Läuft die Wartezeit ab, wird None zurückgegeben.
+        """
+        try:
+            return self._idle_readers.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            if self._reader_count < self.read_pool_size:
+                self._reader_count += 1
+                open_new = True
+            else:
+                open_new = False
+        
+        if open_new:
+            try:
+                return self.open_reader()
+            except sqlite3.Error:
+                with self._lock:
+                    self._reader_count -= 1
+                raise
+        
+        try:
+            return self._idle_readers.get(timeout=timeout)
+        except queue.Empty:
+            return None
+    
+    def release_reader(self, conn):
+        """Gibt eine Lese-Verbindung an den Pool zurück"""
+        # Eventuell offene Lesetransaktion beenden, damit der Snapshot nicht veraltet
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle_readers.put(conn)
+    
+    @contextmanager
+    def read_connection(self, timeout=None):
+        """Kontextmanager für eine Lese-Verbindung aus dem Pool"""
+        conn = self.acquire_reader(timeout)
+        if conn is None:
+            raise TimeoutError("Keine Lese-Verbindung verfügbar")
+        try:
+            yield conn
+        finally:
+            self.release_reader(conn)
+    
+    def close(self):
+        """Schließt alle Verbindungen"""
+        while True:
+            try:
+                self._idle_readers.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._lock:
+            self._reader_count = 0
+        
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+def create_database(db_manager=None):
+    """Datenbank erstellen oder verbinden"""
+    if db_manager is None:
+        db_manager = ConnectionManager()
+    
+    db_path = db_manager.db_path
+    db_exists = os.path.exists(db_path)
+    
+    conn = db_manager.writer
+    
+    if not db_exists:
+        print("Erstelle neue Datenbank...")
+        cursor = conn.cursor()
+        
+        # Konfiguration Tabelle
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS konfiguration (
+            schluessel TEXT PRIMARY KEY,
+            wert TEXT NOT NULL,
+            beschreibung TEXT
+        )
+        ''')
+        
+        # Kunden Tabelle
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS kunden (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            vorname TEXT NOT NULL,
+            nachname TEXT NOT NULL,
+            telefon TEXT,
+            email TEXT,
+            anschrift TEXT,
+            fahrzeug_typ TEXT,
+            kennzeichen TEXT,
+            fahrgestellnummer TEXT,
+            erstellt_am TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
+        
+        # Aufträge Tabelle
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS auftraege (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kunden_id INTEGER,
+            beschreibung TEXT NOT NULL,
+            status TEXT DEFAULT 'Offen',
+            prioritaet TEXT DEFAULT 'Normal',
+            erstellt_am TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            abgeschlossen_am TIMESTAMP,
+            arbeitszeit REAL DEFAULT 0,
+            notizen TEXT,
+            FOREIGN KEY (kunden_id) REFERENCES kunden (id)
+        )
+        ''')
+        
+        # Ersatzteile Tabelle
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS ersatzteile (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            artikelnummer TEXT UNIQUE,
+            bezeichnung TEXT NOT NULL,
+            kategorie TEXT,
+            lagerbestand INTEGER DEFAULT 0,
+            mindestbestand INTEGER DEFAULT 1,
+            einkaufspreis REAL,
+            verkaufspreis REAL,
+            lieferant TEXT,
+            lagerort TEXT,
+            erstellt_am TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
+        
+        # Aufträge-Ersatzteile Verknüpfungstabelle
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS auftrag_ersatzteile (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            auftrag_id INTEGER,
+            ersatzteil_id INTEGER,
+            menge INTEGER DEFAULT 1,
+            einzelpreis REAL,
+            FOREIGN KEY (auftrag_id) REFERENCES auftraege (id),
+            FOREIGN KEY (ersatzteil_id) REFERENCES ersatzteile (id)
+        )
+        ''')
+        
+        # Rechnungen Tabelle
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS rechnungen (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            auftrag_id INTEGER UNIQUE,
+            rechnungsnummer TEXT UNIQUE,
+            datum TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            gesamtbetrag REAL,
+            bezahlt BOOLEAN DEFAULT 0,
+            bezahlt_am TIMESTAMP,
+            zahlungsart TEXT,
+            notizen TEXT,
+            FOREIGN KEY (auftrag_id) REFERENCES auftraege (id)
+        )
+        ''')
+        
+        # Ausgaben Tabelle für die Finanzen
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS ausgaben (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kategorie TEXT NOT NULL,
+            betrag REAL NOT NULL,
+            datum TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            beschreibung TEXT,
+            beleg_nr TEXT
+        )
+        ''')
+        
+        # Beispieldaten einfügen
+        insert_demo_data(cursor)
+        
+        conn.commit()
+        print("Datenbank erfolgreich erstellt und mit Beispieldaten gefüllt")
+    else:
+        print(f"Verbinde mit vorhandener Datenbank: {db_path}")
+    
+    # Schema-Updates durchführen (falls nötig)
+    update_database_schema(conn)
+    
+    return conn
\ No newline at end of file
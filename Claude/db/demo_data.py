@@ -1,59 +1,376 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-Beispieldaten für die Autowerkstatt-Anwendung
-"""
-
-from datetime import datetime
-
-def insert_demo_data(cursor):
-    """Beispieldaten für die App einfügen"""
-    # Beispielkunden
-    kunden = [
-        ('Max', 'Mustermann', '0123456789', 'max@example.com', 'Musterstraße 1, 12345 Stadt', 'VW Golf', 'AB-CD 123', 'WVWZZZ1KZAP047685', datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
-        ('Anna', 'Schmidt', '0987654321', 'anna@example.com', 'Hauptstraße 5, 54321 Dorf', 'BMW 3er', 'EF-GH 456', 'WBAPK7C59AA123456', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
-    ]
-    
-    cursor.executemany('INSERT INTO kunden (vorname, nachname, telefon, email, anschrift, fahrzeug_typ, kennzeichen, fahrgestellnummer, erstellt_am) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', kunden)
-    
-    # Beispielersatzteile
-    ersatzteile = [
-        ('OEL-5W40-1L', 'Motoröl 5W-40 1L', 'Öle', 15, 5, 9.99, 19.99, 'AutoTeile GmbH', 'Regal A1', datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
-        ('FILT-OEL-001', 'Ölfilter Standard', 'Filter', 8, 3, 4.50, 12.99, 'FilterMax KG', 'Regal B2', datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
-        ('BREMS-001', 'Bremsbeläge vorne', 'Bremsen', 4, 2, 25.00, 65.00, 'BremsenPro', 'Regal C3', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
-    ]
-    
-    cursor.executemany('INSERT INTO ersatzteile (artikelnummer, bezeichnung, kategorie, lagerbestand, mindestbestand, einkaufspreis, verkaufspreis, lieferant, lagerort, erstellt_am) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', ersatzteile)
-    
-    # Beispielaufträge
-    auftraege = [
-        (1, 'Ölwechsel und Inspektion', 'Abgeschlossen', 'Normal', datetime.now().strftime('%Y-%m-%d %H:%M:%S'), datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 1.5, 'Kunde wünscht Anruf nach Fertigstellung'),
-        (2, 'Bremsen prüfen und ggf. erneuern', 'In Bearbeitung', 'Hoch', datetime.now().strftime('%Y-%m-%d %H:%M:%S'), None, 0, 'Bremsen quietschen bei starkem Bremsen')
-    ]
-    
-    cursor.executemany('INSERT INTO auftraege (kunden_id, beschreibung, status, prioritaet, erstellt_am, abgeschlossen_am, arbeitszeit, notizen) VALUES (?, ?, ?, ?, ?, ?, ?, ?)', auftraege)
-    
-    # Verknüpfung Auftrag-Ersatzteile
-    auftrag_ersatzteile = [
-        (1, 1, 1, 19.99),
-        (1, 2, 1, 12.99)
-    ]
-    
-    cursor.executemany('INSERT INTO auftrag_ersatzteile (auftrag_id, ersatzteil_id, menge, einzelpreis) VALUES (?, ?, ?, ?)', auftrag_ersatzteile)
-    
-    # Beispielrechnung
-    rechnungen = [
-        (1, 'RE-2023-001', datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 82.98, 1, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'Bar', '')
-    ]
-    
-    cursor.executemany('INSERT INTO rechnungen (auftrag_id, rechnungsnummer, datum, gesamtbetrag, bezahlt, bezahlt_am, zahlungsart, notizen) VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rechnungen)
-    
-    # Beispielausgaben
-    ausgaben = [
-        ('Einkauf Ersatzteile', 250.00, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'Großbestellung Filter und Öl', 'BE-2023-01'),
-        ('Miete', 800.00, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'Werkstattmiete März', 'BE-2023-02'),
-        ('Versicherung', 120.00, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'Haftpflichtversicherung Q1', 'BE-2023-03')
-    ]
-    
-    cursor.executemany('INSERT INTO ausgaben (kategorie, betrag, datum, beschreibung, beleg_nr) VALUES (?, ?, ?, ?, ?)', ausgaben)
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Beispieldaten für die Autowerkstatt-Anwendung
+"""
+
+import random
+from datetime import datetime, timedelta
+
+from db.invoice_numbers import SEQUENCE_TABLE, format_rechnungsnummer, register_rechnungsnummer
+from db.change_tracking import prune_change_log
+from utils.config import get_default_stundenlohn, get_config_float
+
+def insert_demo_data(cursor):
+    """Beispieldaten für die App einfügen"""
+    # Beispielkunden
+    kunden = [
+        ('Max', 'Mustermann', '0123456789', 'max@example.com', 'Musterstraße 1, 12345 Stadt', 'VW Golf', 'AB-CD 123', 'WVWZZZ1KZAP047685', datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+        ('Anna', 'Schmidt', '0987654321', 'anna@example.com', 'Hauptstraße 5, 54321 Dorf', 'BMW 3er', 'EF-GH 456', 'WBAPK7C59AA123456', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    ]
+    
+    cursor.executemany('INSERT INTO kunden (vorname, nachname, telefon, email, anschrift, fahrzeug_typ, kennzeichen, fahrgestellnummer, erstellt_am) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', kunden)
+    
+    # Beispielersatzteile
+    ersatzteile = [
+        ('OEL-5W40-1L', 'Motoröl 5W-40 1L', 'Öle', 15, 5, 9.99, 19.99, 'AutoTeile GmbH', 'Regal A1', datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+        ('FILT-OEL-001', 'Ölfilter Standard', 'Filter', 8, 3, 4.50, 12.99, 'FilterMax KG', 'Regal B2', datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+        ('BREMS-001', 'Bremsbeläge vorne', 'Bremsen', 4, 2, 25.00, 65.00, 'BremsenPro', 'Regal C3', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    ]
+    
+    cursor.executemany('INSERT INTO ersatzteile (artikelnummer, bezeichnung, kategorie, lagerbestand, mindestbestand, einkaufspreis, verkaufspreis, lieferant, lagerort, erstellt_am) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', ersatzteile)
+    
+    # Beispielaufträge
+    auftraege = [
+        (1, 'Ölwechsel und Inspektion', 'Abgeschlossen', 'Normal', datetime.now().strftime('%Y-%m-%d %H:%M:%S'), datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 1.5, 'Kunde wünscht Anruf nach Fertigstellung'),
+        (2, 'Bremsen prüfen und ggf. erneuern', 'In Bearbeitung', 'Hoch', datetime.now().strftime('%Y-%m-%d %H:%M:%S'), None, 0, 'Bremsen quietschen bei starkem Bremsen')
+    ]
+    
+    cursor.executemany('INSERT INTO auftraege (kunden_id, beschreibung, status, prioritaet, erstellt_am, abgeschlossen_am, arbeitszeit, notizen) VALUES (?, ?, ?, ?, ?, ?, ?, ?)', auftraege)
+    
+    # Verknüpfung Auftrag-Ersatzteile
+    auftrag_ersatzteile = [
+        (1, 1, 1, 19.99),
+        (1, 2, 1, 12.99)
+    ]
+    
+    cursor.executemany('INSERT INTO auftrag_ersatzteile (auftrag_id, ersatzteil_id, menge, einzelpreis) VALUES (?, ?, ?, ?)', auftrag_ersatzteile)
+    
+    # Beispielrechnung
+    rechnungen = [
+        (1, 'RE-2023-001', datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 82.98, 1, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'Bar', '')
+    ]
+    
+    cursor.executemany('INSERT INTO rechnungen (auftrag_id, rechnungsnummer, datum, gesamtbetrag, bezahlt, bezahlt_am, zahlungsart, notizen) VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rechnungen)
+    
+    # Beispielausgaben
+    ausgaben = [
+        ('Einkauf Ersatzteile', 250.00, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'Großbestellung Filter und Öl', 'BE-2023-01'),
+        ('Miete', 800.00, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'Werkstattmiete März', 'BE-2023-02'),
+        ('Versicherung', 120.00, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'Haftpflichtversicherung Q1', 'BE-2023-03')
+    ]
+    
+    cursor.executemany('INSERT INTO ausgaben (kategorie, betrag, datum, beschreibung, beleg_nr) VALUES (?, ?, ?, ?, ?)', ausgaben)
+
+# ---------------------------------------------------------------------------
+# Synthetische Werkstatt-Historie (Lasttests, Benchmarks)
+# ---------------------------------------------------------------------------
+
+VORNAMEN = ("Max", "Anna", "Peter", "Laura", "Thomas", "Sarah", "Daniel", "Nicole", "Marco", "Sandra",
+            "Luca", "Lea", "Reto", "Monika", "Stefan", "Andrea", "Beat", "Claudia", "Urs", "Julia")
+NACHNAMEN = ("Müller", "Meier", "Schmid", "Keller", "Weber", "Huber", "Schneider", "Meyer", "Steiner",
+             "Fischer", "Gerber", "Brunner", "Baumann", "Frei", "Zimmermann", "Moser", "Widmer", "Wyss")
+ORTE = ("8000 Zürich", "3000 Bern", "4000 Basel", "6000 Luzern", "9000 St. Gallen", "8400 Winterthur",
+        "5000 Aarau", "7000 Chur", "8500 Frauenfeld", "6300 Zug")
+STRASSEN = ("Bahnhofstrasse", "Hauptstrasse", "Dorfstrasse", "Seestrasse", "Industriestrasse", "Kirchweg")
+KANTONE = ("ZH", "BE", "BS", "LU", "SG", "AG", "GR", "TG", "ZG")
+FAHRZEUGTYPEN = ("VW Golf", "VW Passat", "BMW 3er", "Audi A4", "Skoda Octavia", "Toyota Corolla",
+                 "Ford Focus", "Opel Astra", "Mercedes C-Klasse", "Renault Clio", "Tesla Model 3")
+ZAHLUNGSARTEN = ("Bar", "Überweisung", "EC-Karte", "Kreditkarte", "Twint")
+
+# Teilekatalog: Kategorie -> (Bezeichnungen, Einkaufspreis von/bis, Aufschlag, Einheit)
+TEILEKATALOG = {
+    "Öle": (("Motoröl 5W-30", "Motoröl 5W-40", "Motoröl 0W-20", "Getriebeöl 75W-90"), (6, 14), 2.0, "Liter"),
+    "Filter": (("Ölfilter", "Luftfilter", "Innenraumfilter", "Kraftstofffilter"), (4, 25), 2.2, "Stk."),
+    "Bremsen": (("Bremsbeläge vorne", "Bremsbeläge hinten", "Bremsscheibe", "Bremsflüssigkeit 1L"), (8, 90), 1.8, "Stk."),
+    "Zündung": (("Zündkerze", "Zündspule", "Glühkerze"), (5, 60), 2.0, "Stk."),
+    "Motor": (("Zahnriemensatz", "Wasserpumpe", "Keilrippenriemen", "Thermostat"), (20, 250), 1.6, "Stk."),
+    "Elektrik": (("Batterie 60Ah", "Batterie 74Ah", "Glühlampe H7", "Sicherungssatz"), (3, 180), 1.7, "Stk."),
+    "Auspuff": (("Endschalldämpfer", "Mittelschalldämpfer", "Auspuffschelle"), (5, 220), 1.6, "Stk."),
+    "Klima": (("Kältemittel R1234yf 100g", "Klimafilter", "Klimareiniger"), (6, 40), 2.0, "Stk."),
+    "Reifen": (("Sommerreifen 205/55 R16", "Winterreifen 205/55 R16", "Ventil"), (2, 140), 1.4, "Stk."),
+}
+HERSTELLER = ("Bosch", "Mann", "Mahle", "Febi", "ATE", "Brembo", "NGK", "Varta", "Castrol", "Continental")
+LIEFERANTEN = ("AutoTeile AG", "Technomag", "Derendinger", "ESA", "FilterMax GmbH")
+
+# Auftragsarten: (Beschreibung, Arbeitszeit von/bis in h, [(Kategorie, Menge von/bis), ...], Gewicht)
+AUFTRAGSARTEN = (
+    ("Ölwechsel", (0.5, 1.0), [("Öle", (4, 6)), ("Filter", (1, 1))], 30),
+    ("Inspektion", (1.5, 3.0), [("Öle", (4, 6)), ("Filter", (2, 3)), ("Zündung", (0, 4))], 20),
+    ("Bremsen erneuern", (1.0, 2.5), [("Bremsen", (2, 4))], 15),
+    ("Reifenwechsel", (0.5, 1.0), [("Reifen", (0, 4))], 15),
+    ("Zahnriemen wechseln", (3.0, 5.0), [("Motor", (1, 2))], 5),
+    ("Batterie ersetzen", (0.3, 0.8), [("Elektrik", (1, 1))], 5),
+    ("Auspuff reparieren", (1.0, 2.0), [("Auspuff", (1, 2))], 5),
+    ("Klimaservice", (0.5, 1.5), [("Klima", (1, 2))], 5),
+)
+
+# Monatliche Fixkosten: (Kategorie, Betrag von/bis)
+FIXKOSTEN = (("Miete", (2400, 2400)), ("Versicherung", (300, 450)), ("Strom", (250, 600)))
+AUSGABEN_KATEGORIEN = (("Einkauf Ersatzteile", (200, 4000)), ("Werkzeug", (50, 1500)),
+                       ("Fahrzeugkosten", (80, 900)), ("Büromaterial", (20, 300)))
+
+TODO_TEXTE = ("Hebebühne prüfen lassen", "Altöl abholen lassen", "Reifenlager aufräumen",
+              "Werkzeugwagen nachbestellen", "Kundenumfrage auswerten")
+
+# Anzahl Aufträge pro executemany-Block (begrenzt den Speicherbedarf bei großen Mengen)
+GENERATOR_CHUNK = 10000
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _next_id(cursor, table):
+    cursor.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}")
+    return cursor.fetchone()[0]
+
+
+def _build_catalog(rng, anzahl):
+    """Erzeugt anzahl Ersatzteile reihum über alle Kategorien"""
+    teile = []
+    kategorien = list(TEILEKATALOG.items())
+    for i in range(anzahl):
+        kategorie, (bezeichnungen, (ek_von, ek_bis), aufschlag, einheit) = kategorien[i % len(kategorien)]
+        bezeichnung = bezeichnungen[(i // len(kategorien)) % len(bezeichnungen)]
+        einkaufspreis = round(rng.uniform(ek_von, ek_bis), 2)
+        teile.append((kategorie, f"{bezeichnung} {rng.choice(HERSTELLER)}", einkaufspreis,
+                      round(einkaufspreis * aufschlag, 2), einheit))
+    return teile
+
+
+def generate_workshop_data(conn, auftraege=1000, jahre=10, seed=42, progress=None):
+    """Erzeugt die Historie einer großen Werkstatt über mehrere Jahre
+
+    Die Mengen richten sich nach der Anzahl Aufträge: etwa ein Kunde je fünf
+    Aufträge, 1-2 Fahrzeuge je Kunde, Teilepositionen je nach Auftragsart
+    (Ölwechsel, Bremsen, Inspektion, ...), Rechnungen für abgeschlossene
+    Aufträge, Fixkosten und Einkäufe als Ausgaben, Termine und
+    Lagerbewegungen. Mit demselben seed entstehen dieselben Daten.
+
+    Alle Zeilen werden blockweise mit executemany in einer einzigen
+    Transaktion geschrieben (die Trigger für Volltextsuche, Monatswerte und
+    Änderungsprotokoll laufen dabei mit). progress(erledigt, gesamt) wird
+    nach jedem Block aufgerufen. Gibt {Tabelle: Anzahl Zeilen} zurück.
+    """
+    rng = random.Random(seed)
+    cursor = conn.cursor()
+    stundensatz = get_default_stundenlohn(conn)
+    mwst_satz = get_config_float(conn, 'mwst_satz', 7.7)
+
+    ende = datetime.now().replace(microsecond=0)
+    start = ende - timedelta(days=365 * jahre)
+    spanne = int((ende - start).total_seconds())
+
+    anzahl_kunden = max(10, auftraege // 5)
+    anzahl_teile = min(2000, max(30, auftraege // 50))
+    counts = dict.fromkeys(("kunden", "fahrzeuge", "ersatzteile", "auftraege", "auftrag_ersatzteile",
+                            "rechnungen", "ausgaben", "termine", "bestandsaenderungen", "todos"), 0)
+
+    if not conn.in_transaction:
+        cursor.execute("BEGIN IMMEDIATE")
+    try:
+        # Kunden und ihre Fahrzeuge
+        kunden_start = _next_id(cursor, "kunden")
+        fahrzeug_id = _next_id(cursor, "fahrzeuge")
+        kunden, fahrzeuge, fahrzeuge_je_kunde = [], [], {}
+        for i in range(anzahl_kunden):
+            kunden_id = kunden_start + i
+            vorname, nachname = rng.choice(VORNAMEN), rng.choice(NACHNAMEN)
+            erstellt = start + timedelta(seconds=rng.randrange(spanne))
+            kunden.append((kunden_id, vorname, nachname, f"07{rng.randrange(6, 10)} {rng.randrange(1000000, 9999999)}",
+                           f"{vorname.lower()}.{nachname.lower()}{i}@example.com",
+                           f"{rng.choice(STRASSEN)} {rng.randrange(1, 120)}, {rng.choice(ORTE)}",
+                           erstellt.strftime(TIMESTAMP_FORMAT)))
+            fahrzeuge_je_kunde[kunden_id] = []
+            for _ in range(1 if rng.random() < 0.7 else 2):
+                fahrzeuge.append((fahrzeug_id, kunden_id, rng.choice(FAHRZEUGTYPEN),
+                                  f"{rng.choice(KANTONE)} {rng.randrange(10000, 999999)}",
+                                  ''.join(rng.choice("ABCDEFGHJKLMNPRSTUVWXYZ0123456789") for _ in range(17)),
+                                  erstellt.strftime(TIMESTAMP_FORMAT)))
+                fahrzeuge_je_kunde[kunden_id].append(fahrzeug_id)
+                fahrzeug_id += 1
+
+        cursor.executemany("""
+        INSERT INTO kunden (id, vorname, nachname, telefon, email, anschrift, erstellt_am)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, kunden)
+        cursor.executemany("""
+        INSERT INTO fahrzeuge (id, kunden_id, fahrzeug_typ, kennzeichen, fahrgestellnummer, erstellt_am)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """, fahrzeuge)
+        counts["kunden"], counts["fahrzeuge"] = len(kunden), len(fahrzeuge)
+        kunden_ids = list(fahrzeuge_je_kunde)
+        del kunden, fahrzeuge
+
+        # Teilekatalog
+        teile_start = _next_id(cursor, "ersatzteile")
+        katalog = _build_catalog(rng, anzahl_teile)
+        teile_je_kategorie = {}
+        teile = []
+        for i, (kategorie, bezeichnung, einkaufspreis, verkaufspreis, einheit) in enumerate(katalog):
+            teil_id = teile_start + i
+            teile_je_kategorie.setdefault(kategorie, []).append((teil_id, verkaufspreis))
+            mindestbestand = rng.randrange(2, 10)
+            teile.append((teil_id, f"GEN-{teil_id:06d}", bezeichnung, kategorie, rng.randrange(0, 60), mindestbestand,
+                          einkaufspreis, verkaufspreis, rng.choice(LIEFERANTEN),
+                          f"Regal {chr(65 + i % 8)}{i % 20 + 1}", einheit, start.strftime(TIMESTAMP_FORMAT)))
+        cursor.executemany("""
+        INSERT INTO ersatzteile (id, artikelnummer, bezeichnung, kategorie, lagerbestand, mindestbestand,
+                                 einkaufspreis, verkaufspreis, lieferant, lagerort, einheit, erstellt_am)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, teile)
+        counts["ersatzteile"] = len(teile)
+        teil_ids = [teil[0] for teil in teile]
+        del teile
+
+        # Aufträge mit Positionen und Rechnungen, blockweise
+        auftrag_id = _next_id(cursor, "auftraege")
+        rechnung_id = _next_id(cursor, "rechnungen")
+        arten = [art[:3] for art in AUFTRAGSARTEN]
+        gewichte = [art[3] for art in AUFTRAGSARTEN]
+        auftrag_ids = []
+
+        # Rechnungsnummern je Jahr hinter den bereits vergebenen fortsetzen
+        cursor.execute(f"SELECT jahr, letzte_nummer FROM {SEQUENCE_TABLE}")
+        nummern = dict(cursor.fetchall())
+
+        for block_start in range(0, auftraege, GENERATOR_CHUNK):
+            block = min(GENERATOR_CHUNK, auftraege - block_start)
+            auftrag_rows, positionen, rechnungen = [], [], []
+
+            for i in range(block):
+                # Gleichmäßig über den Zeitraum verteilt, damit die IDs chronologisch bleiben
+                erstellt = start + timedelta(seconds=spanne * (block_start + i) // auftraege + rng.randrange(3600))
+                alter_tage = (ende - erstellt).days
+                beschreibung, (az_von, az_bis), teilemix = rng.choices(arten, gewichte)[0]
+                arbeitszeit = round(rng.uniform(az_von, az_bis) * 4) / 4
+                kunden_id = rng.choice(kunden_ids)
+
+                if alter_tage > 30 or rng.random() < 0.4:
+                    status = "Abgeschlossen"
+                else:
+                    status = rng.choice(("Offen", "In Bearbeitung", "Warten auf Teile"))
+                abgeschlossen = erstellt + timedelta(hours=rng.randrange(2, 96)) if status == "Abgeschlossen" else None
+                if abgeschlossen is not None and abgeschlossen > ende:
+                    abgeschlossen = ende
+
+                auftrag_rows.append((auftrag_id, kunden_id, beschreibung, status,
+                                     rng.choices(("Niedrig", "Normal", "Hoch", "Dringend"), (10, 70, 15, 5))[0],
+                                     erstellt.strftime(TIMESTAMP_FORMAT),
+                                     abgeschlossen.strftime(TIMESTAMP_FORMAT) if abgeschlossen else None,
+                                     arbeitszeit, None, rng.choice(fahrzeuge_je_kunde[kunden_id])))
+                auftrag_ids.append(auftrag_id)
+
+                netto = arbeitszeit * stundensatz
+                for kategorie, (menge_von, menge_bis) in teilemix:
+                    menge = rng.randint(menge_von, menge_bis)
+                    if menge == 0 or kategorie not in teile_je_kategorie:
+                        continue
+                    teil_id, preis = rng.choice(teile_je_kategorie[kategorie])
+                    rabatt = rng.choice((0, 0, 0, 5, 10))
+                    positionen.append((auftrag_id, teil_id, menge, preis, rabatt))
+                    netto += menge * preis * (1 - rabatt / 100)
+
+                if abgeschlossen is not None:
+                    jahr = abgeschlossen.year
+                    nummern[jahr] = nummern.get(jahr, 0) + 1
+                    bezahlt = (ende - abgeschlossen).days > 45 or rng.random() < 0.5
+                    bezahlt_am = abgeschlossen + timedelta(days=rng.randrange(0, 30)) if bezahlt else None
+                    if bezahlt_am is not None and bezahlt_am > ende:
+                        bezahlt_am = ende
+                    rechnungen.append((rechnung_id, auftrag_id, format_rechnungsnummer(jahr, nummern[jahr]),
+                                       abgeschlossen.strftime(TIMESTAMP_FORMAT),
+                                       round(netto * (1 + mwst_satz / 100), 2), 1 if bezahlt else 0,
+                                       bezahlt_am.strftime(TIMESTAMP_FORMAT) if bezahlt_am else None,
+                                       rng.choice(ZAHLUNGSARTEN) if bezahlt else None, 0))
+                    rechnung_id += 1
+
+                auftrag_id += 1
+
+            cursor.executemany("""
+            INSERT INTO auftraege (id, kunden_id, beschreibung, status, prioritaet, erstellt_am,
+                                   abgeschlossen_am, arbeitszeit, notizen, fahrzeug_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, auftrag_rows)
+            cursor.executemany("""
+            INSERT INTO auftrag_ersatzteile (auftrag_id, ersatzteil_id, menge, einzelpreis, rabatt)
+            VALUES (?, ?, ?, ?, ?)
+            """, positionen)
+            cursor.executemany("""
+            INSERT INTO rechnungen (id, auftrag_id, rechnungsnummer, datum, gesamtbetrag, bezahlt,
+                                    bezahlt_am, zahlungsart, rabatt_prozent)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rechnungen)
+            counts["auftraege"] += len(auftrag_rows)
+            counts["auftrag_ersatzteile"] += len(positionen)
+            counts["rechnungen"] += len(rechnungen)
+
+            if progress:
+                progress(block_start + block, auftraege)
+
+        # Nummernfolge hinter die erzeugten Rechnungsnummern setzen
+        for jahr, nummer in nummern.items():
+            register_rechnungsnummer(conn, format_rechnungsnummer(jahr, nummer))
+
+        # Ausgaben: Fixkosten je Monat und Einkäufe
+        ausgaben = []
+        monat = start.replace(day=1, hour=0, minute=0, second=0)
+        while monat <= ende:
+            for kategorie, (von, bis) in FIXKOSTEN:
+                ausgaben.append((kategorie, round(rng.uniform(von, bis), 2), monat.strftime(TIMESTAMP_FORMAT),
+                                 f"{kategorie} {monat.strftime('%m/%Y')}", None))
+            monat = (monat + timedelta(days=32)).replace(day=1)
+        for i in range(auftraege // 8):
+            kategorie, (von, bis) = rng.choice(AUSGABEN_KATEGORIEN)
+            datum = start + timedelta(seconds=rng.randrange(spanne))
+            ausgaben.append((kategorie, round(rng.uniform(von, bis), 2), datum.strftime(TIMESTAMP_FORMAT),
+                             kategorie, f"BE-{datum.year}-{i + 1:05d}"))
+        cursor.executemany("""
+        INSERT INTO ausgaben (kategorie, betrag, datum, beschreibung, beleg_nr)
+        VALUES (?, ?, ?, ?, ?)
+        """, ausgaben)
+        counts["ausgaben"] = len(ausgaben)
+        del ausgaben
+
+        # Termine, auch einige Wochen in die Zukunft
+        termine = []
+        for _ in range(auftraege // 3):
+            tag = start + timedelta(days=rng.randrange((ende - start).days + 60))
+            stunde = rng.randrange(7, 17)
+            kunden_id = rng.choice(kunden_ids)
+            termine.append((rng.choice([art[0] for art in AUFTRAGSARTEN]), tag.strftime('%Y-%m-%d'),
+                            f"{stunde:02d}:00", f"{stunde + 1:02d}:00", kunden_id,
+                            rng.choice(auftrag_ids) if auftrag_ids and rng.random() < 0.5 else None,
+                            "Erledigt" if tag < ende else "Geplant"))
+        cursor.executemany("""
+        INSERT INTO termine (titel, datum, uhrzeit_von, uhrzeit_bis, kunde_id, auftrag_id, status)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, termine)
+        counts["termine"] = len(termine)
+        del termine
+
+        # Lagerbewegungen (Zugänge und Entnahmen)
+        bewegungen = []
+        for _ in range(auftraege // 2):
+            zeitpunkt = start + timedelta(seconds=rng.randrange(spanne))
+            menge = rng.randrange(5, 50) if rng.random() < 0.3 else -rng.randrange(1, 6)
+            bewegungen.append((rng.choice(teil_ids), menge, zeitpunkt.strftime(TIMESTAMP_FORMAT)))
+        cursor.executemany("""
+        INSERT INTO bestandsaenderungen (ersatzteil_id, menge, zeitpunkt)
+        VALUES (?, ?, ?)
+        """, bewegungen)
+        counts["bestandsaenderungen"] = len(bewegungen)
+        del bewegungen
+
+        todos = [(text, rng.randrange(2)) for text in TODO_TEXTE]
+        cursor.executemany("INSERT INTO todos (text, erledigt) VALUES (?, ?)", todos)
+        counts["todos"] = len(todos)
+
+        # Die erzeugten Zeilen müssen nicht einzeln im Änderungsprotokoll stehen
+        prune_change_log(conn)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    return counts
\ No newline at end of file
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Finanzübersicht (Kennzahlen und Monatsverlauf)
+
+Berechnet die Kennzahlen für Finanzen-Tab, Dashboard und Finanzbericht mit
+bedingter Aggregation über die Monatswerte (finanz_monatswerte): eine
+Abfrage für alle Kennzahlen, eine für den Monatsverlauf. Nur Zeiträume,
+die angebrochene Monate enthalten, werden aus den Basistabellen berechnet.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import List, Optional
+
+from db.aggregates import ROLLUP_TABLE, is_month_aligned, month_range_start
+from utils.periods import resolve_period, range_condition
+
+# Anzahl Monate im Verlauf (Diagramme)
+CHART_MONTHS = 6
+
+
+@dataclass
+class MonatsWerte:
+    """Summen eines Monats"""
+    jahr: int
+    monat: int
+    umsatz: float = 0.0
+    einnahmen: float = 0.0
+    ausgaben: float = 0.0
+
+    @property
+    def label(self):
+        """Bezeichnung im Format MM/JJJJ"""
+        return f"{self.monat:02d}/{self.jahr}"
+
+
+@dataclass
+class FinanzUebersicht:
+    """Kennzahlen für den Zeitraum [start, ende) und Verlauf der letzten Monate
+
+    umsatz:            Summe der bezahlten Rechnungen im Zeitraum
+    umsatz_gesamt:     Summe aller Rechnungen im Zeitraum
+    offene_rechnungen: Summe aller offenen Rechnungen (unabhängig vom Zeitraum)
+    lagerwert:         Einkaufswert des aktuellen Lagerbestands
+    monate:            Monatssummen (umsatz = alle, einnahmen = bezahlte Rechnungen)
+    """
+    start: Optional[date] = None
+    ende: Optional[date] = None
+    umsatz: float = 0.0
+    umsatz_gesamt: float = 0.0
+    materialkosten: float = 0.0
+    sonstige_ausgaben: float = 0.0
+    offene_rechnungen: float = 0.0
+    lagerwert: float = 0.0
+    monate: List[MonatsWerte] = field(default_factory=list)
+
+    @property
+    def gewinn(self):
+        """Bezahlter Umsatz abzüglich Material und sonstiger Ausgaben"""
+        return self.umsatz - self.materialkosten - self.sonstige_ausgaben
+
+    @property
+    def forderungen(self):
+        return self.offene_rechnungen
+
+
+def _month_condition(start, ende):
+    """Bedingung auf (jahr, monat) der Monatswerte für den Zeitraum [start, ende)"""
+    conditions = []
+    params = []
+    if start is not None:
+        conditions.append("(jahr, monat) >= (?, ?)")
+        params.extend([start.year, start.month])
+    if ende is not None:
+        conditions.append("(jahr, monat) < (?, ?)")
+        params.extend([ende.year, ende.month])
+    return " AND ".join(conditions) or "1", params
+
+
+def _load_kennzahlen(cursor, uebersicht, from_rollup):
+    """Alle Kennzahlen in einem Durchlauf über die Monatswerte"""
+    condition, params = _month_condition(uebersicht.start, uebersicht.ende)
+
+    cursor.execute(f"""
+    SELECT
+        COALESCE(SUM(CASE WHEN kennzahl = 'umsatz' AND kategorie = 'bezahlt' AND {condition}
+                          THEN betrag END), 0),
+        COALESCE(SUM(CASE WHEN kennzahl = 'umsatz' AND {condition} THEN betrag END), 0),
+        COALESCE(SUM(CASE WHEN kennzahl = 'materialkosten' AND {condition} THEN betrag END), 0),
+        COALESCE(SUM(CASE WHEN kennzahl = 'ausgaben' AND {condition} THEN betrag END), 0),
+        COALESCE(SUM(CASE WHEN kennzahl = 'umsatz' AND kategorie = 'offen' THEN betrag END), 0),
+        (SELECT COALESCE(SUM(lagerbestand * einkaufspreis), 0) FROM ersatzteile)
+    FROM {ROLLUP_TABLE}
+    """, params * 4)
+
+    row = cursor.fetchone()
+    if from_rollup:
+        (uebersicht.umsatz, uebersicht.umsatz_gesamt,
+         uebersicht.materialkosten, uebersicht.sonstige_ausgaben) = row[:4]
+    uebersicht.offene_rechnungen, uebersicht.lagerwert = row[4:]
+
+
+def _load_kennzahlen_from_base_tables(cursor, uebersicht):
+    """Zeitraum-Kennzahlen aus den Basistabellen (für angebrochene Monate)"""
+    condition, params = range_condition("datum", uebersicht.start, uebersicht.ende)
+    condition = condition or "1"
+
+    cursor.execute(f"""
+    SELECT
+        (SELECT COALESCE(SUM(CASE WHEN bezahlt = 1 THEN gesamtbetrag ELSE 0 END), 0)
+         FROM rechnungen WHERE {condition}),
+        (SELECT COALESCE(SUM(gesamtbetrag), 0) FROM rechnungen WHERE {condition}),
+        (SELECT COALESCE(SUM(ae.menge * e.einkaufspreis), 0)
+         FROM rechnungen r
+         JOIN auftrag_ersatzteile ae ON ae.auftrag_id = r.auftrag_id
+         JOIN ersatzteile e ON ae.ersatzteil_id = e.id
+         WHERE {condition.replace('datum', 'r.datum')}),
+        (SELECT COALESCE(SUM(betrag), 0) FROM ausgaben WHERE {condition})
+    """, params * 4)
+
+    (uebersicht.umsatz, uebersicht.umsatz_gesamt,
+     uebersicht.materialkosten, uebersicht.sonstige_ausgaben) = cursor.fetchone()
+
+
+def _load_monate(cursor, uebersicht, months, today):
+    """Monatsverlauf (Umsatz, Einnahmen, Ausgaben) der letzten Monate, lückenlos"""
+    start = month_range_start(months, today)
+
+    cursor.execute(f"""
+    SELECT jahr, monat,
+           SUM(CASE WHEN kennzahl = 'umsatz' THEN betrag ELSE 0 END),
+           SUM(CASE WHEN kennzahl = 'umsatz' AND kategorie = 'bezahlt' THEN betrag ELSE 0 END),
+           SUM(CASE WHEN kennzahl = 'ausgaben' THEN betrag ELSE 0 END)
+    FROM {ROLLUP_TABLE}
+    WHERE (jahr, monat) >= (?, ?)
+    GROUP BY jahr, monat
+    """, (start.year, start.month))
+
+    werte = {(jahr, monat): (umsatz, einnahmen, ausgaben)
+             for jahr, monat, umsatz, einnahmen, ausgaben in cursor.fetchall()}
+
+    uebersicht.monate = []
+    for i in range(months):
+        index = start.year * 12 + start.month - 1 + i
+        jahr, monat = index // 12, index % 12 + 1
+        umsatz, einnahmen, ausgaben = werte.get((jahr, monat), (0.0, 0.0, 0.0))
+        uebersicht.monate.append(MonatsWerte(jahr, monat, round(umsatz, 2), round(einnahmen, 2), round(ausgaben, 2)))
+
+
+def get_finanz_uebersicht(conn, zeitraum, date_from=None, date_to=None, months=CHART_MONTHS, today=None):
+    """Berechnet die Finanzübersicht für einen Zeitraum ("Dieser Monat", "Letztes Jahr", ...)
+
+    Ein ungültiges benutzerdefiniertes Datum löst einen ValueError aus.
+    """
+    start, ende = resolve_period(zeitraum, date_from, date_to, today)
+    uebersicht = FinanzUebersicht(start=start, ende=ende)
+    cursor = conn.cursor()
+
+    from_rollup = is_month_aligned(start, ende)
+    _load_kennzahlen(cursor, uebersicht, from_rollup)
+    if not from_rollup:
+        _load_kennzahlen_from_base_tables(cursor, uebersicht)
+
+    if months:
+        _load_monate(cursor, uebersicht, months, today)
+
+    for name in ('umsatz', 'umsatz_gesamt', 'materialkosten', 'sonstige_ausgaben',
+                 'offene_rechnungen', 'lagerwert'):
+        setattr(uebersicht, name, round(getattr(uebersicht, name), 2))
+
+    return uebersicht
\ No newline at end of file
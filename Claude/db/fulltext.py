@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Volltextsuche (SQLite FTS5) für Kunden, Aufträge, Ersatzteile und Rechnungen
+
+Für jede Entität existiert eine FTS5-Tabelle, deren rowid der ID des
+Datensatzes entspricht. Trigger halten den Index bei jeder Änderung aktuell,
+so dass die Suchfelder nur noch den Index abfragen müssen.
+
+Beim Tippen verlängert sich der Suchbegriff meist nur; IncrementalSearch
+sucht dann nur noch innerhalb der vorherigen Treffer.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+
+from db.change_tracking import current_change_version
+
+# Maximale Anzahl Treffer, die eine Suche zurückliefert
+SEARCH_LIMIT = 500
+
+# Anzahl gemerkter Trefferlisten pro IncrementalSearch
+SEARCH_HISTORY = 20
+
+# Definition der Suchindizes:
+#   columns: Spalten der FTS-Tabelle
+#   select:  Ausdrücke für rowid und Spalten (in derselben Reihenfolge)
+#   source:  FROM-Teil, aus dem die Indexzeilen erzeugt werden (Alias der Basistabelle = x)
+#   triggers: (Tabelle, Ereignis, Bedingung auf x) - Ereignis INSERT, DELETE oder UPDATE OF ...
+FULLTEXT_INDEXES = {
+    'kunden': {
+        'columns': ('name', 'telefon', 'email', 'kennzeichen'),
+        'select': (
+            "x.id",
+            "x.vorname || ' ' || x.nachname",
+            "x.telefon",
+            "x.email",
+            "TRIM(COALESCE(x.kennzeichen, '') || ' ' || "
+            "COALESCE((SELECT group_concat(f.kennzeichen, ' ') FROM fahrzeuge f WHERE f.kunden_id = x.id), ''))"
+        ),
+        'source': "kunden x",
+        'triggers': (
+            ('kunden', 'INSERT', "x.id = NEW.id"),
+            ('kunden', 'UPDATE OF vorname, nachname, telefon, email, kennzeichen', "x.id = NEW.id"),
+            ('kunden', 'DELETE', "x.id = OLD.id"),
+            ('fahrzeuge', 'INSERT', "x.id = NEW.kunden_id"),
+            ('fahrzeuge', 'UPDATE OF kennzeichen, kunden_id', "x.id IN (OLD.kunden_id, NEW.kunden_id)"),
+            ('fahrzeuge', 'DELETE', "x.id = OLD.kunden_id"),
+        ),
+    },
+    'auftraege': {
+        'columns': ('beschreibung', 'notizen'),
+        'select': ("x.id", "x.beschreibung", "x.notizen"),
+        'source': "auftraege x",
+        'triggers': (
+            ('auftraege', 'INSERT', "x.id = NEW.id"),
+            ('auftraege', 'UPDATE OF beschreibung, notizen', "x.id = NEW.id"),
+            ('auftraege', 'DELETE', "x.id = OLD.id"),
+        ),
+    },
+    'ersatzteile': {
+        'columns': ('artikelnummer', 'bezeichnung', 'kategorie', 'lagerort'),
+        'select': ("x.id", "x.artikelnummer", "x.bezeichnung", "x.kategorie", "x.lagerort"),
+        'source': "ersatzteile x",
+        'triggers': (
+            ('ersatzteile', 'INSERT', "x.id = NEW.id"),
+            ('ersatzteile', 'UPDATE OF artikelnummer, bezeichnung, kategorie, lagerort', "x.id = NEW.id"),
+            ('ersatzteile', 'DELETE', "x.id = OLD.id"),
+        ),
+    },
+    'rechnungen': {
+        'columns': ('rechnungsnummer', 'kunde'),
+        'select': ("x.id", "x.rechnungsnummer", "k.vorname || ' ' || k.nachname"),
+        'source': "rechnungen x LEFT JOIN auftraege a ON x.auftrag_id = a.id LEFT JOIN kunden k ON a.kunden_id = k.id",
+        'triggers': (
+            ('rechnungen', 'INSERT', "x.id = NEW.id"),
+            ('rechnungen', 'UPDATE OF rechnungsnummer, auftrag_id', "x.id = NEW.id"),
+            ('rechnungen', 'DELETE', "x.id = OLD.id"),
+            ('auftraege', 'UPDATE OF kunden_id', "x.auftrag_id = NEW.id"),
+            ('kunden', 'UPDATE OF vorname, nachname', "a.kunden_id = NEW.id"),
+        ),
+    },
+}
+
+
+def _refresh_sql(name, condition):
+    """SQL, das die Indexzeilen aller Datensätze erneuert, die die Bedingung erfüllen"""
+    index = FULLTEXT_INDEXES[name]
+    fts_table = f"{name}_fts"
+    columns = ", ".join(index['columns'])
+    select = ", ".join(index['select'])
+
+    return f"""
+        DELETE FROM {fts_table} WHERE rowid IN (SELECT x.id FROM {index['source']} WHERE {condition});
+        INSERT INTO {fts_table} (rowid, {columns})
+        SELECT {select} FROM {index['source']} WHERE {condition};
+    """
+
+
+def _delete_sql(name):
+    """SQL, das die Indexzeile eines gelöschten Datensatzes entfernt"""
+    # Beim Löschen existiert die Basiszeile nicht mehr, daher direkt über OLD.id
+    return f"DELETE FROM {name}_fts WHERE rowid = OLD.id;"
+
+
+def create_fulltext_index(cursor):
+    """Legt die FTS5-Tabellen samt Triggern an und füllt sie mit dem aktuellen Datenbestand"""
+    for name, index in FULLTEXT_INDEXES.items():
+        fts_table = f"{name}_fts"
+        columns = ", ".join(index['columns'])
+
+        cursor.execute(f"DROP TABLE IF EXISTS {fts_table}")
+        cursor.execute(f"""
+        CREATE VIRTUAL TABLE {fts_table} USING fts5(
+            {columns},
+            tokenize = 'unicode61 remove_diacritics 2'
+        )
+        """)
+
+        for i, (table, event, condition) in enumerate(index['triggers']):
+            trigger_name = f"{fts_table}_{table}_{event.split()[0].lower()}_{i}"
+            if event == 'DELETE' and table == name:
+                body = _delete_sql(name)
+            else:
+                body = _refresh_sql(name, condition)
+
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
+            cursor.execute(f"""
+            CREATE TRIGGER {trigger_name} AFTER {event} ON {table}
+            BEGIN
+                {body}
+            END
+            """)
+
+        # Bestehende Daten indexieren
+        cursor.execute(f"""
+        INSERT INTO {fts_table} (rowid, {columns})
+        SELECT {", ".join(index['select'])} FROM {index['source']}
+        """)
+
+
+def build_match_query(search_term):
+    """Wandelt eine Benutzereingabe in eine FTS5-Präfixabfrage um (alle Wörter müssen vorkommen)"""
+    tokens = re.findall(r"\w+", search_term.lower())
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def normalize_search_term(search_term):
+    """Suchbegriff in der Form, in der er verglichen wird (klein, ohne Leerraum an den Enden)"""
+    return search_term.strip().lower()
+
+
+def extends_search(previous_term, search_term):
+    """True, wenn jeder Treffer von search_term auch ein Treffer von previous_term ist
+
+    Das gilt, wenn der neue Begriff den alten nur verlängert: jedes Wort des
+    alten Begriffs ist dann Präfix eines Worts des neuen.
+    """
+    previous_term = normalize_search_term(previous_term)
+    return bool(build_match_query(previous_term)) and normalize_search_term(search_term).startswith(previous_term)
+
+
+def search_ids(conn, name, search_term, limit=SEARCH_LIMIT, within=None):
+    """Liefert die IDs der Treffer, sortiert nach Relevanz
+
+    Mit within wird nur unter diesen IDs gesucht (höchstens SEARCH_LIMIT).
+    """
+    match_query = build_match_query(search_term)
+    if not match_query:
+        return []
+    if within is not None and not within:
+        return []
+
+    within_filter = ""
+    params = [match_query]
+    if within is not None:
+        within_filter = f"AND rowid IN ({', '.join('?' * len(within))})"
+        params.extend(within)
+
+    cursor = conn.cursor()
+    cursor.execute(f"""
+    SELECT rowid FROM {name}_fts
+    WHERE {name}_fts MATCH ? {within_filter}
+    ORDER BY rank
+    LIMIT ?
+    """, params + [limit])
+
+    return [row[0] for row in cursor.fetchall()]
+
+
+class IncrementalSearch:
+    """Volltextsuche eines Index, die sich die letzten Trefferlisten merkt
+
+    Verlängert ein Suchbegriff einen bereits gesuchten, wird nur unter dessen
+    Treffern gesucht; ein bereits gesuchter Begriff (z.B. nach Rücktaste)
+    wird direkt beantwortet. Gemerkte Treffer gelten nur, solange sich laut
+    Änderungsprotokoll nichts geändert hat und die Trefferliste vollständig
+    war (weniger als limit Treffer). search darf in beliebigen Threads
+    aufgerufen werden.
+    """
+    def __init__(self, name, limit=SEARCH_LIMIT, history=SEARCH_HISTORY):
+        self.name = name
+        self.limit = limit
+        self.history = history
+        # Suchbegriff -> IDs der (vollständigen) Trefferliste
+        self._results = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+
+    def search(self, conn, search_term):
+        """Liefert die IDs der Treffer, sortiert nach Relevanz (wie search_ids)"""
+        search_term = normalize_search_term(search_term)
+        version = current_change_version(conn)
+
+        with self._lock:
+            if version != self._version:
+                self._results.clear()
+                self._version = version
+            if search_term in self._results:
+                self._results.move_to_end(search_term)
+                return list(self._results[search_term])
+            # Längsten gemerkten Begriff suchen, den der neue verlängert
+            previous = max((term for term in self._results if extends_search(term, search_term)),
+                           key=len, default=None)
+            within = self._results[previous] if previous is not None else None
+
+        ids = search_ids(conn, self.name, search_term, self.limit, within)
+
+        # Innerhalb einer vollständigen Liste ist auch das Ergebnis vollständig
+        if within is not None or len(ids) < self.limit:
+            with self._lock:
+                if version == self._version:
+                    self._results[search_term] = ids
+                    while len(self._results) > self.history:
+                        self._results.popitem(last=False)
+        return ids
+
+    def clear(self):
+        """Verwirft alle gemerkten Trefferlisten"""
+        with self._lock:
+            self._results.clear()
\ No newline at end of file
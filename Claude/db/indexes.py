@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sekundärindizes für die häufig verwendeten Filter- und Join-Spalten
+
+Die Indizes wurden anhand von EXPLAIN QUERY PLAN für die Abfragen in
+HOT_QUERIES und die Blätterabfragen der Übersichtslisten
+(services.listen.plan_queries) gewählt. find_full_table_scans() prüft, dass keine dieser
+Abfragen die Tabelle vollständig durchläuft; benchmarks/scaling.py führt die
+Prüfung vor jeder Messung aus (allein: --check-plans).
+"""
+
+# (Name, Tabelle, Spalten bzw. Ausdrücke)
+INDEXES = [
+    # Aufträge: Join auf Kunden, Statusfilter und Sortierung nach Erstelldatum
+    ('idx_auftraege_kunden_id', 'auftraege', 'kunden_id, status'),
+    ('idx_auftraege_status_erstellt', 'auftraege', 'status, erstellt_am'),
+    ('idx_auftraege_erstellt', 'auftraege', 'erstellt_am'),
+
+    # Auftragspositionen: deckt Materialkosten (Menge je Teil) ohne Zugriff auf die Tabelle ab
+    ('idx_auftrag_ersatzteile_auftrag', 'auftrag_ersatzteile', 'auftrag_id, ersatzteil_id, menge'),
+    ('idx_auftrag_ersatzteile_ersatzteil', 'auftrag_ersatzteile', 'ersatzteil_id'),
+
+    # Rechnungen: Sortierung nach Datum, offene/bezahlte Rechnungen mit Betrag (deckend)
+    ('idx_rechnungen_datum', 'rechnungen', 'datum'),
+    ('idx_rechnungen_bezahlt_datum', 'rechnungen', 'bezahlt, datum, gesamtbetrag'),
+
+    # Fahrzeuge je Kunde
+    ('idx_fahrzeuge_kunden_id', 'fahrzeuge', 'kunden_id'),
+
+    # Termine im Kalender nach Datum und Uhrzeit
+    ('idx_termine_datum', 'termine', 'datum, uhrzeit_von'),
+
+    # Ausgaben nach Zeitraum, gruppiert nach Kategorie (deckend)
+    ('idx_ausgaben_datum', 'ausgaben', 'datum, kategorie, betrag'),
+
+    # Sortierung der Listen
+    ('idx_kunden_name', 'kunden', "vorname || ' ' || nachname"),
+    ('idx_ersatzteile_bezeichnung', 'ersatzteile', 'bezeichnung'),
+    ('idx_ersatzteile_kategorie', 'ersatzteile', 'kategorie, bezeichnung'),
+
+    # Offene TODOs auf dem Dashboard
+    ('idx_todos_erledigt', 'todos', 'erledigt, erstellt_am'),
+]
+
+# Abfragen, die beim Arbeiten mit der Anwendung ständig ausgeführt werden (SQL, Beispielparameter);
+# die Übersichtslisten selbst liefert services.listen.plan_queries
+HOT_QUERIES = [
+    ("SELECT COUNT(*) FROM auftraege WHERE kunden_id = ? AND status != 'Abgeschlossen'", (1,)),
+    ("""SELECT e.bezeichnung, ae.menge, ae.einzelpreis FROM auftrag_ersatzteile ae
+        JOIN ersatzteile e ON ae.ersatzteil_id = e.id WHERE ae.auftrag_id = ?""", (1,)),
+    ("SELECT COUNT(*) FROM auftrag_ersatzteile WHERE ersatzteil_id = ?", (1,)),
+    ("SELECT id FROM rechnungen WHERE auftrag_id = ?", (1,)),
+    ("SELECT COALESCE(SUM(gesamtbetrag), 0) FROM rechnungen WHERE bezahlt = 0", ()),
+    ("""SELECT COALESCE(SUM(gesamtbetrag), 0) FROM rechnungen
+        WHERE bezahlt = 1 AND datum >= ? AND datum < ?""", ('2025-01-01', '2025-02-01')),
+    ("""SELECT COALESCE(SUM(ae.menge * e.einkaufspreis), 0)
+        FROM rechnungen r
+        JOIN auftraege a ON a.id = r.auftrag_id
+        JOIN auftrag_ersatzteile ae ON ae.auftrag_id = a.id
+        JOIN ersatzteile e ON ae.ersatzteil_id = e.id
+        WHERE r.datum >= ? AND r.datum < ?""", ('2025-01-01', '2025-02-01')),
+    ("""SELECT kategorie, SUM(betrag) FROM ausgaben
+        WHERE datum >= ? AND datum < ? GROUP BY kategorie""", ('2025-01-01', '2025-02-01')),
+    ("SELECT id, fahrzeug_typ, kennzeichen FROM fahrzeuge WHERE kunden_id = ?", (1,)),
+    ("SELECT id, titel FROM termine WHERE datum BETWEEN ? AND ? ORDER BY datum, uhrzeit_von",
+     ('2025-01-01', '2025-01-31')),
+    ("SELECT text FROM todos WHERE erledigt = 0 ORDER BY erstellt_am DESC", ()),
+]
+
+def create_indexes(cursor):
+    """Legt alle Sekundärindizes an (falls noch nicht vorhanden)"""
+    for name, table, columns in INDEXES:
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})")
+
+def explain_query_plan(conn, query, params=()):
+    """Liefert die Zeilen von EXPLAIN QUERY PLAN als Liste von Texten"""
+    cursor = conn.cursor()
+    cursor.execute(f"EXPLAIN QUERY PLAN {query}", params)
+    return [row[3] for row in cursor.fetchall()]
+
+def find_full_table_scans(conn, queries=None):
+    """Gibt alle Abfragen zurück, deren Plan eine Tabelle ohne Index vollständig durchläuft
+
+    Rückgabe: Liste von (SQL, Planzeile)
+    """
+    full_scans = []
+    for query, params in (queries or HOT_QUERIES):
+        for detail in explain_query_plan(conn, query, params):
+            # "SCAN tabelle" ohne "USING ... INDEX" bedeutet einen vollständigen Tabellendurchlauf
+            if detail.startswith("SCAN ") and "USING" not in detail and "CONSTANT ROW" not in detail:
+                full_scans.append((query, detail))
+    return full_scans
\ No newline at end of file
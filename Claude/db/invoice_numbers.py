@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Vergabe der Rechnungsnummern (RE-JJJJ-NNN)
+
+Die Tabelle rechnungsnummern enthält je Jahr die zuletzt vergebene Nummer.
+Eine neue Nummer wird mit einem einzigen UPSERT in der Schreibtransaktion
+der Rechnung hochgezählt; da SQLite nur einen Schreiber zulässt, erhalten
+zwei Arbeitsplätze nie dieselbe Nummer. Die Abfrage ist ein Zugriff über
+den Primärschlüssel statt eines LIKE-Scans über die Rechnungen, und die
+Reihenfolge ist numerisch (RE-2026-1000 folgt auf RE-2026-999).
+"""
+
+import re
+from datetime import datetime
+
+SEQUENCE_TABLE = "rechnungsnummern"
+
+# Format der automatisch vergebenen Nummern
+NUMBER_PATTERN = re.compile(r"^RE-(\d{4})-(\d+)$")
+
+
+def create_sequence_table(cursor):
+    """Legt die Nummernfolge je Jahr an und übernimmt die höchsten vorhandenen Nummern"""
+    cursor.execute(f"""
+    CREATE TABLE IF NOT EXISTS {SEQUENCE_TABLE} (
+        jahr INTEGER PRIMARY KEY,
+        letzte_nummer INTEGER NOT NULL DEFAULT 0
+    )
+    """)
+
+    # Numerisches Maximum je Jahr (nicht lexikalisch wie bisher)
+    cursor.execute(f"""
+    INSERT OR REPLACE INTO {SEQUENCE_TABLE} (jahr, letzte_nummer)
+    SELECT CAST(substr(rechnungsnummer, 4, 4) AS INTEGER), MAX(CAST(substr(rechnungsnummer, 9) AS INTEGER))
+    FROM rechnungen
+    WHERE rechnungsnummer GLOB 'RE-[0-9][0-9][0-9][0-9]-[0-9]*'
+    GROUP BY substr(rechnungsnummer, 4, 4)
+    """)
+
+
+def format_rechnungsnummer(jahr, nummer):
+    """Formatiert eine Rechnungsnummer, z.B. RE-2026-007"""
+    return f"RE-{jahr}-{nummer:03d}"
+
+
+def peek_rechnungsnummer(conn, jahr=None):
+    """Nächste freie Nummer des Jahres als Vorschlag, ohne sie zu reservieren"""
+    jahr = jahr or datetime.now().year
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT letzte_nummer FROM {SEQUENCE_TABLE} WHERE jahr = ?", (jahr,))
+    row = cursor.fetchone()
+    return format_rechnungsnummer(jahr, (row[0] if row else 0) + 1)
+
+
+def reserve_rechnungsnummern(conn, anzahl, jahr=None):
+    """Reserviert anzahl aufeinanderfolgende Nummern und gibt sie als Liste zurück
+
+    Läuft in der Schreibtransaktion des Aufrufers (kein Commit), damit Nummern
+    nur verbraucht werden, wenn die Rechnungen auch gespeichert werden. Für
+    den Sammellauf werden alle Nummern mit einem Schreibzugriff reserviert.
+    """
+    if anzahl < 1:
+        return []
+
+    jahr = jahr or datetime.now().year
+    cursor = conn.cursor()
+    cursor.execute(f"""
+    INSERT INTO {SEQUENCE_TABLE} (jahr, letzte_nummer) VALUES (?, ?)
+    ON CONFLICT (jahr) DO UPDATE SET letzte_nummer = letzte_nummer + excluded.letzte_nummer
+    """, (jahr, anzahl))
+    cursor.execute(f"SELECT letzte_nummer FROM {SEQUENCE_TABLE} WHERE jahr = ?", (jahr,))
+    letzte = cursor.fetchone()[0]
+    return [format_rechnungsnummer(jahr, nummer) for nummer in range(letzte - anzahl + 1, letzte + 1)]
+
+
+def next_rechnungsnummer(conn, jahr=None):
+    """Vergibt die nächste Nummer des Jahres (in der Transaktion des Aufrufers)"""
+    return reserve_rechnungsnummern(conn, 1, jahr)[0]
+
+
+def register_rechnungsnummer(conn, rechnungsnummer):
+    """Berücksichtigt eine von Hand eingegebene Nummer im Format RE-JJJJ-N
+
+    Liegt sie über der zuletzt vergebenen Nummer, wird die Folge nachgezogen,
+    damit sie nicht ein zweites Mal vergeben wird. Kein Commit.
+    """
+    match = NUMBER_PATTERN.match(rechnungsnummer or "")
+    if not match:
+        return
+
+    jahr, nummer = int(match.group(1)), int(match.group(2))
+    conn.cursor().execute(f"""
+    INSERT INTO {SEQUENCE_TABLE} (jahr, letzte_nummer) VALUES (?, ?)
+    ON CONFLICT (jahr) DO UPDATE SET letzte_nummer = MAX(letzte_nummer, excluded.letzte_nummer)
+    """, (jahr, nummer))
\ No newline at end of file
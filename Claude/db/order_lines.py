@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Speichern der Auftragspositionen (auftrag_ersatzteile)
+
+Die Positionen aus dem Auftragsdialog werden mit den gespeicherten Zeilen
+verglichen; nur neue, geänderte und entfernte Positionen werden mit
+executemany geschrieben. Unveränderte Positionen lösen keine Schreibzugriffe
+(und keine Trigger) aus.
+"""
+
+from db.schema import has_column
+
+
+def has_rabatt_column(conn):
+    """Prüft über das Schema-Register, ob auftrag_ersatzteile die Spalte rabatt hat (ab Version 5)"""
+    return has_column(conn, 'auftrag_ersatzteile', 'rabatt')
+
+
+def load_order_lines(conn, auftrag_id):
+    """Gespeicherte Positionen: {id: (ersatzteil_id, menge, einzelpreis, rabatt)}
+
+    Die Positionen werden über ihre Zeilen-ID abgeglichen, nicht über das
+    Ersatzteil; mehrfach erfasste Teile bleiben so mit ihren eigenen Mengen,
+    Preisen und Rabatten erhalten.
+    """
+    cursor = conn.cursor()
+    rabatt = "rabatt" if has_rabatt_column(conn) else "0"
+    cursor.execute(f"""
+    SELECT id, ersatzteil_id, menge, einzelpreis, COALESCE({rabatt}, 0)
+    FROM auftrag_ersatzteile
+    WHERE auftrag_id = ?
+    """, (auftrag_id,))
+    return {row[0]: row[1:] for row in cursor.fetchall()}
+
+
+def diff_order_lines(stored, lines):
+    """Vergleicht gespeicherte Positionen mit den neuen Positionen
+
+    lines: Liste von (id, ersatzteil_id, menge, einzelpreis, rabatt);
+           id ist None für Positionen, die noch nicht gespeichert sind
+    Gibt (inserts, updates, deletes) zurück:
+      inserts: [(ersatzteil_id, menge, einzelpreis, rabatt)]
+      updates: [(menge, einzelpreis, rabatt, id)]
+      deletes: [id]
+    """
+    inserts = []
+    updates = []
+    seen = set()
+
+    for row_id, ersatzteil_id, menge, einzelpreis, rabatt in lines:
+        alt = stored.get(row_id)
+        if alt is None:
+            inserts.append((ersatzteil_id, menge, einzelpreis, rabatt))
+            continue
+
+        seen.add(row_id)
+        alt_ersatzteil_id, alt_menge, alt_preis, alt_rabatt = alt
+        # Preise und Rabatte werden im Dialog mit zwei Nachkommastellen angezeigt
+        if (alt_menge != menge or round(alt_preis or 0, 2) != round(einzelpreis, 2)
+                or round(alt_rabatt or 0, 2) != round(rabatt, 2)):
+            updates.append((menge, einzelpreis, rabatt, row_id))
+
+    deletes = [row_id for row_id in stored if row_id not in seen]
+    return inserts, updates, deletes
+
+
+def save_order_lines(conn, auftrag_id, lines):
+    """Gleicht die Positionen eines Auftrags mit lines ab (siehe diff_order_lines)
+
+    Läuft in der Transaktion des Aufrufers (kein Commit). Gibt die Anzahl
+    (eingefügt, geändert, gelöscht) zurück.
+    """
+    stored = load_order_lines(conn, auftrag_id)
+    inserts, updates, deletes = diff_order_lines(stored, lines)
+
+    cursor = conn.cursor()
+    if deletes:
+        cursor.executemany("DELETE FROM auftrag_ersatzteile WHERE id = ?", [(row_id,) for row_id in deletes])
+
+    if has_rabatt_column(conn):
+        cursor.executemany("""
+        UPDATE auftrag_ersatzteile SET menge = ?, einzelpreis = ?, rabatt = ? WHERE id = ?
+        """, updates)
+        cursor.executemany("""
+        INSERT INTO auftrag_ersatzteile (auftrag_id, ersatzteil_id, menge, einzelpreis, rabatt)
+        VALUES (?, ?, ?, ?, ?)
+        """, [(auftrag_id,) + line for line in inserts])
+    else:
+        cursor.executemany("""
+        UPDATE auftrag_ersatzteile SET menge = ?, einzelpreis = ? WHERE id = ?
+        """, [(menge, einzelpreis, row_id) for menge, einzelpreis, rabatt, row_id in updates])
+        cursor.executemany("""
+        INSERT INTO auftrag_ersatzteile (auftrag_id, ersatzteil_id, menge, einzelpreis)
+        VALUES (?, ?, ?, ?)
+        """, [(auftrag_id, ersatzteil_id, menge, einzelpreis)
+              for ersatzteil_id, menge, einzelpreis, rabatt in inserts])
+
+    return len(inserts), len(updates), len(deletes)
\ No newline at end of file
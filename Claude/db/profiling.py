@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Messung der SQL-Abfragen (optional)
+
+Verbindungen, die mit connect(..., profiler=QueryProfiler()) geöffnet werden,
+messen jede Anweisung von execute bis zum letzten gelesenen Datensatz. Der
+QueryProfiler sammelt pro Anweisungsform (Literale durch ? ersetzt) Anzahl,
+Laufzeit-Histogramm, gelesene bzw. geänderte Zeilen und Aufrufstellen.
+Anweisungen über der Schwelle werden mit ihrem EXPLAIN QUERY PLAN protokolliert.
+
+Aktiviert wird die Messung in der Anwendung über Umgebungsvariablen
+(siehe profiler_from_environment):
+    AUTOMEISTER_SQL_PROFIL=1                 Messung einschalten
+    AUTOMEISTER_SQL_PROFIL=sql_profil.json   zusätzlich beim Beenden als JSON speichern
+    AUTOMEISTER_SQL_LANGSAM_MS=50            Schwelle für langsame Anweisungen
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+
+from utils.latency import LatencyProfiler, LatencyStats, settings_from_environment
+
+# Umgebungsvariablen zum Einschalten der Messung
+PROFIL_ENV = "AUTOMEISTER_SQL_PROFIL"
+SCHWELLE_ENV = "AUTOMEISTER_SQL_LANGSAM_MS"
+
+# Anweisungen ab dieser Laufzeit (ms) werden mit Abfrageplan protokolliert
+SLOW_THRESHOLD_MS = 100.0
+
+# Obergrenzen der Histogramm-Klassen in ms (die letzte Klasse ist offen)
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# Anzahl gemerkter langsamer Anweisungen
+SLOW_LOG_SIZE = 100
+
+# Anzahl unterschiedlicher Aufrufstellen pro Anweisungsform
+MAX_CALL_SITES = 10
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)+\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(sql):
+    """Form einer Anweisung: Literale als ?, IN-Listen zusammengefasst, Leerraum vereinheitlicht"""
+    shape = _STRING_LITERAL.sub("?", sql)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _IN_LIST.sub("IN (...)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+def _call_site():
+    """Erste Aufrufstelle außerhalb dieses Moduls als 'datei:zeile (funktion)'"""
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+    if frame is None:
+        return "?"
+    filename = frame.f_code.co_filename
+    if filename.startswith(APP_DIR):
+        filename = os.path.relpath(filename, APP_DIR)
+    return f"{filename}:{frame.f_lineno} ({frame.f_code.co_name})"
+
+
+class StatementStats(LatencyStats):
+    """Gesammelte Messwerte einer Anweisungsform"""
+    buckets_ms = BUCKETS_MS
+
+    def __init__(self, shape):
+        super().__init__()
+        self.shape = shape
+        self.rows = 0
+        self.slow = 0
+        self.call_sites = Counter()
+        self.plan = None
+
+    def add(self, elapsed_ms, rows, call_site):
+        self.add_time(elapsed_ms)
+        self.rows += rows
+        if call_site in self.call_sites or len(self.call_sites) < MAX_CALL_SITES:
+            self.call_sites[call_site] += 1
+
+    def as_dict(self):
+        return {
+            'anweisung': self.shape,
+            **super().as_dict(),
+            'zeilen': self.rows,
+            'langsam': self.slow,
+            'aufrufstellen': dict(self.call_sites.most_common()),
+            'abfrageplan': self.plan,
+        }
+
+
+class QueryProfiler(LatencyProfiler):
+    """Sammelt die Messwerte aller instrumentierten Verbindungen (thread-sicher)"""
+    stats_class = StatementStats
+
+    def __init__(self, slow_threshold_ms=SLOW_THRESHOLD_MS, dump_path=None):
+        super().__init__(slow_threshold_ms, dump_path, SLOW_LOG_SIZE)
+
+    def record(self, conn, sql, params, elapsed_ms, rows, call_site):
+        """Verbucht eine ausgeführte Anweisung; langsame werden mit Abfrageplan protokolliert"""
+        shape = statement_shape(sql)
+        slow = elapsed_ms >= self.threshold_ms
+        plan = explain_query_plan(conn, sql, params) if slow else None
+
+        with self._lock:
+            stats = self._stats_for(shape)
+            stats.add(elapsed_ms, rows, call_site)
+            if slow:
+                stats.slow += 1
+                stats.plan = plan
+                self._log.append({
+                    'zeitpunkt': datetime.now().isoformat(timespec='seconds'),
+                    'dauer_ms': round(elapsed_ms, 3),
+                    'zeilen': rows,
+                    'aufrufstelle': call_site,
+                    'anweisung': shape,
+                    'abfrageplan': plan,
+                })
+
+        if slow:
+            logging.warning(f"Langsame SQL-Anweisung ({elapsed_ms:.1f} ms, {rows} Zeilen) in {call_site}: "
+                            f"{shape}\n  " + "\n  ".join(plan or ["(kein Abfrageplan)"]))
+
+    def statements(self):
+        """Messwerte aller Anweisungsformen, nach Gesamtzeit absteigend"""
+        return self._sorted_stats()
+
+    def slow_queries(self):
+        """Die zuletzt protokollierten langsamen Anweisungen, neueste zuerst"""
+        return self._recent_log()
+
+    def as_dict(self):
+        return {
+            **super().as_dict(),
+            'sqlite': sqlite3.sqlite_version,
+            'anweisungen': self.statements(),
+            'langsame_anweisungen': self.slow_queries(),
+        }
+
+
+def explain_query_plan(conn, sql, params=()):
+    """Abfrageplan einer Anweisung als Textzeilen (None, wenn er nicht ermittelt werden kann)"""
+    try:
+        # Nicht instrumentierter Cursor, damit der Plan nicht selbst gemessen wird
+        cursor = sqlite3.Cursor(conn)
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        rows = cursor.fetchall()
+        cursor.close()
+    except Exception as e:
+        logging.debug(f"Abfrageplan nicht verfügbar: {e}")
+        return None
+
+    # Zeilen (id, parent, notused, detail) als eingerückter Baum
+    depth = {0: 0}
+    lines = []
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, 0) + 1
+        lines.append("  " * (depth[node_id] - 1) + detail)
+    return lines
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor, der jede Anweisung bis zum letzten gelesenen Datensatz misst
+
+    Die Messung endet, wenn alle Zeilen gelesen wurden, die nächste Anweisung
+    ausgeführt oder der Cursor geschlossen bzw. freigegeben wird.
+    """
+    _measurement = None
+
+    def _start(self, sql, params, call_site, execute, *args):
+        self._finish()
+        start = time.perf_counter()
+        result = execute(self, *args)
+        elapsed = time.perf_counter() - start
+        self._measurement = [sql, params, elapsed, 0, call_site]
+        if self.description is None:
+            # Keine Ergebniszeilen (INSERT, UPDATE, DDL ...): geänderte Zeilen zählen
+            self._measurement[3] = max(self.rowcount, 0)
+            self._finish()
+        return result
+
+    def _fetched(self, start, rows, exhausted):
+        measurement = self._measurement
+        if measurement is not None:
+            measurement[2] += time.perf_counter() - start
+            measurement[3] += rows
+            if exhausted:
+                self._finish()
+
+    def _finish(self):
+        measurement = self._measurement
+        if measurement is None:
+            return
+        self._measurement = None
+        profiler = getattr(self.connection, 'profiler', None)
+        if profiler is not None:
+            sql, params, elapsed, rows, call_site = measurement
+            profiler.record(self.connection, sql, params, elapsed * 1000, rows, call_site)
+
+    def execute(self, sql, parameters=()):
+        return self._start(sql, parameters, _call_site(), sqlite3.Cursor.execute, sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        # Der Abfrageplan wird mit dem ersten Parametersatz ermittelt (sofern als Liste übergeben)
+        if isinstance(seq_of_parameters, (list, tuple)) and seq_of_parameters:
+            params = seq_of_parameters[0]
+        else:
+            params = ()
+        return self._start(sql, params, _call_site(), sqlite3.Cursor.executemany, sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        self._finish()
+        return sqlite3.Cursor.executescript(self, sql_script)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = sqlite3.Cursor.fetchone(self)
+        self._fetched(start, 0 if row is None else 1, row is None)
+        return row
+
+    def fetchmany(self, size=None):
+        start = time.perf_counter()
+        rows = sqlite3.Cursor.fetchmany(self, self.arraysize if size is None else size)
+        self._fetched(start, len(rows), not rows)
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = sqlite3.Cursor.fetchall(self)
+        self._fetched(start, len(rows), True)
+        return rows
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            row = sqlite3.Cursor.__next__(self)
+        except StopIteration:
+            self._fetched(start, 0, True)
+            raise
+        self._fetched(start, 1, False)
+        return row
+
+    def close(self):
+        self._finish()
+        sqlite3.Cursor.close(self)
+
+    def __del__(self):
+        try:
+            self._finish()
+        except Exception:
+            pass
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Verbindung, deren Cursor vom angehängten QueryProfiler gemessen werden"""
+    profiler = None
+
+    def cursor(self, factory=InstrumentedCursor):
+        return sqlite3.Connection.cursor(self, factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+
+def connect(database, profiler=None, **kwargs):
+    """sqlite3.connect, mit Profiler als instrumentierte Verbindung"""
+    if profiler is None:
+        return sqlite3.connect(database, **kwargs)
+    conn = sqlite3.connect(database, factory=InstrumentedConnection, **kwargs)
+    conn.profiler = profiler
+    return conn
+
+
+def profiler_from_environment(environ=None):
+    """QueryProfiler gemäß AUTOMEISTER_SQL_PROFIL / AUTOMEISTER_SQL_LANGSAM_MS (None = Messung aus)"""
+    settings = settings_from_environment(PROFIL_ENV, SCHWELLE_ENV, SLOW_THRESHOLD_MS, environ)
+    return QueryProfiler(*settings) if settings else None
\ No newline at end of file
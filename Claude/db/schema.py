@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Schema-Register: bekannte Tabellen und Spalten der Datenbank
+
+Der Katalog (sqlite_master, PRAGMA table_info) wird einmal nach den
+Schema-Updates gelesen und im Speicher gehalten. Abfragen wie "gibt es die
+Tabelle todos?" oder "hat auftrag_ersatzteile die Spalte rabatt?" werden
+danach ohne Datenbankzugriff beantwortet.
+
+Wer das Schema ändert (Migrationen, nachträglich angelegte Tabellen), ruft
+invalidate_schema() auf; der Katalog wird dann beim nächsten Zugriff neu
+gelesen.
+"""
+
+import sqlite3
+import threading
+
+# {Tabelle: (Spalte, ...)}, None = noch nicht gelesen
+_tables = None
+_lock = threading.Lock()
+
+
+def load_schema(conn):
+    """Liest alle Tabellen und ihre Spalten aus dem Katalog"""
+    global _tables
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")
+    names = [row[0] for row in cursor.fetchall()]
+
+    tables = {}
+    for name in names:
+        cursor.execute(f'PRAGMA table_info("{name}")')
+        tables[name] = tuple(info[1] for info in cursor.fetchall())
+
+    with _lock:
+        _tables = tables
+    return tables
+
+
+def invalidate_schema():
+    """Verwirft das Register, z.B. nach einer Migration"""
+    global _tables
+    with _lock:
+        _tables = None
+
+
+def _get_tables(conn):
+    tables = _tables
+    if tables is None:
+        tables = load_schema(conn)
+    return tables
+
+
+def has_table(conn, table):
+    """Prüft, ob die Tabelle existiert"""
+    return table in _get_tables(conn)
+
+
+def has_column(conn, table, column):
+    """Prüft, ob die Tabelle die Spalte hat"""
+    return column in _get_tables(conn).get(table, ())
+
+
+def get_columns(conn, table):
+    """Spalten der Tabelle in Definitionsreihenfolge (leer, wenn die Tabelle fehlt)"""
+    return _get_tables(conn).get(table, ())
+
+
+def ensure_table(conn, table, create_sql):
+    """Legt eine Tabelle an, falls sie noch nicht existiert, und aktualisiert das Register
+
+    Läuft in der Transaktion des Aufrufers (kein Commit). Gibt True zurück,
+    wenn die Tabelle laut Register fehlte. Das Register kann veraltet sein
+    (z.B. wenn eine andere Station die Tabelle inzwischen angelegt hat),
+    create_sql verwendet daher CREATE TABLE IF NOT EXISTS.
+    """
+    if has_table(conn, table):
+        return False
+
+    try:
+        conn.execute(create_sql)
+    except sqlite3.Error:
+        # Register stimmt offenbar nicht mit dem Katalog überein: beim nächsten Zugriff neu lesen
+        invalidate_schema()
+        raise
+    invalidate_schema()
+    return True
\ No newline at end of file
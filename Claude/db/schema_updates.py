@@ -1,217 +1,445 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-Aktualisierung des Datenbankschemas für die Autowerkstatt-Anwendung
-"""
-
-import sqlite3
-from utils.config import init_default_config
-
-def update_database_schema(conn):
-    """Aktualisiert das Datenbankschema auf die aktuelle Version"""
-    cursor = conn.cursor()
-    
-    # Aktuelle Schemaversion abrufen
-    cursor.execute("PRAGMA user_version")
-    current_version = cursor.fetchone()[0]
-    
-    print(f"Aktuelle Datenbankversion: {current_version}")
-    
-    # Updates sequentiell durchführen
-    if current_version < 1:
-        update_to_version_1(conn)
-    
-    if current_version < 2:
-        update_to_version_2(conn)
-    
-    if current_version < 3:
-        update_to_version_3(conn)
-        
-    if current_version < 4:
-        update_to_version_4(conn)
-        
-    if current_version < 5:
-        update_to_version_5(conn)
-        
-    if current_version < 6:  # NEU
-        update_to_version_6(conn)
-
-    if current_version < 7:
-        update_to_version_7(conn)
-    
-    # Standardkonfiguration initialisieren
-    init_default_config(conn)
-    
-def update_to_version_1(conn):
-    """Aktualisiert die Datenbank auf Version 1 (Mehrere Fahrzeuge pro Kunde)"""
-    print("Aktualisiere Datenbankschema auf Version 1...")
-    cursor = conn.cursor()
-    
-    # Prüfen, ob die Tabelle fahrzeuge bereits existiert
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='fahrzeuge'")
-    if not cursor.fetchone():
-        # Fahrzeuge-Tabelle erstellen
-        cursor.execute('''
-        CREATE TABLE fahrzeuge (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            kunden_id INTEGER NOT NULL,
-            fahrzeug_typ TEXT,
-            kennzeichen TEXT,
-            fahrgestellnummer TEXT,
-            erstellt_am TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (kunden_id) REFERENCES kunden (id)
-        )
-        ''')
-        
-        # Bestehende Fahrzeugdaten migrieren
-        cursor.execute('''
-        INSERT INTO fahrzeuge (kunden_id, fahrzeug_typ, kennzeichen, fahrgestellnummer)
-        SELECT id, fahrzeug_typ, kennzeichen, fahrgestellnummer
-        FROM kunden
-        WHERE fahrzeug_typ IS NOT NULL OR kennzeichen IS NOT NULL OR fahrgestellnummer IS NOT NULL
-        ''')
-        
-        # Schemaversion aktualisieren
-        cursor.execute("PRAGMA user_version = 1")
-        
-        conn.commit()
-        print("Datenbankschema auf Version 1 aktualisiert.")
-
-def update_to_version_2(conn):
-    """Aktualisiert die Datenbank auf Version 2 (Rabatt bei Rechnungen)"""
-    print("Aktualisiere Datenbankschema auf Version 2...")
-    cursor = conn.cursor()
-    
-    # Spalte für Rabatt zur Rechnungstabelle hinzufügen, wenn nicht vorhanden
-    cursor.execute("PRAGMA table_info(rechnungen)")
-    columns = [info[1] for info in cursor.fetchall()]
-    
-    if 'rabatt_prozent' not in columns:
-        cursor.execute("ALTER TABLE rechnungen ADD COLUMN rabatt_prozent REAL DEFAULT 0")
-    
-    # Schemaversion aktualisieren
-    cursor.execute("PRAGMA user_version = 2")
-    
-    conn.commit()
-    print("Datenbankschema auf Version 2 aktualisiert.")
-
-def update_to_version_3(conn):
-    """Aktualisiert die Datenbank auf Version 3 (Einheit bei Ersatzteilen)"""
-    print("Aktualisiere Datenbankschema auf Version 3...")
-    cursor = conn.cursor()
-    
-    # Spalte für Einheit zur Ersatzteile-Tabelle hinzufügen, wenn nicht vorhanden
-    cursor.execute("PRAGMA table_info(ersatzteile)")
-    columns = [info[1] for info in cursor.fetchall()]
-    
-    if 'einheit' not in columns:
-        cursor.execute("ALTER TABLE ersatzteile ADD COLUMN einheit TEXT DEFAULT 'Stk.'")
-    
-    # Schemaversion aktualisieren
-    cursor.execute("PRAGMA user_version = 3")
-    
-    conn.commit()
-    print("Datenbankschema auf Version 3 aktualisiert.")
-
-def update_to_version_4(conn):
-    """Aktualisiert die Datenbank auf Version 4 (Fahrzeug-ID in Aufträgen)"""
-    print("Aktualisiere Datenbankschema auf Version 4...")
-    cursor = conn.cursor()
-    
-    # Spalte für Fahrzeug-ID zur auftraege-Tabelle hinzufügen, wenn nicht vorhanden
-    cursor.execute("PRAGMA table_info(auftraege)")
-    columns = [info[1] for info in cursor.fetchall()]
-    
-    if 'fahrzeug_id' not in columns:
-        cursor.execute("ALTER TABLE auftraege ADD COLUMN fahrzeug_id INTEGER")
-        
-        # Optional: Bestehende Aufträge mit Fahrzeug-IDs aktualisieren
-        # Für jeden Auftrag das erste Fahrzeug des Kunden verwenden
-        cursor.execute("""
-        SELECT a.id, a.kunden_id, MIN(f.id) as fahrzeug_id
-        FROM auftraege a
-        JOIN fahrzeuge f ON a.kunden_id = f.kunden_id
-        GROUP BY a.id
-        """)
-        
-        for auftrag_id, kunden_id, fahrzeug_id in cursor.fetchall():
-            if fahrzeug_id:
-                cursor.execute("""
-                UPDATE auftraege SET fahrzeug_id = ? WHERE id = ?
-                """, (fahrzeug_id, auftrag_id))
-    
-    # Schemaversion aktualisieren
-    cursor.execute("PRAGMA user_version = 4")
-    
-    conn.commit()
-    print("Datenbankschema auf Version 4 aktualisiert.")
-
-def update_to_version_5(conn):
-    """Aktualisiert die Datenbank auf Version 5 (Rabatt-Spalte in auftrag_ersatzteile)"""
-    print("Aktualisiere Datenbankschema auf Version 5...")
-    cursor = conn.cursor()
-    
-    # Spalte für Rabatt zur auftrag_ersatzteile-Tabelle hinzufügen
-    cursor.execute("PRAGMA table_info(auftrag_ersatzteile)")
-    columns = [info[1] for info in cursor.fetchall()]
-    
-    if 'rabatt' not in columns:
-        cursor.execute("ALTER TABLE auftrag_ersatzteile ADD COLUMN rabatt REAL DEFAULT 0")
-    
-    # Schemaversion aktualisieren
-    cursor.execute("PRAGMA user_version = 5")
-    
-    conn.commit()
-    print("Datenbankschema auf Version 5 aktualisiert.")
-
-def update_to_version_6(conn):
-    """Aktualisiert die Datenbank auf Version 6 (Termine)"""
-    print("Aktualisiere Datenbankschema auf Version 6...")
-    cursor = conn.cursor()
-    
-    # Termine-Tabelle hinzufügen
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS termine (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        titel TEXT NOT NULL,
-        beschreibung TEXT,
-        datum DATE NOT NULL,
-        uhrzeit_von TIME,
-        uhrzeit_bis TIME,
-        kunde_id INTEGER,
-        auftrag_id INTEGER,
-        status TEXT DEFAULT 'Geplant',
-        farbe TEXT DEFAULT '#5ce0d8',
-        erstellt_am TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (kunde_id) REFERENCES kunden (id),
-        FOREIGN KEY (auftrag_id) REFERENCES auftraege (id)
-    )
-    """)
-    
-    # Schemaversion aktualisieren
-    cursor.execute("PRAGMA user_version = 6")
-    
-    conn.commit()
-    print("Datenbankschema auf Version 6 aktualisiert.")
-
-def update_to_version_7(conn):
-    """Aktualisiert die Datenbank auf Version 7 (TODO-Liste)"""
-    print("Aktualisiere Datenbankschema auf Version 7...")
-    cursor = conn.cursor()
-    
-    # TODO-Liste Tabelle hinzufügen
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS todos (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        text TEXT NOT NULL,
-        erledigt INTEGER DEFAULT 0,
-        erstellt_am TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    )
-    """)
-    
-    # Schemaversion aktualisieren
-    cursor.execute("PRAGMA user_version = 7")
-    
-    conn.commit()
-    print("Datenbankschema auf Version 7 aktualisiert.")
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Aktualisierung des Datenbankschemas für die Autowerkstatt-Anwendung
+"""
+
+import base64
+import sqlite3
+from utils.config import init_default_config
+from db.fulltext import create_fulltext_index
+from db.indexes import create_indexes
+from db.aggregates import create_monthly_rollup
+from db.assets import create_asset_tables, store_asset, LOGO_CONFIG_KEY
+from db.invoice_numbers import create_sequence_table
+from db.change_tracking import create_change_log
+from db.schema import load_schema, invalidate_schema
+
+def update_database_schema(conn):
+    """Aktualisiert das Datenbankschema auf die aktuelle Version"""
+    cursor = conn.cursor()
+    
+    # Aktuelle Schemaversion abrufen
+    cursor.execute("PRAGMA user_version")
+    current_version = cursor.fetchone()[0]
+    
+    print(f"Aktuelle Datenbankversion: {current_version}")
+    
+    # Migrationen ändern den Katalog; das Schema-Register wird danach neu gefüllt
+    invalidate_schema()
+    
+    # Updates sequentiell durchführen
+    if current_version < 1:
+        update_to_version_1(conn)
+    
+    if current_version < 2:
+        update_to_version_2(conn)
+    
+    if current_version < 3:
+        update_to_version_3(conn)
+        
+    if current_version < 4:
+        update_to_version_4(conn)
+        
+    if current_version < 5:
+        update_to_version_5(conn)
+        
+    if current_version < 6:  # NEU
+        update_to_version_6(conn)
+
+    if current_version < 7:
+        update_to_version_7(conn)
+    
+    if current_version < 8:
+        update_to_version_8(conn)
+
+    if current_version < 9:
+        update_to_version_9(conn)
+
+    if current_version < 10:
+        update_to_version_10(conn)
+
+    if current_version < 11:
+        update_to_version_11(conn)
+
+    if current_version < 12:
+        update_to_version_12(conn)
+    
+    if current_version < 13:
+        update_to_version_13(conn)
+    
+    if current_version < 14:
+        update_to_version_14(conn)
+    
+    if current_version < 15:
+        update_to_version_15(conn)
+    
+    if current_version < 16:
+        update_to_version_16(conn)
+    
+    if current_version < 17:
+        update_to_version_17(conn)
+    
+    # Standardkonfiguration initialisieren
+    init_default_config(conn)
+    
+    # Schema-Register einmal füllen; spätere Prüfungen fragen den Katalog nicht mehr ab
+    load_schema(conn)
+    
+def update_to_version_1(conn):
+    """Aktualisiert die Datenbank auf Version 1 (Mehrere Fahrzeuge pro Kunde)"""
+    print("Aktualisiere Datenbankschema auf Version 1...")
+    cursor = conn.cursor()
+    
+    # Prüfen, ob die Tabelle fahrzeuge bereits existiert
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='fahrzeuge'")
+    if not cursor.fetchone():
+        # Fahrzeuge-Tabelle erstellen
+        cursor.execute('''
+        CREATE TABLE fahrzeuge (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kunden_id INTEGER NOT NULL,
+            fahrzeug_typ TEXT,
+            kennzeichen TEXT,
+            fahrgestellnummer TEXT,
+            erstellt_am TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (kunden_id) REFERENCES kunden (id)
+        )
+        ''')
+        
+        # Bestehende Fahrzeugdaten migrieren
+        cursor.execute('''
+        INSERT INTO fahrzeuge (kunden_id, fahrzeug_typ, kennzeichen, fahrgestellnummer)
+        SELECT id, fahrzeug_typ, kennzeichen, fahrgestellnummer
+        FROM kunden
+        WHERE fahrzeug_typ IS NOT NULL OR kennzeichen IS NOT NULL OR fahrgestellnummer IS NOT NULL
+        ''')
+        
+        # Schemaversion aktualisieren
+        cursor.execute("PRAGMA user_version = 1")
+        
+        conn.commit()
+        print("Datenbankschema auf Version 1 aktualisiert.")
+
+def update_to_version_2(conn):
+    """Aktualisiert die Datenbank auf Version 2 (Rabatt bei Rechnungen)"""
+    print("Aktualisiere Datenbankschema auf Version 2...")
+    cursor = conn.cursor()
+    
+    # Spalte für Rabatt zur Rechnungstabelle hinzufügen, wenn nicht vorhanden
+    cursor.execute("PRAGMA table_info(rechnungen)")
+    columns = [info[1] for info in cursor.fetchall()]
+    
+    if 'rabatt_prozent' not in columns:
+        cursor.execute("ALTER TABLE rechnungen ADD COLUMN rabatt_prozent REAL DEFAULT 0")
+    
+    # Schemaversion aktualisieren
+    cursor.execute("PRAGMA user_version = 2")
+    
+    conn.commit()
+    print("Datenbankschema auf Version 2 aktualisiert.")
+
+def update_to_version_3(conn):
+    """Aktualisiert die Datenbank auf Version 3 (Einheit bei Ersatzteilen)"""
+    print("Aktualisiere Datenbankschema auf Version 3...")
+    cursor = conn.cursor()
+    
+    # Spalte für Einheit zur Ersatzteile-Tabelle hinzufügen, wenn nicht vorhanden
+    cursor.execute("PRAGMA table_info(ersatzteile)")
+    columns = [info[1] for info in cursor.fetchall()]
+    
+    if 'einheit' not in columns:
+        cursor.execute("ALTER TABLE ersatzteile ADD COLUMN einheit TEXT DEFAULT 'Stk.'")
+    
+    # Schemaversion aktualisieren
+    cursor.execute("PRAGMA user_version = 3")
+    
+    conn.commit()
+    print("Datenbankschema auf Version 3 aktualisiert.")
+
+def update_to_version_4(conn):
+    """Aktualisiert die Datenbank auf Version 4 (Fahrzeug-ID in Aufträgen)"""
+    print("Aktualisiere Datenbankschema auf Version 4...")
+    cursor = conn.cursor()
+    
+    # Spalte für Fahrzeug-ID zur auftraege-Tabelle hinzufügen, wenn nicht vorhanden
+    cursor.execute("PRAGMA table_info(auftraege)")
+    columns = [info[1] for info in cursor.fetchall()]
+    
+    if 'fahrzeug_id' not in columns:
+        cursor.execute("ALTER TABLE auftraege ADD COLUMN fahrzeug_id INTEGER")
+        
+        # Optional: Bestehende Aufträge mit Fahrzeug-IDs aktualisieren
+        # Für jeden Auftrag das erste Fahrzeug des Kunden verwenden
+        cursor.execute("""
+        SELECT a.id, a.kunden_id, MIN(f.id) as fahrzeug_id
+        FROM auftraege a
+        JOIN fahrzeuge f ON a.kunden_id = f.kunden_id
+        GROUP BY a.id
+        """)
+        
+        for auftrag_id, kunden_id, fahrzeug_id in cursor.fetchall():
+            if fahrzeug_id:
+                cursor.execute("""
+                UPDATE auftraege SET fahrzeug_id = ? WHERE id = ?
+                """, (fahrzeug_id, auftrag_id))
+    
+    # Schemaversion aktualisieren
+    cursor.execute("PRAGMA user_version = 4")
+    
+    conn.commit()
+    print("Datenbankschema auf Version 4 aktualisiert.")
+
+def update_to_version_5(conn):
+    """Aktualisiert die Datenbank auf Version 5 (Rabatt-Spalte in auftrag_ersatzteile)"""
+    print("Aktualisiere Datenbankschema auf Version 5...")
+    cursor = conn.cursor()
+    
+    # Spalte für Rabatt zur auftrag_ersatzteile-Tabelle hinzufügen
+    cursor.execute("PRAGMA table_info(auftrag_ersatzteile)")
+    columns = [info[1] for info in cursor.fetchall()]
+    
+    if 'rabatt' not in columns:
+        cursor.execute("ALTER TABLE auftrag_ersatzteile ADD COLUMN rabatt REAL DEFAULT 0")
+    
+    # Schemaversion aktualisieren
+    cursor.execute("PRAGMA user_version = 5")
+    
+    conn.commit()
+    print("Datenbankschema auf Version 5 aktualisiert.")
+
+def update_to_version_6(conn):
+    """Aktualisiert die Datenbank auf Version 6 (Termine)"""
+    print("Aktualisiere Datenbankschema auf Version 6...")
+    cursor = conn.cursor()
+    
+    # Termine-Tabelle hinzufügen
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS termine (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        titel TEXT NOT NULL,
+        beschreibung TEXT,
+        datum DATE NOT NULL,
+        uhrzeit_von TIME,
+        uhrzeit_bis TIME,
+        kunde_id INTEGER,
+        auftrag_id INTEGER,
+        status TEXT DEFAULT 'Geplant',
+        farbe TEXT DEFAULT '#5ce0d8',
+        erstellt_am TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (kunde_id) REFERENCES kunden (id),
+        FOREIGN KEY (auftrag_id) REFERENCES auftraege (id)
+    )
+    """)
+    
+    # Schemaversion aktualisieren
+    cursor.execute("PRAGMA user_version = 6")
+    
+    conn.commit()
+    print("Datenbankschema auf Version 6 aktualisiert.")
+
+def update_to_version_7(conn):
+    """Aktualisiert die Datenbank auf Version 7 (TODO-Liste)"""
+    print("Aktualisiere Datenbankschema auf Version 7...")
+    cursor = conn.cursor()
+    
+    # TODO-Liste Tabelle hinzufügen
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS todos (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        text TEXT NOT NULL,
+        erledigt INTEGER DEFAULT 0,
+        erstellt_am TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+    
+    # Schemaversion aktualisieren
+    cursor.execute("PRAGMA user_version = 7")
+    
+    conn.commit()
+    print("Datenbankschema auf Version 7 aktualisiert.")
+
+def update_to_version_8(conn):
+    """Aktualisiert die Datenbank auf Version 8 (Volltextsuche)"""
+    print("Aktualisiere Datenbankschema auf Version 8...")
+    cursor = conn.cursor()
+    
+    # FTS5-Indizes für Kunden, Aufträge, Ersatzteile und Rechnungen inkl. Trigger
+    create_fulltext_index(cursor)
+    
+    # Schemaversion aktualisieren
+    cursor.execute("PRAGMA user_version = 8")
+    
+    conn.commit()
+    print("Datenbankschema auf Version 8 aktualisiert.")
+
+def update_to_version_9(conn):
+    """Aktualisiert die Datenbank auf Version 9 (Sekundärindizes)"""
+    print("Aktualisiere Datenbankschema auf Version 9...")
+    cursor = conn.cursor()
+    
+    # Indizes für die häufig verwendeten Filter-, Join- und Sortierspalten
+    create_indexes(cursor)
+    
+    # Schemaversion aktualisieren
+    cursor.execute("PRAGMA user_version = 9")
+    
+    conn.commit()
+    print("Datenbankschema auf Version 9 aktualisiert.")
+
+def update_to_version_10(conn):
+    """Aktualisiert die Datenbank auf Version 10 (monatliche Finanzkennzahlen)"""
+    print("Aktualisiere Datenbankschema auf Version 10...")
+    cursor = conn.cursor()
+    
+    # Monatswerte für Umsatz, Ausgaben und Materialkosten inkl. Trigger
+    create_monthly_rollup(cursor)
+    
+    # Schemaversion aktualisieren
+    cursor.execute("PRAGMA user_version = 10")
+    
+    conn.commit()
+    print("Datenbankschema auf Version 10 aktualisiert.")
+
+def update_to_version_11(conn):
+    """Aktualisiert die Datenbank auf Version 11 (Bilder als BLOB statt Base64-Konfiguration)"""
+    print("Aktualisiere Datenbankschema auf Version 11...")
+    cursor = conn.cursor()
+    
+    # Tabellen für Bilder und vorberechnete Vorschaubilder
+    create_asset_tables(cursor)
+    
+    # Bisheriges Base64-Logo in die Bildtabelle übernehmen
+    cursor.execute("SELECT wert FROM konfiguration WHERE schluessel = 'firmenlogo'")
+    row = cursor.fetchone()
+    if row and row[0]:
+        try:
+            sha256 = store_asset(conn, base64.b64decode(row[0]))
+            cursor.execute("""
+            INSERT OR REPLACE INTO konfiguration (schluessel, wert, beschreibung)
+            VALUES (?, ?, 'Firmenlogo (Verweis auf assets)')
+            """, (LOGO_CONFIG_KEY, sha256))
+            cursor.execute("DELETE FROM konfiguration WHERE schluessel = 'firmenlogo'")
+        except Exception as e:
+            # Unlesbares Logo unverändert lassen
+            print(f"Firmenlogo konnte nicht übernommen werden: {e}")
+    
+    # Schemaversion aktualisieren
+    cursor.execute("PRAGMA user_version = 11")
+    
+    conn.commit()
+    print("Datenbankschema auf Version 11 aktualisiert.")
+
+def update_to_version_12(conn):
+    """Aktualisiert die Datenbank auf Version 12 (Rechnungsnummern je Jahr)"""
+    print("Aktualisiere Datenbankschema auf Version 12...")
+    cursor = conn.cursor()
+    
+    # Nummernfolge je Jahr, ausgehend von den höchsten vorhandenen Nummern
+    create_sequence_table(cursor)
+    
+    # Schemaversion aktualisieren
+    cursor.execute("PRAGMA user_version = 12")
+    
+    conn.commit()
+    print("Datenbankschema auf Version 12 aktualisiert.")
+
+def update_to_version_13(conn):
+    """Aktualisiert die Datenbank auf Version 13 (Änderungsprotokoll)"""
+    print("Aktualisiere Datenbankschema auf Version 13...")
+    cursor = conn.cursor()
+    
+    # Protokolltabelle und Trigger auf den Stamm- und Vorgangstabellen
+    create_change_log(cursor)
+    
+    # Schemaversion aktualisieren
+    cursor.execute("PRAGMA user_version = 13")
+    
+    conn.commit()
+    print("Datenbankschema auf Version 13 aktualisiert.")
+
+def update_to_version_14(conn):
+    """Aktualisiert die Datenbank auf Version 14 (Prüfung der Fremdschlüssel)
+
+    Ältere Versionen haben ohne PRAGMA foreign_keys gearbeitet; beim Löschen
+    von Kunden und Aufträgen konnten daher verwaiste Zeilen entstehen.
+    Verwaiste Terminzuordnungen werden gelöst, alle übrigen Verstöße nur
+    gemeldet, da es sich um Auftrags- und Rechnungsdaten handelt.
+    """
+    print("Aktualisiere Datenbankschema auf Version 14...")
+    cursor = conn.cursor()
+    
+    # Termine behalten, aber nicht mehr auf gelöschte Kunden/Aufträge zeigen
+    cursor.execute("""
+    UPDATE termine SET kunde_id = NULL
+    WHERE kunde_id IS NOT NULL AND kunde_id NOT IN (SELECT id FROM kunden)
+    """)
+    cursor.execute("""
+    UPDATE termine SET auftrag_id = NULL
+    WHERE auftrag_id IS NOT NULL AND auftrag_id NOT IN (SELECT id FROM auftraege)
+    """)
+    
+    # Verbleibende Verstöße je Tabelle und referenzierter Tabelle melden
+    cursor.execute("PRAGMA foreign_key_check")
+    verstoesse = {}
+    for tabelle, rowid, parent, fkid in cursor.fetchall():
+        verstoesse[(tabelle, parent)] = verstoesse.get((tabelle, parent), 0) + 1
+    for (tabelle, parent), anzahl in sorted(verstoesse.items()):
+        print(f"Warnung: {anzahl} Zeilen in {tabelle} verweisen auf fehlende Einträge in {parent}")
+    
+    # Schemaversion aktualisieren
+    cursor.execute("PRAGMA user_version = 14")
+    
+    conn.commit()
+    print("Datenbankschema auf Version 14 aktualisiert.")
+
+def update_to_version_15(conn):
+    """Aktualisiert die Datenbank auf Version 15 (Protokoll der Bestandsänderungen)"""
+    print("Aktualisiere Datenbankschema auf Version 15...")
+    cursor = conn.cursor()
+    
+    # Wurde bisher erst bei der ersten Bestandsänderung angelegt
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS bestandsaenderungen (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        ersatzteil_id INTEGER NOT NULL,
+        menge INTEGER NOT NULL,
+        zeitpunkt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (ersatzteil_id) REFERENCES ersatzteile (id)
+    )
+    """)
+    
+    # Schemaversion aktualisieren
+    cursor.execute("PRAGMA user_version = 15")
+    
+    conn.commit()
+    print("Datenbankschema auf Version 15 aktualisiert.")
+
+def update_to_version_16(conn):
+    """Aktualisiert die Datenbank auf Version 16 (Konfiguration im Änderungsprotokoll)"""
+    print("Aktualisiere Datenbankschema auf Version 16...")
+    cursor = conn.cursor()
+    
+    # Legt die fehlenden Trigger an (u.a. für konfiguration), bestehende bleiben unverändert
+    create_change_log(cursor)
+    
+    # Schemaversion aktualisieren
+    cursor.execute("PRAGMA user_version = 16")
+    
+    conn.commit()
+    print("Datenbankschema auf Version 16 aktualisiert.")
+
+def update_to_version_17(conn):
+    """Aktualisiert die Datenbank auf Version 17 (gerundete Monatswerte)"""
+    print("Aktualisiere Datenbankschema auf Version 17...")
+    cursor = conn.cursor()
+    
+    # Trigger mit Rundung auf Rappen neu anlegen und Monatswerte neu berechnen
+    create_monthly_rollup(cursor)
+    
+    # Schemaversion aktualisieren
+    cursor.execute("PRAGMA user_version = 17")
+    
+    conn.commit()
+    print("Datenbankschema auf Version 17 aktualisiert.")
\ No newline at end of file
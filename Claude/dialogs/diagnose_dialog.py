@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Diagnosefenster für die SQL-Messung (db.profiling) und die Messung der Tk-Callbacks (gui.ui_profiler)
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from datetime import datetime
+
+from db.profiling import BUCKETS_MS as SQL_BUCKETS_MS
+from gui.ui_profiler import BUCKETS_MS as UI_BUCKETS_MS
+
+def create_tree(parent, columns, headings, widths, text_columns=()):
+    """Erstellt eine Treeview mit Scrollbar (Spalten aus text_columns links-, alle anderen rechtsbündig)"""
+    tree = ttk.Treeview(parent, columns=columns, show='headings', selectmode='browse')
+    for column, heading, width in zip(columns, headings, widths):
+        tree.heading(column, text=heading)
+        tree.column(column, width=width, anchor='w' if column in text_columns else 'e',
+                    stretch=column == text_columns[-1])
+
+    scrollbar = ttk.Scrollbar(parent, orient="vertical", command=tree.yview)
+    tree.configure(yscrollcommand=scrollbar.set)
+    scrollbar.pack(side="right", fill="y")
+    tree.pack(side="left", fill="both", expand=True)
+    return tree
+
+def histogram_text(grenzen, histogramm):
+    """Histogramm als Textzeilen mit Balken"""
+    anzahl_gesamt = sum(histogramm)
+    text = ""
+    untergrenze = 0
+    for grenze, anzahl in zip(list(grenzen) + [None], histogramm):
+        if anzahl:
+            bereich = f"{untergrenze:g}-{grenze:g} ms" if grenze is not None else f"> {untergrenze:g} ms"
+            text += f"  {bereich:<16} {anzahl:>6}  {'#' * min(anzahl * 40 // anzahl_gesamt + 1, 40)}\n"
+        untergrenze = grenze
+    return text
+
+def save_profile_json(dialog, profiler, prefix):
+    """Fragt nach einem Dateinamen und speichert die Messwerte des Profilers als JSON"""
+    path = filedialog.asksaveasfilename(
+        parent=dialog,
+        defaultextension=".json",
+        filetypes=[("JSON-Dateien", "*.json"), ("Alle Dateien", "*.*")],
+        initialfile=f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    if not path:
+        return
+    try:
+        profiler.dump_json(path)
+        messagebox.showinfo("Gespeichert", f"Die Messwerte wurden gespeichert:\n{path}", parent=dialog)
+    except OSError as e:
+        messagebox.showerror("Fehler", f"Die Datei konnte nicht gespeichert werden: {e}", parent=dialog)
+
+class SqlDiagnoseDialog:
+    """Zeigt die gemessenen SQL-Anweisungen und die langsamen Anweisungen mit Abfrageplan"""
+    def __init__(self, parent, profiler):
+        self.parent = parent
+        self.profiler = profiler
+        self.statements = []
+        self.slow_queries = []
+
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("SQL-Diagnose")
+        self.dialog.geometry("1100x650")
+        self.dialog.transient(parent)
+
+        # Hauptframe
+        main_frame = ttk.Frame(self.dialog, padding=10)
+        main_frame.pack(fill="both", expand=True)
+
+        self.info_label = ttk.Label(main_frame)
+        self.info_label.pack(fill="x", pady=(0, 5))
+
+        notebook = ttk.Notebook(main_frame)
+        notebook.pack(fill="both", expand=True)
+
+        # Anweisungen nach Gesamtzeit
+        statements_frame = ttk.Frame(notebook)
+        notebook.add(statements_frame, text="Anweisungen")
+
+        columns = ('anzahl', 'gesamt', 'mittel', 'p95', 'max', 'zeilen', 'langsam', 'anweisung')
+        headings = ('Anzahl', 'Gesamt (ms)', 'Mittel (ms)', 'p95 (ms)', 'Max (ms)', 'Zeilen', 'Langsam', 'Anweisung')
+        widths = (60, 90, 80, 70, 80, 70, 60, 500)
+        self.statements_tree = create_tree(statements_frame, columns, headings, widths, ('anweisung',))
+        self.statements_tree.bind("<<TreeviewSelect>>", self.show_statement)
+
+        # Langsame Anweisungen, neueste zuerst
+        slow_frame = ttk.Frame(notebook)
+        notebook.add(slow_frame, text="Langsame Anweisungen")
+
+        columns = ('zeitpunkt', 'dauer', 'zeilen', 'aufrufstelle', 'anweisung')
+        headings = ('Zeitpunkt', 'Dauer (ms)', 'Zeilen', 'Aufrufstelle', 'Anweisung')
+        widths = (140, 80, 60, 250, 450)
+        self.slow_tree = create_tree(slow_frame, columns, headings, widths, ('aufrufstelle', 'anweisung'))
+        self.slow_tree.bind("<<TreeviewSelect>>", self.show_slow_query)
+
+        # Details der ausgewählten Anweisung
+        details_frame = ttk.LabelFrame(main_frame, text="Details")
+        details_frame.pack(fill="both", expand=False, pady=10)
+
+        self.details_text = tk.Text(details_frame, height=12, wrap="word", padx=5, pady=5)
+        self.details_text.pack(side="left", fill="both", expand=True)
+
+        scrollbar = ttk.Scrollbar(details_frame, command=self.details_text.yview)
+        scrollbar.pack(side="right", fill="y")
+        self.details_text.config(yscrollcommand=scrollbar.set, state="disabled")
+
+        # Buttons
+        btn_frame = ttk.Frame(main_frame)
+        btn_frame.pack(fill="x", expand=False)
+
+        ttk.Button(btn_frame, text="Aktualisieren", command=self.load_data).pack(side="left", padx=5)
+        ttk.Button(btn_frame, text="Zurücksetzen", command=self.reset).pack(side="left", padx=5)
+        ttk.Button(btn_frame, text="Als JSON speichern", command=self.save_json).pack(side="left", padx=5)
+        ttk.Button(btn_frame, text="Schließen", command=self.dialog.destroy).pack(side="right", padx=5)
+
+        self.load_data()
+
+    def load_data(self):
+        """Liest die aktuellen Messwerte aus dem Profiler"""
+        self.statements = self.profiler.statements()
+        self.slow_queries = self.profiler.slow_queries()
+
+        anzahl = sum(entry['anzahl'] for entry in self.statements)
+        gesamt = sum(entry['gesamt_ms'] for entry in self.statements)
+        self.info_label.config(
+            text=f"Gemessen seit {self.profiler.started.strftime('%d.%m.%Y %H:%M:%S')}: "
+                 f"{anzahl} Anweisungen ({len(self.statements)} Formen), {gesamt:.1f} ms gesamt, "
+                 f"{len(self.slow_queries)} langsam (ab {self.profiler.threshold_ms:g} ms)")
+
+        self.statements_tree.delete(*self.statements_tree.get_children())
+        for index, entry in enumerate(self.statements):
+            self.statements_tree.insert("", "end", iid=str(index), values=(
+                entry['anzahl'], f"{entry['gesamt_ms']:.1f}", f"{entry['mittel_ms']:.2f}",
+                f"{entry['p95_ms']:g}", f"{entry['max_ms']:.1f}", entry['zeilen'], entry['langsam'],
+                entry['anweisung']
+            ))
+
+        self.slow_tree.delete(*self.slow_tree.get_children())
+        for index, entry in enumerate(self.slow_queries):
+            self.slow_tree.insert("", "end", iid=str(index), values=(
+                entry['zeitpunkt'].replace("T", " "), f"{entry['dauer_ms']:.1f}", entry['zeilen'],
+                entry['aufrufstelle'], entry['anweisung']
+            ))
+
+        self.set_details("")
+
+    def set_details(self, text):
+        self.details_text.config(state="normal")
+        self.details_text.delete("1.0", tk.END)
+        self.details_text.insert(tk.END, text)
+        self.details_text.config(state="disabled")
+
+    def show_statement(self, event=None):
+        """Zeigt Histogramm, Aufrufstellen und letzten Abfrageplan der gewählten Anweisungsform"""
+        selection = self.statements_tree.selection()
+        if not selection:
+            return
+        entry = self.statements[int(selection[0])]
+
+        text = f"{entry['anweisung']}\n\nLaufzeiten:\n"
+        text += histogram_text(SQL_BUCKETS_MS, entry['histogramm'])
+
+        text += "\nAufrufstellen:\n"
+        for aufrufstelle, anzahl in entry['aufrufstellen'].items():
+            text += f"  {anzahl:>6}  {aufrufstelle}\n"
+
+        if entry['abfrageplan']:
+            text += "\nAbfrageplan (letzte langsame Ausführung):\n  " + "\n  ".join(entry['abfrageplan']) + "\n"
+        self.set_details(text)
+
+    def show_slow_query(self, event=None):
+        """Zeigt Anweisung und Abfrageplan der gewählten langsamen Ausführung"""
+        selection = self.slow_tree.selection()
+        if not selection:
+            return
+        entry = self.slow_queries[int(selection[0])]
+
+        text = (f"{entry['anweisung']}\n\n{entry['dauer_ms']:.1f} ms, {entry['zeilen']} Zeilen, "
+                f"{entry['aufrufstelle']}\n\nAbfrageplan:\n  ")
+        text += "\n  ".join(entry['abfrageplan'] or ["(nicht verfügbar)"])
+        self.set_details(text)
+
+    def reset(self):
+        """Verwirft alle bisherigen Messwerte"""
+        if messagebox.askyesno("Zurücksetzen", "Alle bisherigen Messwerte verwerfen?", parent=self.dialog):
+            self.profiler.reset()
+            self.load_data()
+
+    def save_json(self):
+        """Speichert die Messwerte als JSON-Datei"""
+        save_profile_json(self.dialog, self.profiler, "sql_profil")
+
+class UiDiagnoseDialog:
+    """Zeigt die Blockierzeiten der Tk-Callbacks und die Blockaden mit Stack-Probe"""
+    def __init__(self, parent, profiler):
+        self.parent = parent
+        self.profiler = profiler
+        self.handlers = []
+        self.stalls = []
+
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("UI-Diagnose")
+        self.dialog.geometry("1100x650")
+        self.dialog.transient(parent)
+
+        # Hauptframe
+        main_frame = ttk.Frame(self.dialog, padding=10)
+        main_frame.pack(fill="both", expand=True)
+
+        self.info_label = ttk.Label(main_frame)
+        self.info_label.pack(fill="x", pady=(0, 5))
+
+        notebook = ttk.Notebook(main_frame)
+        notebook.pack(fill="both", expand=True)
+
+        # Callbacks nach gesamter Blockierzeit
+        handlers_frame = ttk.Frame(notebook)
+        notebook.add(handlers_frame, text="Callbacks")
+
+        columns = ('anzahl', 'gesamt', 'mittel', 'p95', 'max', 'blockaden', 'handler')
+        headings = ('Anzahl', 'Gesamt (ms)', 'Mittel (ms)', 'p95 (ms)', 'Max (ms)', 'Blockaden', 'Callback')
+        widths = (60, 90, 80, 70, 80, 70, 550)
+        self.handlers_tree = create_tree(handlers_frame, columns, headings, widths, ('handler',))
+        self.handlers_tree.bind("<<TreeviewSelect>>", self.show_handler)
+
+        # Blockaden, neueste zuerst
+        stalls_frame = ttk.Frame(notebook)
+        notebook.add(stalls_frame, text="Blockaden")
+
+        columns = ('zeitpunkt', 'dauer', 'proben', 'handler')
+        headings = ('Zeitpunkt', 'Dauer (ms)', 'Proben', 'Callback')
+        widths = (140, 80, 60, 650)
+        self.stalls_tree = create_tree(stalls_frame, columns, headings, widths, ('handler',))
+        self.stalls_tree.bind("<<TreeviewSelect>>", self.show_stall)
+
+        # Details des ausgewählten Callbacks
+        details_frame = ttk.LabelFrame(main_frame, text="Details")
+        details_frame.pack(fill="both", expand=False, pady=10)
+
+        self.details_text = tk.Text(details_frame, height=14, wrap="none", padx=5, pady=5)
+        self.details_text.pack(side="left", fill="both", expand=True)
+
+        scrollbar = ttk.Scrollbar(details_frame, command=self.details_text.yview)
+        scrollbar.pack(side="right", fill="y")
+        self.details_text.config(yscrollcommand=scrollbar.set, state="disabled")
+
+        # Buttons
+        btn_frame = ttk.Frame(main_frame)
+        btn_frame.pack(fill="x", expand=False)
+
+        ttk.Button(btn_frame, text="Aktualisieren", command=self.load_data).pack(side="left", padx=5)
+        ttk.Button(btn_frame, text="Zurücksetzen", command=self.reset).pack(side="left", padx=5)
+        ttk.Button(btn_frame, text="Als JSON speichern", command=self.save_json).pack(side="left", padx=5)
+        ttk.Button(btn_frame, text="Schließen", command=self.dialog.destroy).pack(side="right", padx=5)
+
+        self.load_data()
+
+    def load_data(self):
+        """Liest die aktuellen Messwerte aus dem Profiler"""
+        self.handlers = self.profiler.handlers()
+        self.stalls = self.profiler.stalls()
+
+        anzahl = sum(entry['anzahl'] for entry in self.handlers)
+        gesamt = sum(entry['gesamt_ms'] for entry in self.handlers)
+        self.info_label.config(
+            text=f"Gemessen seit {self.profiler.started.strftime('%d.%m.%Y %H:%M:%S')}: "
+                 f"{anzahl} Callbacks, {gesamt / 1000:.1f} s blockiert, "
+                 f"{len(self.stalls)} Blockaden (ab {self.profiler.threshold_ms:g} ms)")
+
+        self.handlers_tree.delete(*self.handlers_tree.get_children())
+        for index, entry in enumerate(self.handlers):
+            self.handlers_tree.insert("", "end", iid=str(index), values=(
+                entry['anzahl'], f"{entry['gesamt_ms']:.1f}", f"{entry['mittel_ms']:.2f}",
+                f"{entry['p95_ms']:g}", f"{entry['max_ms']:.1f}", entry['blockaden'], entry['handler']
+            ))
+
+        self.stalls_tree.delete(*self.stalls_tree.get_children())
+        for index, entry in enumerate(self.stalls):
+            self.stalls_tree.insert("", "end", iid=str(index), values=(
+                entry['zeitpunkt'].replace("T", " "), f"{entry['dauer_ms']:.1f}", entry['proben'],
+                entry['handler']
+            ))
+
+        self.set_details("")
+
+    def set_details(self, text):
+        self.details_text.config(state="normal")
+        self.details_text.delete("1.0", tk.END)
+        self.details_text.insert(tk.END, text)
+        self.details_text.config(state="disabled")
+
+    def show_handler(self, event=None):
+        """Zeigt Histogramm und häufigste Stack-Probe des gewählten Callbacks"""
+        selection = self.handlers_tree.selection()
+        if not selection:
+            return
+        entry = self.handlers[int(selection[0])]
+
+        text = f"{entry['handler']}\n\nBlockierzeiten:\n"
+        text += histogram_text(UI_BUCKETS_MS, entry['histogramm'])
+        if entry['haeufigster_stack']:
+            text += (f"\nHäufigste Stack-Probe ({entry['stack_anteil']:.0%} der Proben während Blockaden):\n  "
+                     + entry['haeufigster_stack'].replace("\n", "\n  ") + "\n")
+        self.set_details(text)
+
+    def show_stall(self, event=None):
+        """Zeigt die Stack-Probe der gewählten Blockade"""
+        selection = self.stalls_tree.selection()
+        if not selection:
+            return
+        entry = self.stalls[int(selection[0])]
+
+        text = f"{entry['handler']}\n\n{entry['dauer_ms']:.1f} ms, {entry['proben']} Proben\n\nHäufigste Stack-Probe:\n  "
+        text += (entry['stack'] or "(keine Probe)").replace("\n", "\n  ")
+        self.set_details(text)
+
+    def reset(self):
+        """Verwirft alle bisherigen Messwerte"""
+        if messagebox.askyesno("Zurücksetzen", "Alle bisherigen Messwerte verwerfen?", parent=self.dialog):
+            self.profiler.reset()
+            self.load_data()
+
+    def save_json(self):
+        """Speichert die Messwerte als JSON-Datei"""
+        save_profile_json(self.dialog, self.profiler, "ui_profil")
\ No newline at end of file
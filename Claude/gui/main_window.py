@@ -1,402 +1,691 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-Modernisiertes Hauptfenster der Autowerkstatt-Anwendung
-"""
-
-import os
-import tkinter as tk
-from tkinter import ttk, messagebox
-from datetime import datetime
-import sv_ttk  # Optional: Für ein moderneres Erscheinungsbild
-
-from db.database import create_database, backup_database
-from dialogs.common_dialogs import HilfeDialog, ExportDialog
-from gui.dashboard_modern import create_dashboard_tab  # Verwenden Sie das modernisierte Dashboard
-from gui.kunden import create_kunden_tab
-from gui.auftraege import create_auftraege_tab
-from gui.ersatzteile import create_ersatzteile_tab
-from gui.rechnungen import create_rechnungen_tab
-from gui.finanzen import create_finanzen_tab
-from gui.reports import ErweitertesBerichtswesen
-from gui.calendar_manager import KalenderVerwaltung
-
-# Moderne Farbpalette
-COLORS = {
-    "bg_dark": "#1e2330",
-    "bg_medium": "#2a3142",
-    "bg_light": "#353e54",
-    "accent": "#5ce0d8",
-    "text_light": "#ffffff",
-    "text_dark": "#aab0bc",
-    "success": "#5fb878",
-    "warning": "#f2aa4c",
-    "danger": "#f65e5e"
-}
-
-class ModernAutowerkstattApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("AutoMeister - Werkstattverwaltung")
-        
-        # Vollbildmodus und Mindestgröße festlegen
-        self.root.state('zoomed')
-        self.root.minsize(1200, 700)  # Minimale Fenstergröße
-        
-        # Dunkles Design aktivieren, wenn sv_ttk installiert ist
-        try:
-            sv_ttk.set_theme("dark")
-        except NameError:
-            # Wenn sv_ttk nicht installiert ist, eigene Dark-Theme-Konfiguration
-            self.configure_dark_theme()
-            
-        # Datenbankinitialisierung
-        self.conn = create_database()
-        
-        # Frame für die Navigationsleiste
-        self.nav_frame = tk.Frame(root, bg=COLORS["bg_dark"], width=200)
-        self.nav_frame.pack(side="left", fill="y")
-        self.nav_frame.pack_propagate(0)  # Verhindert, dass der Frame sich an Inhalte anpasst
-        
-        # App-Logo und -Titel
-        logo_frame = tk.Frame(self.nav_frame, bg=COLORS["bg_dark"], height=80)
-        logo_frame.pack(fill="x", pady=10)
-        
-        app_title = tk.Label(logo_frame, text="AutoMeister", 
-                            bg=COLORS["bg_dark"], fg=COLORS["accent"],
-                            font=("Arial", 18, "bold"))
-        app_title.pack(pady=10)
-        
-        subtitle = tk.Label(logo_frame, text="Werkstattverwaltung", 
-                          bg=COLORS["bg_dark"], fg=COLORS["text_light"],
-                          font=("Arial", 10))
-        subtitle.pack()
-        
-        # Navigationsmenü erstellen
-        self.create_nav_menu()
-        
-        # Hauptcontainer für Tabs
-        main_container = tk.Frame(root, bg=COLORS["bg_medium"])
-        main_container.pack(side="right", fill="both", expand=True)
-        
-        # Notebook für Tabs
-        self.notebook = ttk.Notebook(main_container)
-        self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
-        
-        # Tabs erstellen
-        self.create_tabs()
-        
-        # Statusleiste
-        self.status_bar = tk.Label(root, text="Bereit", bd=1, relief=tk.SUNKEN, anchor=tk.W,
-                                bg=COLORS["bg_dark"], fg=COLORS["text_light"])
-        self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
-        
-        # Initial Daten laden
-        self.load_all_data()
-        
-        # Callbacks für Navigation
-        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_change)
-
-    def configure_dark_theme(self):
-        """Konfiguriert ein dunkles Design für Tkinter"""
-        style = ttk.Style()
-        
-        # Notebook-Design
-        style.configure("TNotebook", background=COLORS["bg_dark"])
-        style.configure("TNotebook.Tab", background=COLORS["bg_medium"], foreground=COLORS["text_light"])
-        style.map("TNotebook.Tab", 
-                 background=[("selected", COLORS["accent"])],
-                 foreground=[("selected", COLORS["bg_dark"])])
-        
-        # Frame-Design
-        style.configure("TFrame", background=COLORS["bg_medium"])
-        
-        # Label-Design
-        style.configure("TLabel", background=COLORS["bg_medium"], foreground=COLORS["text_light"])
-        
-        # Button-Design
-        style.configure("TButton", 
-                      background=COLORS["accent"], 
-                      foreground=COLORS["bg_dark"],
-                      borderwidth=0)
-        style.map("TButton",
-                 background=[("active", COLORS["text_light"])],
-                 foreground=[("active", COLORS["bg_dark"])])
-        
-        # Eingabefelder
-        style.configure("TEntry", 
-                      fieldbackground=COLORS["bg_light"],
-                      foreground=COLORS["text_light"],
-                      borderwidth=0)
-        
-        # Weitere Widget-Stile...
-        style.configure("Treeview", 
-                      background=COLORS["bg_light"], 
-                      fieldbackground=COLORS["bg_light"],
-                      foreground=COLORS["text_light"])
-        style.map("Treeview", 
-                 background=[("selected", COLORS["accent"])],
-                 foreground=[("selected", COLORS["bg_dark"])])
-
-    def create_nav_menu(self):
-        """Erstellt ein vertikales Navigationsmenü"""
-        nav_items = [
-            ("Dashboard", lambda: self.notebook.select(0), "dashboard"),
-            ("Kunden", lambda: self.notebook.select(1), "customers"),
-            ("Aufträge", lambda: self.notebook.select(2), "orders"),
-            ("Ersatzteile", lambda: self.notebook.select(3), "parts"),
-            ("Rechnungen", lambda: self.notebook.select(4), "invoices"),
-            ("Finanzen", lambda: self.notebook.select(5), "finances"),
-            ("Kalender", self.open_calendar, "calendar"),  # NEU
-            ("Berichte", self.open_reports, "reports"),    # NEU
-            ("Einstellungen", self.open_settings, "settings")
-        ]
-        
-        menu_frame = tk.Frame(self.nav_frame, bg=COLORS["bg_dark"])
-        menu_frame.pack(fill="x", pady=20)
-        
-        self.nav_buttons = []
-        
-        for i, (text, command, icon_name) in enumerate(nav_items):
-            # Frame für jeden Menüpunkt
-            btn_frame = tk.Frame(menu_frame, bg=COLORS["bg_dark"], height=40)
-            btn_frame.pack(fill="x", pady=2)
-            
-            # Hier könnte man Icons hinzufügen, wenn gewünscht
-            # icon = tk.PhotoImage(file=f"icons/{icon_name}.png")
-            # icon_label = tk.Label(btn_frame, image=icon, bg=COLORS["bg_dark"])
-            # icon_label.image = icon
-            # icon_label.pack(side="left", padx=10)
-            
-            # Button mit hover-Effekt
-            btn = tk.Label(btn_frame, text=text, bg=COLORS["bg_dark"], fg=COLORS["text_light"],
-                          font=("Arial", 11), cursor="hand2", pady=8, padx=15)
-            btn.pack(fill="x")
-            
-            # Bind-Events für Hover-Effekt und Klick
-            btn.bind("<Enter>", lambda e, b=btn: b.config(bg=COLORS["bg_light"]))
-            btn.bind("<Leave>", lambda e, b=btn: b.config(bg=COLORS["bg_dark"]))
-            btn.bind("<Button-1>", lambda e, cmd=command: cmd())
-            
-            self.nav_buttons.append((btn, i if i < 6 else None))  # Button mit Index speichern
-    
-    def on_tab_change(self, event):
-        """Aktualisiert die Hervorhebung im Navigationsmenü beim Tab-Wechsel"""
-        selected_tab = self.notebook.index("current")
-        
-        # Alle Buttons zurücksetzen
-        for btn, idx in self.nav_buttons:
-            if idx == selected_tab:
-                btn.config(bg=COLORS["bg_light"], fg=COLORS["accent"], 
-                         font=("Arial", 11, "bold"))
-            else:
-                btn.config(bg=COLORS["bg_dark"], fg=COLORS["text_light"], 
-                         font=("Arial", 11))
-
-    def create_tabs(self):
-        """Erstellt alle Tabs der Anwendung"""
-        # Dashboard-Tab
-        self.dashboard_frame, self.dashboard_widgets = create_dashboard_tab(self.notebook, self)
-        self.notebook.add(self.dashboard_frame, text="Dashboard")
-        
-        # Kunden-Tab
-        self.kunden_frame, self.kunden_widgets = create_kunden_tab(self.notebook, self)
-        self.notebook.add(self.kunden_frame, text="Kunden")
-        
-        # Aufträge-Tab
-        self.auftraege_frame, self.auftraege_widgets = create_auftraege_tab(self.notebook, self)
-        self.notebook.add(self.auftraege_frame, text="Aufträge")
-        
-        # Ersatzteile-Tab
-        self.ersatzteile_frame, self.ersatzteile_widgets = create_ersatzteile_tab(self.notebook, self)
-        self.notebook.add(self.ersatzteile_frame, text="Ersatzteile")
-        
-        # Rechnungen-Tab
-        self.rechnungen_frame, self.rechnungen_widgets = create_rechnungen_tab(self.notebook, self)
-        self.notebook.add(self.rechnungen_frame, text="Rechnungen")
-        
-        # Finanzen-Tab
-        self.finanzen_frame, self.finanzen_widgets = create_finanzen_tab(self.notebook, self)
-        self.notebook.add(self.finanzen_frame, text="Finanzen")
-
-    def load_all_data(self):
-        """Lädt alle Daten aus der Datenbank"""
-        self.load_kunden()
-        self.load_auftraege()
-        self.load_ersatzteile()
-        self.load_rechnungen()
-        self.update_dashboard()
-        self.update_finanzen()
-        self.load_categories()
-    
-    # Implementiere die restlichen Methoden (load_data, update-Methoden, etc.)
-    def load_kunden(self):
-        # Kunden laden (implementiert in gui.kunden)
-        from gui.kunden import load_kunden_data
-        load_kunden_data(self)
-        
-    def load_auftraege(self):
-        # Aufträge laden (implementiert in gui.auftraege)
-        from gui.auftraege import load_auftraege_data
-        load_auftraege_data(self)
-        
-    def load_ersatzteile(self):
-        # Ersatzteile laden (implementiert in gui.ersatzteile)
-        from gui.ersatzteile import load_ersatzteile_data
-        load_ersatzteile_data(self)
-        
-    def load_rechnungen(self):
-        # Rechnungen laden (implementiert in gui.rechnungen)
-        from gui.rechnungen import load_rechnungen_data
-        load_rechnungen_data(self)
-    
-    def load_categories(self):
-        """Lädt Kategorien für Dropdowns"""
-        cursor = self.conn.cursor()
-    
-        # Kategorien für Ersatzteile laden
-        cursor.execute("SELECT DISTINCT kategorie FROM ersatzteile WHERE kategorie IS NOT NULL AND kategorie != ''")
-        kategorien = [row[0] for row in cursor.fetchall()]
-        self.ersatzteile_widgets['kategorie_combo']['values'] = ["Alle"] + kategorien
-    
-        # Kategorien für Ausgaben laden
-        cursor.execute("SELECT DISTINCT kategorie FROM ausgaben WHERE kategorie IS NOT NULL AND kategorie != ''")
-        ausgaben_kategorien = [row[0] for row in cursor.fetchall()]
-        self.finanzen_widgets['ausgaben_kategorie_combo']['values'] = ["Alle"] + ausgaben_kategorien
-        
-    def update_dashboard(self):
-        """Aktualisiert das Dashboard mit aktuellen Daten"""
-        from gui.dashboard_modern import update_dashboard_data
-        update_dashboard_data(self)
-        
-    def update_finanzen(self, event=None):
-        """Aktualisiert die Finanzübersicht"""
-        from gui.finanzen import update_finanzen_data
-        update_finanzen_data(self, event)
-        
-    def update_status(self, message):
-        """Aktualisiert die Statusleiste mit einer Nachricht"""
-        self.status_bar.config(text=f"{message} | {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}")
-        
-    # Menü-Funktionen
-    def backup_database(self):
-        """Sichert die Datenbank"""
-        try:
-            # Backup erstellen
-            self.conn, backup_path = backup_database(self.conn)
-            messagebox.showinfo("Information", f"Datenbank wurde gesichert als:\n{backup_path}")
-        except Exception as e:
-            messagebox.showerror("Fehler", f"Fehler bei der Datensicherung: {e}")
-    
-    def export_data(self):
-        """Exportiert Daten aus der Datenbank"""
-        ExportDialog(self.root, "Daten exportieren", self.conn)
-    
-    def open_settings(self):
-        """Öffnet die Einstellungen"""
-        from dialogs.settings_dialog import SettingsDialog
-        settings_dialog = SettingsDialog(self.root, self.conn)
-        # Nach Schließen des Dialogs, Daten neu laden
-        self.load_all_data()
-    
-    def show_help(self):
-        """Zeigt die Hilfe an"""
-        help_text = """
-AutoMeister - Werkstattverwaltung
-=================================
-
-Diese Software ermöglicht die Verwaltung einer Autowerkstatt mit folgenden Funktionen:
-
-- Kundenverwaltung: Erfassen und verwalten von Kundendaten und Fahrzeugen
-- Auftragsverwaltung: Erfassen, bearbeiten und abrechnen von Werkstattaufträgen
-- Ersatzteilverwaltung: Lagerverwaltung für Ersatzteile inkl. Bestandsführung
-- Rechnungswesen: Erstellung von Rechnungen und Überwachung von Zahlungseingängen
-- Finanzen: Übersicht über Einnahmen, Ausgaben, Gewinn und Lagerwert
-- Berichte: Verschiedene Auswertungen und Statistiken
-
-Bei Fragen wenden Sie sich an den Support.
-        """
-        
-        HilfeDialog(self.root, "Hilfe zu AutoMeister", help_text)
-    
-    def show_about(self):
-        """Zeigt Informationen über die Software an"""
-        about_text = """
-AutoMeister - Werkstattverwaltung
-=================================
-
-Version: 2.0.0
-Erstellt: 2025
-
-Eine Anwendung zur einfachen Verwaltung einer Autowerkstatt.
-
-Entwickelt mit Python und Tkinter.
-        """
-        
-        HilfeDialog(self.root, "Über AutoMeister", about_text)
-    
-    # Aktionen für die Schnellzugriff-Buttons
-    def new_kunde(self):
-        from dialogs.kunden_dialog import KundenDialog
-        kundendialog = KundenDialog(self.root, "Neuer Kunde", None, self.conn)
-        if kundendialog.result:
-            self.load_kunden()
-            self.update_status("Neuer Kunde angelegt")
-            
-    def edit_kunde(self):
-        from gui.kunden import get_selected_kunden_id
-        from dialogs.kunden_dialog import KundenDialog
-        
-        kunden_id = get_selected_kunden_id(self)
-        if not kunden_id:
-            messagebox.showinfo("Information", "Bitte wählen Sie einen Kunden aus.")
-            return
-            
-        kundendialog = KundenDialog(self.root, "Kunde bearbeiten", kunden_id, self.conn)
-        if kundendialog.result:
-            self.load_kunden()
-            self.update_status("Kundendaten aktualisiert")
-    
-    def new_auftrag(self):
-        """Erstellt einen neuen Auftrag"""
-        from dialogs.auftrags_dialog import AuftragsDialog
-        auftragsdialog = AuftragsDialog(self.root, "Neuer Auftrag", None, self.conn)
-        if auftragsdialog.result:
-            self.load_auftraege()
-            self.update_status("Neuer Auftrag angelegt")
-            
-            # Zum Aufträge-Tab wechseln
-            self.notebook.select(2)  # Index 2 = Aufträge-Tab
-            
-    def new_rechnung(self):
-        """Erstellt eine neue Rechnung"""
-        from dialogs.rechnungs_dialog import RechnungsDialog
-        rechnungsdialog = RechnungsDialog(self.root, "Neue Rechnung", None, self.conn)
-        if rechnungsdialog.result:
-            self.load_rechnungen()
-            self.update_status("Neue Rechnung erstellt")
-            
-            # Zum Rechnungen-Tab wechseln
-            self.notebook.select(4)  # Index 4 = Rechnungen-Tab
-            
-    def new_ersatzteil(self):
-        """Erstellt ein neues Ersatzteil"""
-        from dialogs.ersatzteil_dialog import ErsatzteilDialog
-        ersatzteildialog = ErsatzteilDialog(self.root, "Neuer Artikel", None, self.conn)
-        if ersatzteildialog.result:
-            self.load_ersatzteile()
-            self.load_categories()
-            self.update_status("Neuer Artikel angelegt")
-            
-            # Zum Ersatzteile-Tab wechseln
-            self.notebook.select(3)  # Index 3 = Ersatzteile-Tab
-
-    # Neue Methoden für die erweiterten Funktionen
-    def open_calendar(self):
-        """Öffnet den Kalender zur Terminverwaltung"""
-        KalenderVerwaltung(self.root, self.conn)
-    
-    def open_reports(self):
-        """Öffnet das erweiterte Berichtswesen"""
-        ErweitertesBerichtswesen(self.root, self.conn)
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Modernisiertes Hauptfenster der Autowerkstatt-Anwendung
+"""
+
+import os
+import tkinter as tk
+from tkinter import ttk, messagebox
+from datetime import datetime
+
+from db.database import ConnectionManager, create_database, journal_mode_from_environment
+from db.backup import BackupEngine
+from db.profiling import profiler_from_environment
+from db.change_tracking import (current_change_version, changes_since, prune_change_log,
+                                 table_snapshot)
+from dialogs.common_dialogs import HilfeDialog, ExportDialog
+from gui.dashboard_modern import create_dashboard_tab, update_dashboard_data  # Verwenden Sie das modernisierte Dashboard
+from gui.kunden import create_kunden_tab, load_kunden_data
+from gui.auftraege import create_auftraege_tab, load_auftraege_data
+from gui.ersatzteile import create_ersatzteile_tab, load_ersatzteile_data
+from gui.rechnungen import create_rechnungen_tab, load_rechnungen_data
+from gui.finanzen import create_finanzen_tab, update_finanzen_data
+from gui.task_executor import TaskExecutor
+from gui.ui_profiler import profiler_from_environment as ui_profiler_from_environment
+from services.ersatzteile import list_kategorien
+from services.finanzen import list_ausgaben_kategorien
+from utils.config import get_backup_settings, add_config_listener, remove_config_listener, reload_config
+
+# Moderne Farbpalette
+COLORS = {
+    "bg_dark": "#1e2330",
+    "bg_medium": "#2a3142",
+    "bg_light": "#353e54",
+    "accent": "#5ce0d8",
+    "text_light": "#ffffff",
+    "text_dark": "#aab0bc",
+    "success": "#5fb878",
+    "warning": "#f2aa4c",
+    "danger": "#f65e5e"
+}
+
+# Tabs in der Reihenfolge des Notebooks:
+# (Titel, Name, Erstellfunktion, Ladefunktion, Tabellen, deren Änderung den Tab veralten lässt)
+TABS = [
+    ("Dashboard", "dashboard", create_dashboard_tab, update_dashboard_data,
+     ("auftraege", "kunden", "rechnungen", "ausgaben", "ersatzteile", "auftrag_ersatzteile", "todos")),
+    ("Kunden", "kunden", create_kunden_tab, load_kunden_data,
+     ("kunden", "fahrzeuge")),
+    ("Aufträge", "auftraege", create_auftraege_tab, load_auftraege_data,
+     ("auftraege", "kunden", "fahrzeuge", "auftrag_ersatzteile", "ersatzteile", "rechnungen")),
+    ("Ersatzteile", "ersatzteile", create_ersatzteile_tab, load_ersatzteile_data,
+     ("ersatzteile", "auftrag_ersatzteile")),
+    ("Rechnungen", "rechnungen", create_rechnungen_tab, load_rechnungen_data,
+     ("rechnungen", "auftraege", "kunden", "auftrag_ersatzteile", "ersatzteile")),
+    ("Finanzen", "finanzen", create_finanzen_tab, update_finanzen_data,
+     ("rechnungen", "ausgaben", "auftraege", "kunden", "auftrag_ersatzteile", "ersatzteile")),
+]
+
+# Tabelle, deren Zeilen ein Tab in seiner Treeview anzeigt (Zeilen-Aktualisierung, siehe apply_changes)
+TAB_ROW_TABLES = {
+    "kunden": "kunden",
+    "auftraege": "auftraege",
+    "ersatzteile": "ersatzteile",
+    "rechnungen": "rechnungen",
+}
+
+# Abfrageintervall für den Fortschritt der Datensicherung in Millisekunden
+BACKUP_POLL_MS = 200
+
+# Abfrageintervall für Änderungen anderer Arbeitsplätze in Millisekunden
+CHANGE_POLL_MS = 2000
+
+# Tabs mit Kategorie-Filtern (siehe load_categories)
+CATEGORY_TABS = ("ersatzteile", "finanzen")
+
+class ModernAutowerkstattApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("AutoMeister - Werkstattverwaltung")
+        
+        # Mit AUTOMEISTER_UI_PROFIL wird die Blockierzeit aller Tk-Callbacks gemessen
+        # (vor dem Anlegen der Widgets, siehe gui.ui_profiler)
+        self.ui_profiler = ui_profiler_from_environment()
+        if self.ui_profiler is not None:
+            self.ui_profiler.install()
+        
+        # Vollbildmodus und Mindestgröße festlegen
+        self.root.state('zoomed')
+        self.root.minsize(1200, 700)  # Minimale Fenstergröße
+        
+        # Dunkles Design aktivieren, wenn sv_ttk installiert ist
+        try:
+            import sv_ttk  # Optional: Für ein moderneres Erscheinungsbild
+            sv_ttk.set_theme("dark")
+        except ImportError:
+            # Wenn sv_ttk nicht installiert ist, eigene Dark-Theme-Konfiguration
+            self.configure_dark_theme()
+            
+        # Datenbankinitialisierung (Schreibverbindung + Lese-Pool für Hintergrundabfragen),
+        # mit AUTOMEISTER_SQL_PROFIL werden alle Abfragen gemessen (siehe db.profiling),
+        # AUTOMEISTER_JOURNAL_MODE=WAL nur bei lokaler Datenbankdatei (siehe db.database)
+        self.sql_profiler = profiler_from_environment()
+        self.db_manager = ConnectionManager(profiler=self.sql_profiler,
+                                            journal_mode=journal_mode_from_environment())
+        self.conn = create_database(self.db_manager)
+        prune_change_log(self.conn)
+        self.conn.commit()
+        
+        # Worker-Thread für Abfragen, die die Oberfläche nicht blockieren sollen
+        self.executor = TaskExecutor(self.root, self.db_manager)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Online-Datensicherung im Hintergrund, automatisch im konfigurierten Intervall
+        backup_intervall, backup_anzahl = get_backup_settings(self.conn)
+        self.backup_engine = BackupEngine(self.db_manager, keep=backup_anzahl)
+        self.backup_job = None
+        self.schedule_backup()
+        
+        # PDF-Sammelexport (wird beim ersten Export angelegt)
+        self.pdf_batch_job = None
+        
+        # Geänderte Sicherungseinstellungen sofort übernehmen
+        add_config_listener(self.on_backup_settings_changed, ('backup_intervall', 'backup_anzahl'))
+        
+        # Frame für die Navigationsleiste
+        self.nav_frame = tk.Frame(root, bg=COLORS["bg_dark"], width=200)
+        self.nav_frame.pack(side="left", fill="y")
+        self.nav_frame.pack_propagate(0)  # Verhindert, dass der Frame sich an Inhalte anpasst
+        
+        # App-Logo und -Titel
+        logo_frame = tk.Frame(self.nav_frame, bg=COLORS["bg_dark"], height=80)
+        logo_frame.pack(fill="x", pady=10)
+        
+        app_title = tk.Label(logo_frame, text="AutoMeister", 
+                            bg=COLORS["bg_dark"], fg=COLORS["accent"],
+                            font=("Arial", 18, "bold"))
+        app_title.pack(pady=10)
+        
+        subtitle = tk.Label(logo_frame, text="Werkstattverwaltung", 
+                          bg=COLORS["bg_dark"], fg=COLORS["text_light"],
+                          font=("Arial", 10))
+        subtitle.pack()
+        
+        # Navigationsmenü erstellen
+        self.create_nav_menu()
+        
+        # Hauptcontainer für Tabs
+        main_container = tk.Frame(root, bg=COLORS["bg_medium"])
+        main_container.pack(side="right", fill="both", expand=True)
+        
+        # Notebook für Tabs
+        self.notebook = ttk.Notebook(main_container)
+        self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        # Tabs erstellen
+        self.create_tabs()
+        
+        # Statusleiste
+        self.status_bar = tk.Label(root, text="Bereit", bd=1, relief=tk.SUNKEN, anchor=tk.W,
+                                bg=COLORS["bg_dark"], fg=COLORS["text_light"])
+        self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        # Initial Daten laden
+        self.load_all_data()
+        
+        # Änderungen anderer Arbeitsplätze im Hintergrund abgleichen
+        self.change_version = current_change_version(self.conn)
+        self.data_version = self.get_data_version()
+        self.change_job = self.root.after(CHANGE_POLL_MS, self.poll_changes)
+        
+        # Callbacks für Navigation
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_change)
+
+    def configure_dark_theme(self):
+        """Konfiguriert ein dunkles Design für Tkinter"""
+        style = ttk.Style()
+        
+        # Notebook-Design
+        style.configure("TNotebook", background=COLORS["bg_dark"])
+        style.configure("TNotebook.Tab", background=COLORS["bg_medium"], foreground=COLORS["text_light"])
+        style.map("TNotebook.Tab", 
+                 background=[("selected", COLORS["accent"])],
+                 foreground=[("selected", COLORS["bg_dark"])])
+        
+        # Frame-Design
+        style.configure("TFrame", background=COLORS["bg_medium"])
+        
+        # Label-Design
+        style.configure("TLabel", background=COLORS["bg_medium"], foreground=COLORS["text_light"])
+        
+        # Button-Design
+        style.configure("TButton", 
+                      background=COLORS["accent"], 
+                      foreground=COLORS["bg_dark"],
+                      borderwidth=0)
+        style.map("TButton",
+                 background=[("active", COLORS["text_light"])],
+                 foreground=[("active", COLORS["bg_dark"])])
+        
+        # Eingabefelder
+        style.configure("TEntry", 
+                      fieldbackground=COLORS["bg_light"],
+                      foreground=COLORS["text_light"],
+                      borderwidth=0)
+        
+        # Weitere Widget-Stile...
+        style.configure("Treeview", 
+                      background=COLORS["bg_light"], 
+                      fieldbackground=COLORS["bg_light"],
+                      foreground=COLORS["text_light"])
+        style.map("Treeview", 
+                 background=[("selected", COLORS["accent"])],
+                 foreground=[("selected", COLORS["bg_dark"])])
+
+    def create_nav_menu(self):
+        """Erstellt ein vertikales Navigationsmenü"""
+        nav_items = [
+            ("Dashboard", lambda: self.notebook.select(0), "dashboard"),
+            ("Kunden", lambda: self.notebook.select(1), "customers"),
+            ("Aufträge", lambda: self.notebook.select(2), "orders"),
+            ("Ersatzteile", lambda: self.notebook.select(3), "parts"),
+            ("Rechnungen", lambda: self.notebook.select(4), "invoices"),
+            ("Finanzen", lambda: self.notebook.select(5), "finances"),
+            ("Kalender", self.open_calendar, "calendar"),  # NEU
+            ("Berichte", self.open_reports, "reports"),    # NEU
+            ("Einstellungen", self.open_settings, "settings")
+        ]
+        if self.sql_profiler is not None:
+            nav_items.append(("SQL-Diagnose", self.open_sql_diagnose, "diagnostics"))
+        if self.ui_profiler is not None:
+            nav_items.append(("UI-Diagnose", self.open_ui_diagnose, "diagnostics"))
+        
+        menu_frame = tk.Frame(self.nav_frame, bg=COLORS["bg_dark"])
+        menu_frame.pack(fill="x", pady=20)
+        
+        self.nav_buttons = []
+        
+        for i, (text, command, icon_name) in enumerate(nav_items):
+            # Frame für jeden Menüpunkt
+            btn_frame = tk.Frame(menu_frame, bg=COLORS["bg_dark"], height=40)
+            btn_frame.pack(fill="x", pady=2)
+            
+            # Hier könnte man Icons hinzufügen, wenn gewünscht
+            # icon = tk.PhotoImage(file=f"icons/{icon_name}.png")
+            # icon_label = tk.Label(btn_frame, image=icon, bg=COLORS["bg_dark"])
+            # icon_label.image = icon
+            # icon_label.pack(side="left", padx=10)
+            
+            # Button mit hover-Effekt
+            btn = tk.Label(btn_frame, text=text, bg=COLORS["bg_dark"], fg=COLORS["text_light"],
+                          font=("Arial", 11), cursor="hand2", pady=8, padx=15)
+            btn.pack(fill="x")
+            
+            # Bind-Events für Hover-Effekt und Klick
+            btn.bind("<Enter>", lambda e, b=btn: b.config(bg=COLORS["bg_light"]))
+            btn.bind("<Leave>", lambda e, b=btn: b.config(bg=COLORS["bg_dark"]))
+            btn.bind("<Button-1>", lambda e, cmd=command: cmd())
+            
+            self.nav_buttons.append((btn, i if i < 6 else None))  # Button mit Index speichern
+    
+    def on_tab_change(self, event):
+        """Aktualisiert die Hervorhebung im Navigationsmenü beim Tab-Wechsel
+        
+        Der gewählte Tab wird beim ersten Anzeigen erstellt; seine Daten werden
+        nur neu geladen, wenn sich die zugrunde liegenden Tabellen geändert haben.
+        """
+        selected_tab = self.notebook.index("current")
+        self.refresh_tab(selected_tab, background=True, force=False)
+        
+        # Alle Buttons zurücksetzen
+        for btn, idx in self.nav_buttons:
+            if idx == selected_tab:
+                btn.config(bg=COLORS["bg_light"], fg=COLORS["accent"], 
+                         font=("Arial", 11, "bold"))
+            else:
+                btn.config(bg=COLORS["bg_dark"], fg=COLORS["text_light"], 
+                         font=("Arial", 11))
+
+    def create_tabs(self):
+        """Legt die Tabs der Anwendung an
+        
+        Es werden nur leere Seiten eingefügt; Widgets und Daten eines Tabs werden
+        erst beim ersten Anzeigen erstellt (siehe refresh_tab).
+        """
+        self.tab_pages = []
+        self.tab_snapshots = []
+        for title, name, create_func, load_func, tables in TABS:
+            page = ttk.Frame(self.notebook)
+            self.notebook.add(page, text=title)
+            self.tab_pages.append(page)
+            self.tab_snapshots.append(None)
+
+    def build_tab(self, index):
+        """Erstellt die Widgets eines Tabs, falls noch nicht geschehen"""
+        title, name, create_func, load_func, tables = TABS[index]
+        if hasattr(self, f"{name}_widgets"):
+            return
+        
+        frame, widgets = create_func(self.tab_pages[index], self)
+        frame.pack(fill="both", expand=True)
+        setattr(self, f"{name}_frame", frame)
+        setattr(self, f"{name}_widgets", widgets)
+
+    def refresh_tab(self, index, background=False, force=True):
+        """Lädt die Daten eines Tabs, sofern er gerade angezeigt wird
+        
+        Nicht angezeigte Tabs werden übersprungen und beim nächsten Anzeigen
+        geladen. Mit force=False wird nur geladen, wenn sich seit dem letzten
+        Laden eine der Tabellen des Tabs geändert hat.
+        """
+        if self.notebook.index("current") != index:
+            return
+        
+        title, name, create_func, load_func, tables = TABS[index]
+        self.build_tab(index)
+        
+        snapshot = table_snapshot(self.conn, tables)
+        if not force and self.tab_snapshots[index] == snapshot:
+            return
+        self.tab_snapshots[index] = snapshot
+        
+        load_func(self, background=background)
+        if name in CATEGORY_TABS:
+            self.load_categories()
+
+    def update_rows(self, name, ids):
+        """Gleicht nach dem Speichern nur die geänderten Zeilen in der Treeview eines Tabs ab
+        
+        name: Name des Tabs (siehe TABS), ids: IDs der angelegten, geänderten
+        oder gelöschten Datensätze. Nicht angezeigte Tabs werden übersprungen;
+        sie werden beim nächsten Anzeigen anhand ihres Tabellenstands neu geladen.
+        """
+        index = next(i for i, tab in enumerate(TABS) if tab[1] == name)
+        if self.notebook.index("current") != index or not hasattr(self, f"{name}_widgets"):
+            return
+        
+        title, name, create_func, load_func, tables = TABS[index]
+        getattr(self, f"{name}_widgets")[f"{name}_model"].update_rows(self.conn, ids)
+        
+        # Der angezeigte Tab ist damit wieder aktuell (ein noch nie geladener bleibt veraltet)
+        if self.tab_snapshots[index] is not None:
+            self.tab_snapshots[index] = table_snapshot(self.conn, tables)
+
+    def select_tab(self, index):
+        """Wechselt zu einem Tab und lädt ihn sofort (z.B. um danach eine Zeile auszuwählen)"""
+        self.notebook.select(index)
+        self.refresh_tab(index, force=False)
+
+    def load_all_data(self):
+        """Lädt alle Daten aus der Datenbank
+
+        Nur der angezeigte Tab wird sofort (im Hintergrund-Thread) geladen,
+        alle anderen gelten als veraltet und werden beim nächsten Anzeigen geladen.
+        """
+        self.tab_snapshots = [None] * len(TABS)
+        self.refresh_tab(self.notebook.index("current"), background=True)
+    
+    def get_data_version(self):
+        """PRAGMA data_version der Hauptverbindung (ändert sich nur durch Schreibzugriffe anderer Verbindungen)"""
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def poll_changes(self):
+        """Prüft, ob ein anderer Arbeitsplatz geschrieben hat, und liest dann das Änderungsprotokoll
+        
+        Solange niemand sonst schreibt, kostet die Abfrage nur das Lesen der
+        data_version; das Protokoll wird erst dann im Hintergrund-Thread gelesen.
+        """
+        self.change_job = None
+        data_version = self.get_data_version()
+        if data_version == self.data_version:
+            self.change_job = self.root.after(CHANGE_POLL_MS, self.poll_changes)
+            return
+        
+        def done(result):
+            self.data_version = data_version
+            self.apply_changes(*result)
+            self.change_job = self.root.after(CHANGE_POLL_MS, self.poll_changes)
+        
+        def failed(error):
+            self.change_job = self.root.after(CHANGE_POLL_MS, self.poll_changes)
+        
+        since = self.change_version
+        self.executor.submit('aenderungen', lambda conn: changes_since(conn, since), done, failed)
+
+    def apply_changes(self, version, changes):
+        """Lädt die von Änderungen betroffenen Tabs bzw. Zeilen neu
+        
+        changes: {Tabelle: {Zeilen-ID: Aktionen}} aus changes_since, None = alles neu laden.
+        Betroffene, nicht angezeigte Tabs gelten als veraltet und werden beim
+        nächsten Anzeigen neu geladen. Betrifft die Änderung im angezeigten Tab
+        nur die Zeilen seiner Treeview, werden genau diese abgeglichen, sonst
+        wird der Tab neu geladen. Änderungen an der Konfiguration laden den
+        Konfigurations-Zwischenspeicher neu.
+        """
+        self.change_version = version
+        
+        # Konfiguration (MwSt., Stundensatz, Firmendaten ...) eines anderen Arbeitsplatzes
+        # übernehmen; die Beobachter (z.B. offene Rechnungsdialoge) werden benachrichtigt
+        if changes is None or 'konfiguration' in changes:
+            reload_config(self.conn)
+        
+        if changes is None:
+            self.load_all_data()
+            return
+        if not changes:
+            return
+        
+        current = self.notebook.index("current")
+        for index, (title, name, create_func, load_func, tables) in enumerate(TABS):
+            affected = [table for table in tables if table in changes]
+            if not affected:
+                continue
+            if index != current:
+                self.tab_snapshots[index] = None
+            elif affected == [TAB_ROW_TABLES.get(name)]:
+                self.update_rows(name, changes[affected[0]])
+                if name in CATEGORY_TABS:
+                    self.load_categories()
+            else:
+                self.refresh_tab(index, background=True, force=False)
+
+    # Implementiere die restlichen Methoden (load_data, update-Methoden, etc.)
+    def load_kunden(self, background=False):
+        # Kunden laden (implementiert in gui.kunden)
+        self.refresh_tab(1, background)
+        
+    def load_auftraege(self, background=False):
+        # Aufträge laden (implementiert in gui.auftraege)
+        self.refresh_tab(2, background)
+        
+    def load_ersatzteile(self, background=False):
+        # Ersatzteile laden (implementiert in gui.ersatzteile)
+        self.refresh_tab(3, background)
+        
+    def load_rechnungen(self, background=False):
+        # Rechnungen laden (implementiert in gui.rechnungen)
+        self.refresh_tab(4, background)
+    
+    def load_categories(self):
+        """Lädt Kategorien für die Dropdowns der bereits erstellten Tabs (Abfrage im Hintergrund-Thread)"""
+        def query(conn):
+            # Kategorien für Ersatzteile und Ausgaben laden
+            return list_kategorien(conn), list_ausgaben_kategorien(conn)
+        
+        def apply(result):
+            kategorien, ausgaben_kategorien = result
+            if hasattr(self, 'ersatzteile_widgets'):
+                self.ersatzteile_widgets['kategorie_combo']['values'] = ["Alle"] + kategorien
+            if hasattr(self, 'finanzen_widgets'):
+                self.finanzen_widgets['ausgaben_kategorie_combo']['values'] = ["Alle"] + ausgaben_kategorien
+        
+        self.executor.submit('kategorien', query, apply)
+        
+    def update_dashboard(self, background=False):
+        """Aktualisiert das Dashboard mit aktuellen Daten"""
+        self.refresh_tab(0, background)
+        
+    def update_finanzen(self, event=None, background=False):
+        """Aktualisiert die Finanzübersicht"""
+        self.refresh_tab(5, background)
+        
+    def on_close(self):
+        """Beendet Hintergrundabfragen und schließt die Datenbankverbindungen"""
+        remove_config_listener(self.on_backup_settings_changed)
+        if self.change_job is not None:
+            self.root.after_cancel(self.change_job)
+            self.change_job = None
+        if self.backup_job is not None:
+            self.root.after_cancel(self.backup_job)
+        self.backup_engine.close()
+        if self.pdf_batch_job is not None:
+            self.pdf_batch_job.close()
+        self.executor.shutdown()
+        self.db_manager.close()
+        if self.sql_profiler is not None and self.sql_profiler.dump_path:
+            try:
+                self.sql_profiler.dump_json(self.sql_profiler.dump_path)
+            except OSError as e:
+                print(f"SQL-Messwerte konnten nicht gespeichert werden: {e}")
+        if self.ui_profiler is not None:
+            self.ui_profiler.uninstall()
+            print(self.ui_profiler.format_report())
+            if self.ui_profiler.dump_path:
+                try:
+                    self.ui_profiler.dump_json(self.ui_profiler.dump_path)
+                except OSError as e:
+                    print(f"UI-Messwerte konnten nicht gespeichert werden: {e}")
+        self.root.destroy()
+        
+    def update_status(self, message):
+        """Aktualisiert die Statusleiste mit einer Nachricht"""
+        self.status_bar.config(text=f"{message} | {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}")
+        
+    # Menü-Funktionen
+    def backup_database(self):
+        """Sichert die Datenbank (im Hintergrund, die Anwendung bleibt bedienbar)"""
+        self.start_backup(manual=True)
+    
+    def start_backup(self, manual=False):
+        """Startet eine Datensicherung; automatische Sicherungen entfallen ohne Änderungen"""
+        if not self.backup_engine.start(only_if_changed=not manual):
+            if manual:
+                messagebox.showinfo("Information", "Es läuft bereits eine Datensicherung.")
+            return
+        
+        self.update_status("Datensicherung gestartet")
+        self.root.after(BACKUP_POLL_MS, self.poll_backup, manual)
+    
+    def poll_backup(self, manual):
+        """Zeigt den Fortschritt der Datensicherung in der Statusleiste an"""
+        if self.backup_engine.running:
+            kopiert, gesamt = self.backup_engine.progress
+            if gesamt:
+                self.update_status(f"Datensicherung: {kopiert * 100 // gesamt} % ({kopiert} von {gesamt} Seiten)")
+            self.root.after(BACKUP_POLL_MS, self.poll_backup, manual)
+            return
+        
+        backup_path, error = self.backup_engine.result
+        if error is not None:
+            self.update_status(f"Datensicherung fehlgeschlagen: {error}")
+            if manual:
+                messagebox.showerror("Fehler", f"Fehler bei der Datensicherung: {error}")
+        elif backup_path is None:
+            self.update_status("Automatische Datensicherung übersprungen (keine Änderungen)")
+        else:
+            self.update_status(f"Datenbank gesichert: {backup_path}")
+            if manual:
+                messagebox.showinfo("Information", f"Datenbank wurde gesichert als:\n{backup_path}")
+    
+    def schedule_backup(self):
+        """Plant die nächste automatische Datensicherung"""
+        backup_intervall, backup_anzahl = get_backup_settings(self.conn)
+        self.backup_engine.keep = backup_anzahl
+        if backup_intervall > 0:
+            self.backup_job = self.root.after(backup_intervall * 60 * 1000, self.run_scheduled_backup)
+        else:
+            self.backup_job = None
+    
+    def on_backup_settings_changed(self, changes):
+        """Plant die automatische Datensicherung mit den neuen Einstellungen neu"""
+        if self.backup_job is not None:
+            self.root.after_cancel(self.backup_job)
+        self.schedule_backup()
+    
+    def run_scheduled_backup(self):
+        """Automatische Datensicherung, danach die nächste planen"""
+        self.start_backup(manual=False)
+        self.schedule_backup()
+    
+    def export_data(self):
+        """Exportiert Daten aus der Datenbank"""
+        ExportDialog(self.root, "Daten exportieren", self.conn)
+    
+    def open_settings(self):
+        """Öffnet die Einstellungen"""
+        from dialogs.settings_dialog import SettingsDialog
+        settings_dialog = SettingsDialog(self.root, self.conn)
+        # Nach Schließen des Dialogs, Daten neu laden
+        self.load_all_data()
+    
+    def show_help(self):
+        """Zeigt die Hilfe an"""
+        help_text = """
+AutoMeister - Werkstattverwaltung
+=================================
+
+Diese Software ermöglicht die Verwaltung einer Autowerkstatt mit folgenden Funktionen:
+
+- Kundenverwaltung: Erfassen und verwalten von Kundendaten und Fahrzeugen
+- Auftragsverwaltung: Erfassen, bearbeiten und abrechnen von Werkstattaufträgen
+- Ersatzteilverwaltung: Lagerverwaltung für Ersatzteile inkl. Bestandsführung
+- Rechnungswesen: Erstellung von Rechnungen und Überwachung von Zahlungseingängen
+- Finanzen: Übersicht über Einnahmen, Ausgaben, Gewinn und Lagerwert
+- Berichte: Verschiedene Auswertungen und Statistiken
+
+Bei Fragen wenden Sie sich an den Support.
+        """
+        
+        HilfeDialog(self.root, "Hilfe zu AutoMeister", help_text)
+    
+    def show_about(self):
+        """Zeigt Informationen über die Software an"""
+        about_text = """
+AutoMeister - Werkstattverwaltung
+=================================
+
+Version: 2.0.0
+Erstellt: 2025
+
+Eine Anwendung zur einfachen Verwaltung einer Autowerkstatt.
+
+Entwickelt mit Python und Tkinter.
+        """
+        
+        HilfeDialog(self.root, "Über AutoMeister", about_text)
+    
+    # Aktionen für die Schnellzugriff-Buttons
+    def new_kunde(self):
+        from dialogs.kunden_dialog import KundenDialog
+        kundendialog = KundenDialog(self.root, "Neuer Kunde", None, self.conn)
+        if kundendialog.result:
+            self.update_rows('kunden', [kundendialog.kunden_id])
+            self.update_status("Neuer Kunde angelegt")
+            
+    def edit_kunde(self):
+        from gui.kunden import get_selected_kunden_id
+        from dialogs.kunden_dialog import KundenDialog
+        
+        kunden_id = get_selected_kunden_id(self)
+        if not kunden_id:
+            messagebox.showinfo("Information", "Bitte wählen Sie einen Kunden aus.")
+            return
+            
+        kundendialog = KundenDialog(self.root, "Kunde bearbeiten", kunden_id, self.conn)
+        if kundendialog.result:
+            self.update_rows('kunden', [kunden_id])
+            self.update_status("Kundendaten aktualisiert")
+    
+    def new_auftrag(self):
+        """Erstellt einen neuen Auftrag"""
+        from dialogs.auftrags_dialog import AuftragsDialog
+        auftragsdialog = AuftragsDialog(self.root, "Neuer Auftrag", None, self.conn)
+        if auftragsdialog.result:
+            self.update_rows('auftraege', [auftragsdialog.auftrag_id])
+            self.update_status("Neuer Auftrag angelegt")
+            
+            # Zum Aufträge-Tab wechseln
+            self.notebook.select(2)  # Index 2 = Aufträge-Tab
+            
+    def new_rechnung(self):
+        """Erstellt eine neue Rechnung"""
+        from dialogs.rechnungs_dialog import RechnungsDialog
+        rechnungsdialog = RechnungsDialog(self.root, "Neue Rechnung", None, self.conn)
+        if rechnungsdialog.result:
+            self.update_rows('rechnungen', [rechnungsdialog.rechnung_id])
+            self.update_status("Neue Rechnung erstellt")
+            
+            # Zum Rechnungen-Tab wechseln
+            self.notebook.select(4)  # Index 4 = Rechnungen-Tab
+            
+    def new_ersatzteil(self):
+        """Erstellt ein neues Ersatzteil"""
+        from dialogs.ersatzteil_dialog import ErsatzteilDialog
+        ersatzteildialog = ErsatzteilDialog(self.root, "Neuer Artikel", None, self.conn)
+        if ersatzteildialog.result:
+            self.update_rows('ersatzteile', [ersatzteildialog.ersatzteil_id])
+            self.load_categories()
+            self.update_status("Neuer Artikel angelegt")
+            
+            # Zum Ersatzteile-Tab wechseln
+            self.notebook.select(3)  # Index 3 = Ersatzteile-Tab
+
+    # Neue Methoden für die erweiterten Funktionen
+    def open_calendar(self):
+        """Öffnet den Kalender zur Terminverwaltung"""
+        from gui.calendar_manager import KalenderVerwaltung
+        KalenderVerwaltung(self.root, self.conn)
+    
+    def open_sql_diagnose(self):
+        """Öffnet die Auswertung der SQL-Messung (nur mit AUTOMEISTER_SQL_PROFIL)"""
+        from dialogs.diagnose_dialog import SqlDiagnoseDialog
+        SqlDiagnoseDialog(self.root, self.sql_profiler)
+    
+    def open_ui_diagnose(self):
+        """Öffnet die Auswertung der Tk-Callbacks (nur mit AUTOMEISTER_UI_PROFIL)"""
+        from dialogs.diagnose_dialog import UiDiagnoseDialog
+        UiDiagnoseDialog(self.root, self.ui_profiler)
+    
+    def open_reports(self):
+        """Öffnet das erweiterte Berichtswesen"""
+        # Berichtswesen (matplotlib) erst beim ersten Öffnen laden
+        from gui.reports import ErweitertesBerichtswesen
+        
+        # Berichte lesen über eine eigene Verbindung aus dem Lese-Pool, damit sie die
+        # Schreibverbindung nicht belegen. Nur im WAL-Modus blockieren lange Auswertungen
+        # das Speichern nicht; mit dem Rollback-Journal (Standard) wartet das Speichern
+        # bis zum Ende der laufenden Abfrage (siehe db.database, BUSY_TIMEOUT_S)
+        read_conn = self.db_manager.acquire_reader(timeout=0)
+        if read_conn is None:
+            ErweitertesBerichtswesen(self.root, self.conn)
+            return
+            
+        berichte = ErweitertesBerichtswesen(self.root, read_conn)
+        
+        def release_reader(event):
+            if event.widget is berichte.dialog:
+                self.db_manager.release_reader(read_conn)
+                
+        berichte.dialog.bind("<Destroy>", release_reader, add="+")
\ No newline at end of file
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Entprellte Suche für Suchfelder
+
+Der SearchController sammelt die Tastendrücke eines Suchfelds und startet
+die Suche erst, wenn für die eingestellte Wartezeit (Konfiguration
+suche_verzoegerung) nichts mehr eingegeben wurde. Tasten, die den Suchbegriff
+nicht ändern (Pfeiltasten, Umschalt ...), lösen keine Suche aus; Enter sucht
+sofort. Sobald sich der Begriff ändert, wird die noch laufende Suche zum
+alten Begriff abgebrochen.
+"""
+
+# Wartezeit nach der letzten Eingabe in Millisekunden (Standardwert der Konfiguration)
+SEARCH_DELAY_MS = 250
+
+
+class SearchController:
+    """Verbindet ein Suchfeld mit einer Suchfunktion
+
+    search(term, previous): führt die Suche aus; previous ist der zuletzt
+                            gesuchte Begriff (None beim ersten Mal)
+    cancel():               bricht eine laufende Suche ab (optional)
+    """
+    def __init__(self, entry, variable, search, cancel=None, delay_ms=SEARCH_DELAY_MS):
+        self.entry = entry
+        self.variable = variable
+        self.search = search
+        self.cancel = cancel
+        self.delay_ms = delay_ms
+
+        self.last_term = None
+        self._job = None
+
+        entry.bind("<KeyRelease>", self.on_key, add="+")
+        entry.bind("<Return>", self.flush, add="+")
+        entry.bind("<Destroy>", self.on_destroy, add="+")
+
+    def current_term(self):
+        return self.variable.get().strip()
+
+    def on_key(self, event=None):
+        """Plant die Suche nach der Wartezeit neu ein, wenn sich der Begriff geändert hat"""
+        if self._job is not None:
+            self.entry.after_cancel(self._job)
+            self._job = None
+
+        if self.current_term() == self.last_term:
+            return
+
+        # Das Ergebnis einer noch laufenden Suche wäre veraltet; da sie eventuell
+        # nicht mehr angezeigt wird, gilt danach auch der alte Begriff als ungesucht
+        if self.cancel is not None:
+            self.cancel()
+            self.last_term = None
+        self._job = self.entry.after(self.delay_ms, self.run)
+
+    def flush(self, event=None):
+        """Sucht sofort (z.B. bei Enter)"""
+        if self._job is not None:
+            self.entry.after_cancel(self._job)
+            self._job = None
+        if self.current_term() != self.last_term:
+            self.run()
+
+    def run(self):
+        """Führt die Suche mit dem aktuellen Begriff aus"""
+        self._job = None
+        term = self.current_term()
+        previous, self.last_term = self.last_term, term
+        self.search(term, previous)
+
+    def reset(self):
+        """Vergisst den zuletzt gesuchten Begriff (z.B. nach dem Neuladen der Liste)"""
+        if self._job is not None:
+            self.entry.after_cancel(self._job)
+            self._job = None
+        self.last_term = None
+
+    def on_destroy(self, event):
+        if event.widget is self.entry and self._job is not None:
+            self.entry.after_cancel(self._job)
+            self._job = None
\ No newline at end of file
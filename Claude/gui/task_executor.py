@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Hintergrund-Ausführung von Datenbankabfragen
+
+Abfragen laufen in einem Worker-Thread mit eigener Lese-Verbindung. Die
+Ergebnisse werden über eine Queue zurückgegeben, die der Tk-Hauptthread
+per root.after abfragt; die Callbacks laufen daher immer im Hauptthread
+und dürfen Widgets verändern.
+
+Aufgaben mit demselben Schlüssel ersetzen sich gegenseitig: wird eine neue
+Aufgabe eingereicht, bevor die vorherige fertig ist (schnelles Tippen im
+Suchfeld, schneller Tab-Wechsel), wird die ältere abgebrochen und ihr
+Ergebnis verworfen.
+"""
+
+import logging
+import queue
+import sqlite3
+import threading
+
+# Abfrageintervall der Ergebnis-Queue in Millisekunden
+POLL_INTERVAL_MS = 30
+
+
+class Task:
+    """Eine eingereichte Aufgabe"""
+
+    def __init__(self, executor, key, work, on_done, on_error):
+        self.executor = executor
+        self.key = key
+        self.work = work
+        self.on_done = on_done
+        self.on_error = on_error
+        self.cancelled = False
+
+    def cancel(self):
+        """Bricht die Aufgabe ab; ein bereits berechnetes Ergebnis wird verworfen"""
+        self.executor.cancel_task(self)
+
+
+class TaskExecutor:
+    """Führt Funktionen der Form work(conn) in einem Worker-Thread aus"""
+
+    def __init__(self, root, db_manager, poll_interval=POLL_INTERVAL_MS):
+        self.root = root
+        self.db_manager = db_manager
+        self.poll_interval = poll_interval
+
+        self._tasks = queue.Queue()
+        self._results = queue.Queue()
+        self._latest = {}
+        self._pending = 0
+        self._poll_id = None
+
+        # Verbindung und laufende Aufgabe des Workers (für interrupt())
+        self._lock = threading.Lock()
+        self._conn = None
+        self._running = None
+
+        self._thread = threading.Thread(target=self._worker, name="db-worker", daemon=True)
+        self._thread.start()
+
+    def submit(self, key, work, on_done=None, on_error=None):
+        """Reicht eine Aufgabe ein
+
+        key:      Schlüssel, über den neuere Aufgaben ältere ersetzen (None = nie ersetzen)
+        work:     Funktion work(conn), läuft im Worker-Thread mit einer Lese-Verbindung
+        on_done:  Callback on_done(ergebnis) im Tk-Hauptthread
+        on_error: Callback on_error(exception) im Tk-Hauptthread
+        """
+        if key is not None and key in self._latest:
+            self.cancel_task(self._latest[key])
+
+        task = Task(self, key, work, on_done, on_error)
+        if key is not None:
+            self._latest[key] = task
+
+        self._pending += 1
+        self._tasks.put(task)
+
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.poll_interval, self._poll)
+        return task
+
+    @property
+    def pending(self):
+        """Anzahl eingereichter Aufgaben, deren Ergebnis noch nicht ausgeliefert wurde"""
+        return self._pending
+
+    def cancel(self, key):
+        """Bricht die neueste Aufgabe mit dem Schlüssel ab"""
+        task = self._latest.get(key)
+        if task is not None:
+            self.cancel_task(task)
+
+    def cancel_task(self, task):
+        """Bricht eine Aufgabe ab und unterbricht sie, falls sie gerade läuft"""
+        task.cancelled = True
+        with self._lock:
+            if self._running is task and self._conn is not None:
+                # Unterbricht die laufende SQLite-Abfrage (threadsicher)
+                self._conn.interrupt()
+
+    def shutdown(self):
+        """Bricht alle Aufgaben ab und beendet den Worker-Thread"""
+        for task in list(self._latest.values()):
+            self.cancel_task(task)
+        self._tasks.put(None)
+
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+
+    def _worker(self):
+        """Arbeitet die Aufgaben im Hintergrund ab"""
+        try:
+            conn = self.db_manager.open_reader()
+        except sqlite3.Error as e:
+            logging.error(f"Lese-Verbindung für Hintergrundabfragen nicht verfügbar: {e}")
+            conn = None
+
+        with self._lock:
+            self._conn = conn
+
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                break
+
+            result, error = None, None
+            if not task.cancelled:
+                with self._lock:
+                    self._running = task
+                try:
+                    if conn is None:
+                        raise sqlite3.OperationalError("Keine Lese-Verbindung verfügbar")
+                    result = task.work(conn)
+                except Exception as e:
+                    error = e
+                finally:
+                    with self._lock:
+                        self._running = None
+
+            self._results.put((task, result, error))
+
+        with self._lock:
+            self._conn = None
+        if conn is not None:
+            conn.close()
+
+    def _poll(self):
+        """Liefert fertige Ergebnisse im Tk-Hauptthread aus"""
+        self._poll_id = None
+
+        while True:
+            try:
+                task, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            self._pending -= 1
+            if self._latest.get(task.key) is task:
+                del self._latest[task.key]
+
+            # Ersetzte oder abgebrochene Aufgaben nicht mehr ausliefern
+            if task.cancelled:
+                continue
+
+            try:
+                if error is not None:
+                    if task.on_error:
+                        task.on_error(error)
+                    else:
+                        logging.error(f"Fehler bei Hintergrundabfrage '{task.key}': {error}")
+                elif task.on_done:
+                    task.on_done(result)
+            except Exception as e:
+                # Fehler im Callback dürfen die Auslieferung weiterer Ergebnisse nicht stoppen
+                logging.error(f"Fehler bei Verarbeitung der Hintergrundabfrage '{task.key}': {e}")
+
+        if self._pending > 0:
+            self._poll_id = self.root.after(self.poll_interval, self._poll)
\ No newline at end of file
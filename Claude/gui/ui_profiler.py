@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Messung der Tk-Callbacks (optional)
+
+Der CallbackProfiler ersetzt tkinter.CallWrapper, über den Tkinter alle
+Python-Callbacks aufruft (command=..., bind, after, Variablen-Traces). Für
+jeden Handler wird gemessen, wie lange er den Hauptthread blockiert. Zeit in
+verschachtelten Ereignisschleifen (wait_window, update, modale Standarddialoge)
+zählt nicht dazu, die dort ausgeführten Callbacks werden einzeln gemessen.
+
+Blockiert ein Callback länger als die Schwelle, nimmt ein Überwachungs-Thread
+in kurzen Abständen Stack-Proben des Hauptthreads; die häufigste Probe zeigt,
+wo die Zeit verbracht wurde.
+
+Aktiviert wird die Messung in der Anwendung über Umgebungsvariablen
+(siehe profiler_from_environment):
+    AUTOMEISTER_UI_PROFIL=1                Messung einschalten
+    AUTOMEISTER_UI_PROFIL=ui_profil.json   zusätzlich beim Beenden als JSON speichern
+    AUTOMEISTER_UI_LANGSAM_MS=50           Schwelle für Blockaden
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import tkinter
+import tkinter.commondialog
+import traceback
+from collections import Counter
+from datetime import datetime
+
+from utils.latency import LatencyProfiler, LatencyStats, settings_from_environment
+
+# Umgebungsvariablen zum Einschalten der Messung
+PROFIL_ENV = "AUTOMEISTER_UI_PROFIL"
+SCHWELLE_ENV = "AUTOMEISTER_UI_LANGSAM_MS"
+
+# Callbacks ab dieser Blockierzeit (ms) gelten als Blockade
+STALL_THRESHOLD_MS = 50.0
+
+# Abstand der Stack-Proben während einer Blockade in ms
+SAMPLE_INTERVAL_MS = 10
+
+# Höchstzahl Stack-Proben pro Blockade und Anzahl Stack-Ebenen pro Probe
+MAX_SAMPLES = 50
+STACK_DEPTH = 12
+
+# Obergrenzen der Histogramm-Klassen in ms (die letzte Klasse ist offen)
+BUCKETS_MS = (1, 5, 10, 16, 33, 50, 100, 250, 500, 1000, 2500)
+
+# Anzahl gemerkter Blockaden
+STALL_LOG_SIZE = 100
+
+# Tkinter-Methoden, die eine verschachtelte Ereignisschleife ausführen
+NESTED_LOOPS = (
+    (tkinter.Misc, 'mainloop'),
+    (tkinter.Misc, 'update'),
+    (tkinter.Misc, 'wait_window'),
+    (tkinter.Misc, 'wait_variable'),
+    (tkinter.Misc, 'wait_visibility'),
+    (tkinter.commondialog.Dialog, 'show'),
+)
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def handler_name(func):
+    """Lesbarer Name eines Callbacks, z.B. 'gui.auftraege.show_auftrag_details'
+
+    Bei after-Aufrufen wird die übergebene Funktion statt der Tkinter-Hülle
+    angegeben, bei Lambdas zusätzlich Datei und Zeile.
+    """
+    code = getattr(func, '__code__', None)
+    if code is not None and code.co_name == 'callit' and 'func' in code.co_freevars:
+        func = func.__closure__[code.co_freevars.index('func')].cell_contents
+
+    function = getattr(func, '__func__', func)
+    code = getattr(function, '__code__', None)
+    if code is None:
+        return type(func).__qualname__
+
+    name = f"{function.__module__}.{function.__qualname__}"
+    if '<lambda>' in name:
+        filename = code.co_filename
+        if filename.startswith(APP_DIR):
+            filename = os.path.relpath(filename, APP_DIR)
+        name += f" ({filename}:{code.co_firstlineno})"
+    return name
+
+
+class _Measurement:
+    """Ein laufender Callback"""
+    __slots__ = ('name', 'start', 'excluded', 'paused_at', 'samples')
+
+    def __init__(self, name):
+        self.name = name
+        self.start = time.perf_counter()
+        self.excluded = 0.0
+        self.paused_at = None
+        self.samples = []
+
+    def blocking(self, now):
+        """Bisherige Blockierzeit in Sekunden (ohne verschachtelte Ereignisschleifen)"""
+        paused = now - self.paused_at if self.paused_at is not None else 0.0
+        return now - self.start - self.excluded - paused
+
+
+class HandlerStats(LatencyStats):
+    """Gesammelte Messwerte eines Callbacks"""
+    buckets_ms = BUCKETS_MS
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.stalls = 0
+        self.stacks = Counter()
+
+    def add(self, elapsed_ms, stall, samples):
+        self.add_time(elapsed_ms)
+        if stall:
+            self.stalls += 1
+            self.stacks.update(samples)
+
+    def as_dict(self):
+        stack, samples = self.stacks.most_common(1)[0] if self.stacks else (None, 0)
+        return {
+            'handler': self.name,
+            **super().as_dict(),
+            'blockaden': self.stalls,
+            # Häufigste Stack-Probe aller Blockaden und Anteil der Proben
+            'haeufigster_stack': stack,
+            'stack_anteil': round(samples / sum(self.stacks.values()), 3) if self.stacks else None,
+        }
+
+
+def _format_stack(frame):
+    """Stack eines Threads als Text (innerste Ebene zuletzt), ohne diese Messung"""
+    entries = [entry for entry in traceback.extract_stack(frame) if entry.filename != __file__]
+    lines = []
+    for entry in entries[-STACK_DEPTH:]:
+        filename = entry.filename
+        if filename.startswith(APP_DIR):
+            filename = os.path.relpath(filename, APP_DIR)
+        lines.append(f"{filename}:{entry.lineno} ({entry.name})")
+    return "\n".join(lines)
+
+
+class CallbackProfiler(LatencyProfiler):
+    """Misst die Blockierzeit aller Tk-Callbacks im Hauptthread"""
+    stats_class = HandlerStats
+
+    def __init__(self, stall_threshold_ms=STALL_THRESHOLD_MS, dump_path=None,
+                 sample_interval_ms=SAMPLE_INTERVAL_MS):
+        super().__init__(stall_threshold_ms, dump_path, STALL_LOG_SIZE)
+        self.sample_interval_ms = sample_interval_ms
+
+        # Laufende Callbacks des Hauptthreads (verschachtelt, innerster zuletzt)
+        self._active = []
+        self._main_thread = None
+        self._originals = []
+        self._stop = threading.Event()
+        self._watchdog = None
+
+    def install(self):
+        """Aktiviert die Messung für alle danach registrierten Callbacks (im Tk-Hauptthread aufrufen)"""
+        if self._originals:
+            return
+        self._main_thread = threading.get_ident()
+        profiler = self
+        call_wrapper = tkinter.CallWrapper
+
+        class ProfiledCallWrapper(call_wrapper):
+            def __call__(self, *args):
+                return profiler.call(self.func, call_wrapper.__call__, self, *args)
+
+        self._originals.append((tkinter, 'CallWrapper', call_wrapper))
+        tkinter.CallWrapper = ProfiledCallWrapper
+
+        for owner, name in NESTED_LOOPS:
+            original = getattr(owner, name)
+            self._originals.append((owner, name, original))
+            setattr(owner, name, self._nested_loop(original))
+
+        self._stop.clear()
+        self._watchdog = threading.Thread(target=self._watch, name="ui-profiler", daemon=True)
+        self._watchdog.start()
+
+    def uninstall(self):
+        """Stellt die ursprünglichen Tkinter-Funktionen wieder her (bestehende Callbacks bleiben gemessen)"""
+        for owner, name, original in reversed(self._originals):
+            setattr(owner, name, original)
+        self._originals = []
+        self._stop.set()
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+
+    def call(self, func, call, *args):
+        """Führt call(*args) als Callback func aus und misst die Blockierzeit"""
+        if threading.get_ident() != self._main_thread:
+            return call(*args)
+
+        measurement = _Measurement(handler_name(func))
+        self._active.append(measurement)
+        try:
+            return call(*args)
+        finally:
+            self._active.pop()
+            self.record(measurement, measurement.blocking(time.perf_counter()))
+
+    def _nested_loop(self, original):
+        """Hülle um eine Tkinter-Methode, deren Laufzeit nicht als Blockade zählt"""
+        profiler = self
+
+        def nested_loop(*args, **kwargs):
+            if threading.get_ident() != profiler._main_thread or not profiler._active:
+                return original(*args, **kwargs)
+            outer = profiler._active[-1]
+            outer.paused_at = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                outer.excluded += time.perf_counter() - outer.paused_at
+                outer.paused_at = None
+
+        nested_loop.__name__ = original.__name__
+        nested_loop.__doc__ = original.__doc__
+        return nested_loop
+
+    def _watch(self):
+        """Überwachungs-Thread: nimmt Stack-Proben, solange ein Callback zu lange blockiert"""
+        interval = self.sample_interval_ms / 1000
+        while not self._stop.wait(interval):
+            try:
+                measurement = self._active[-1]
+            except IndexError:
+                continue
+            if (measurement.paused_at is not None or len(measurement.samples) >= MAX_SAMPLES
+                    or measurement.blocking(time.perf_counter()) * 1000 < self.threshold_ms):
+                continue
+            frame = sys._current_frames().get(self._main_thread)
+            if frame is not None:
+                measurement.samples.append(_format_stack(frame))
+
+    def record(self, measurement, elapsed):
+        """Verbucht einen beendeten Callback; Blockaden werden protokolliert"""
+        elapsed_ms = elapsed * 1000
+        stall = elapsed_ms >= self.threshold_ms
+        samples = list(measurement.samples)
+
+        with self._lock:
+            stats = self._stats_for(measurement.name)
+            stats.add(elapsed_ms, stall, samples)
+            if stall:
+                stack = Counter(samples).most_common(1)[0][0] if samples else None
+                self._log.append({
+                    'zeitpunkt': datetime.now().isoformat(timespec='seconds'),
+                    'handler': measurement.name,
+                    'dauer_ms': round(elapsed_ms, 3),
+                    'proben': len(samples),
+                    'stack': stack,
+                })
+
+        if stall:
+            logging.warning(f"Tk-Callback {measurement.name} blockierte {elapsed_ms:.0f} ms"
+                            + (f", häufigste Stelle:\n  {stack.replace(chr(10), chr(10) + '  ')}" if stack else ""))
+
+    def handlers(self):
+        """Messwerte aller Callbacks, nach Gesamtzeit absteigend"""
+        return self._sorted_stats()
+
+    def stalls(self):
+        """Die zuletzt protokollierten Blockaden, neueste zuerst"""
+        return self._recent_log()
+
+    def as_dict(self):
+        return {
+            **super().as_dict(),
+            'handler': self.handlers(),
+            'blockaden': self.stalls(),
+        }
+
+    def format_report(self, limit=30):
+        """Bericht der Callbacks mit der höchsten Blockierzeit als Text"""
+        lines = [f"Tk-Callbacks seit {self.started.strftime('%d.%m.%Y %H:%M:%S')} "
+                 f"(Blockade ab {self.threshold_ms:g} ms)",
+                 f"{'Anzahl':>7} {'Gesamt ms':>10} {'Mittel ms':>10} {'p95 ms':>8} {'Max ms':>9} "
+                 f"{'Blockaden':>9}  Handler"]
+        for entry in self.handlers()[:limit]:
+            lines.append(f"{entry['anzahl']:>7} {entry['gesamt_ms']:>10.1f} {entry['mittel_ms']:>10.2f} "
+                         f"{entry['p95_ms']:>8g} {entry['max_ms']:>9.1f} {entry['blockaden']:>9}  {entry['handler']}")
+        return "\n".join(lines)
+
+
+def profiler_from_environment(environ=None):
+    """CallbackProfiler gemäß AUTOMEISTER_UI_PROFIL / AUTOMEISTER_UI_LANGSAM_MS (None = Messung aus)"""
+    settings = settings_from_environment(PROFIL_ENV, SCHWELLE_ENV, STALL_THRESHOLD_MS, environ)
+    return CallbackProfiler(*settings) if settings else None
\ No newline at end of file
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Virtuelles Listenmodell für große Treeview-Tabellen
+
+Statt alle Datensätze mit einem vollständigen SELECT in die Treeview zu
+schreiben, werden die Zeilen seitenweise per Keyset-Paginierung aus SQLite
+geladen. Beim Öffnen eines Tabs wird nur die erste Seite eingefügt; weitere
+Seiten folgen erst, wenn der Benutzer in die Nähe des Tabellenendes scrollt.
+Die Abfragen selbst stehen in services.listen.
+"""
+
+from services.listen import PAGE_SIZE, first_page, fetch_page, fetch_rows_by_id
+
+# Nachladen, sobald weniger als diese Anzahl Zeilen unterhalb des sichtbaren Bereichs liegt
+PREFETCH_ROWS = 50
+
+
+class VirtualTreeModel:
+    """Lädt die Zeilen einer Treeview seitenweise aus der Datenbank nach"""
+
+    def __init__(self, tree, scrollbar, liste, row_tags=None, page_size=PAGE_SIZE, prefetch=PREFETCH_ROWS):
+        """
+        tree:      Die zu befüllende Treeview
+        scrollbar: Vertikale Scrollbar der Treeview
+        liste:     Spalten, Tabellen und Sortierung (services.listen.Liste)
+        row_tags:  Optionale Funktion, die aus einer Zeile die Treeview-Tags ermittelt
+        """
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.liste = liste
+        self.row_tags = row_tags
+        self.page_size = page_size
+        self.prefetch = prefetch
+
+        self.conn = None
+        self.where_clause = ""
+        self.params = ()
+        self.last_key = None
+        self.exhausted = True
+        self.total = 0
+        self._fetch_pending = False
+
+        # Sortierschlüssel (sort_key, id) der geladenen Zeilen je iid, für update_rows()
+        self._sort_keys = {}
+        # False, solange Suchtreffer in eigener Reihenfolge angezeigt werden (load_ids)
+        self._ordered = True
+        self._task = None
+
+        # Scroll-Position überwachen, um rechtzeitig nachzuladen
+        self.tree.configure(yscrollcommand=self.on_yscroll)
+
+    def load(self, conn, where_clause="", params=()):
+        """Leert die Tabelle und lädt die erste Seite für den angegebenen Filter"""
+        self.cancel_pending()
+        total, rows = self.query_first_page(conn, where_clause, params)
+        return self.apply_first_page(conn, where_clause, params, total, rows)
+
+    def load_async(self, executor, conn, where_clause="", params=(), on_done=None):
+        """Wie load(), die Abfragen laufen jedoch im Hintergrund-Thread des Executors
+
+        conn ist die Verbindung des Hauptthreads, über die später weitere Seiten
+        nachgeladen werden. on_done(anzahl) wird im Tk-Hauptthread aufgerufen.
+        """
+        def apply(result):
+            total = self.apply_first_page(conn, where_clause, params, *result)
+            if on_done:
+                on_done(total)
+
+        self._task = executor.submit(
+            self.task_key,
+            lambda worker_conn: self.query_first_page(worker_conn, where_clause, params),
+            apply
+        )
+        return self._task
+
+    def cancel_pending(self):
+        """Verwirft eine noch laufende Hintergrundabfrage des Modells"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    @property
+    def task_key(self):
+        """Schlüssel für Hintergrundaufgaben; eine neue Abfrage ersetzt die vorherige"""
+        return ('virtual_tree', id(self))
+
+    def query_first_page(self, conn, where_clause="", params=()):
+        """Ermittelt Gesamtanzahl und erste Seite (ohne die Treeview zu verändern)"""
+        return first_page(conn, self.liste, where_clause, params, self.page_size)
+
+    def apply_first_page(self, conn, where_clause, params, total, rows):
+        """Ersetzt den Inhalt der Treeview durch die erste Seite"""
+        self.conn = conn
+        self.where_clause = where_clause
+        self.params = tuple(params)
+        self.total = total
+        self.last_key = None
+        self.exhausted = False
+        self._fetch_pending = False
+        self._ordered = True
+        self._sort_keys = {}
+
+        self.tree.delete(*self.tree.get_children())
+        self._insert_page(rows)
+        return self.total
+
+    def fetch_next_page(self):
+        """Lädt die nächste Seite hinter der zuletzt geladenen Zeile"""
+        self._fetch_pending = False
+        if self.exhausted or self.conn is None:
+            return 0
+
+        rows = fetch_page(self.conn, self.liste, self.where_clause, self.params, self.last_key, self.page_size)
+        return self._insert_page(rows)
+
+    def _insert_page(self, rows):
+        """Fügt eine Seite (Zeilen inkl. Sortier- und ID-Schlüssel) am Ende ein"""
+        for row in rows:
+            values = row[:-2]
+            tags = self.row_tags(values) if self.row_tags else ()
+            iid = str(row[-1])
+            if not self.tree.exists(iid):
+                self.tree.insert('', 'end', iid=iid, values=values, tags=tags)
+                self._sort_keys[iid] = (row[-2], row[-1])
+
+        if rows:
+            self.last_key = (rows[-1][-2], rows[-1][-1])
+        if len(rows) < self.page_size:
+            self.exhausted = True
+
+        return len(rows)
+
+    def load_ids(self, conn, ids, where_clause="", params=()):
+        """Zeigt nur die Zeilen mit den angegebenen IDs in deren Reihenfolge an (z.B. Suchtreffer nach Relevanz)"""
+        self.cancel_pending()
+        rows_by_id = self.query_ids(conn, ids, where_clause, params)
+        return self.apply_ids(conn, ids, rows_by_id, where_clause, params)
+
+    def load_ids_async(self, executor, conn, find_ids, where_clause="", params=(), on_done=None):
+        """Wie load_ids(), ermittelt die IDs aber erst im Hintergrund über find_ids(worker_conn)
+
+        on_done(anzahl) wird im Tk-Hauptthread aufgerufen.
+        """
+        def work(worker_conn):
+            ids = find_ids(worker_conn)
+            return ids, self.query_ids(worker_conn, ids, where_clause, params)
+
+        def apply(result):
+            total = self.apply_ids(conn, *result, where_clause=where_clause, params=params)
+            if on_done:
+                on_done(total)
+
+        self._task = executor.submit(self.task_key, work, apply)
+        return self._task
+
+    def query_ids(self, conn, ids, where_clause="", params=(), with_sort_key=False):
+        """Liest die Zeilen zu den IDs (ohne die Treeview zu verändern)
+
+        Mit with_sort_key=True enthält jede Zeile als letzten Wert den Sortierschlüssel.
+        """
+        return fetch_rows_by_id(conn, self.liste, ids, where_clause, params, with_sort_key)
+
+    def apply_ids(self, conn, ids, rows_by_id, where_clause="", params=()):
+        """Ersetzt den Inhalt der Treeview durch die Zeilen zu den IDs"""
+        self.conn = conn
+        self.where_clause = where_clause
+        self.params = tuple(params)
+        self.last_key = None
+        self.exhausted = True
+        self._fetch_pending = False
+        self._ordered = False
+        self._sort_keys = {}
+
+        self.tree.delete(*self.tree.get_children())
+
+        for row_id in ids:
+            values = rows_by_id.get(row_id)
+            if values is None or self.tree.exists(str(row_id)):
+                continue
+            tags = self.row_tags(values) if self.row_tags else ()
+            self.tree.insert('', 'end', iid=str(row_id), values=values, tags=tags)
+
+        self.total = len(self.tree.get_children())
+        return self.total
+
+    def update_rows(self, conn, ids):
+        """Gleicht einzelne Zeilen mit der Datenbank ab, ohne die Treeview neu aufzubauen
+
+        Für jede ID wird die Zeile neu gelesen: Vorhandene Zeilen erhalten die
+        neuen Werte (und rücken bei geändertem Sortierschlüssel an ihre neue
+        Position), gelöschte oder nicht mehr zum Filter passende Zeilen werden
+        entfernt, neue Zeilen im bereits geladenen Bereich eingefügt. Auswahl
+        und Scroll-Position bleiben erhalten. Bei angezeigten Suchtreffern
+        (load_ids) werden nur die vorhandenen Zeilen abgeglichen.
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids or self.conn is None:
+            return 0
+
+        first_visible = self.tree.yview()[0]
+        rows_by_id = self.query_ids(conn, ids, self.where_clause, self.params, with_sort_key=True)
+        changed = 0
+
+        for row_id in ids:
+            iid = str(row_id)
+            exists = self.tree.exists(iid)
+            row = rows_by_id.get(row_id)
+
+            if row is None:
+                if exists:
+                    self.tree.delete(iid)
+                    self._sort_keys.pop(iid, None)
+                    self.total -= 1
+                    changed += 1
+                continue
+
+            values, key = row[:-1], (row[-1], row_id)
+            tags = self.row_tags(values) if self.row_tags else ()
+
+            if not self._ordered:
+                if exists:
+                    self.tree.item(iid, values=values, tags=tags)
+                    changed += 1
+                continue
+
+            if exists and self._sort_keys.get(iid) == key:
+                self.tree.item(iid, values=values, tags=tags)
+                changed += 1
+                continue
+
+            if exists:
+                self.tree.delete(iid)
+                self._sort_keys.pop(iid, None)
+            elif self._in_loaded_range(key):
+                # Neue Zeile im geladenen Bereich (dahinter liegende kommen über das Nachladen)
+                self.total += 1
+
+            if self._in_loaded_range(key):
+                self.tree.insert('', self._insert_index(key), iid=iid, values=values, tags=tags)
+                self._sort_keys[iid] = key
+            changed += 1
+
+        if changed:
+            self.tree.yview_moveto(first_visible)
+        return changed
+
+    def _in_loaded_range(self, key):
+        """Prüft, ob ein Sortierschlüssel vor oder auf der zuletzt geladenen Zeile liegt"""
+        return self.exhausted or self.last_key is None or not self._sorts_before(self.last_key, key)
+
+    def _insert_index(self, key):
+        """Position in der Treeview, an der eine Zeile mit dem Sortierschlüssel einzufügen ist"""
+        for index, iid in enumerate(self.tree.get_children()):
+            if self._sorts_before(key, self._sort_keys.get(iid, key)):
+                return index
+        return 'end'
+
+    def _sorts_before(self, a, b):
+        """Prüft, ob der Schlüssel a in der Anzeigereihenfolge vor b steht"""
+        if self.liste.descending:
+            a, b = b, a
+        return _sqlite_order(a) < _sqlite_order(b)
+
+    def on_yscroll(self, first, last):
+        """Aktualisiert die Scrollbar und lädt bei Bedarf die nächste Seite"""
+        self.scrollbar.set(first, last)
+
+        if self.exhausted or self._fetch_pending:
+            return
+
+        loaded = len(self.tree.get_children())
+        if float(last) * loaded >= loaded - self.prefetch:
+            self._fetch_pending = True
+            self.tree.after_idle(self.fetch_next_page)
+
+    def ensure_loaded(self, row_id):
+        """Lädt so lange Seiten nach, bis die Zeile mit der ID vorhanden ist"""
+        iid = str(row_id)
+        while not self.tree.exists(iid) and not self.exhausted:
+            if not self.fetch_next_page():
+                break
+        return self.tree.exists(iid)
+
+    def select_id(self, row_id):
+        """Wählt die Zeile mit der ID aus und scrollt zu ihr"""
+        if not self.ensure_loaded(row_id):
+            return False
+        iid = str(row_id)
+        self.tree.selection_set(iid)
+        self.tree.focus(iid)
+        self.tree.see(iid)
+        return True
+
+
+def _sqlite_order(key):
+    """Vergleichswert für (sort_key, id) in der Sortierreihenfolge von SQLite
+
+    NULL steht vor Zahlen, Zahlen vor Texten, Texte vor BLOBs.
+    """
+    value, row_id = key
+    if value is None:
+        return (0, 0, row_id)
+    if isinstance(value, (int, float)):
+        return (1, value, row_id)
+    if isinstance(value, str):
+        return (2, value, row_id)
+    return (3, bytes(value), row_id)
\ No newline at end of file
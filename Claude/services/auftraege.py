@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Abfragen und Änderungen für Aufträge (ohne Tkinter)
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from services.listen import Liste
+from utils.config import get_default_stundenlohn
+
+# Auftragsübersicht
+AUFTRAEGE_LISTE = Liste(
+    columns="""a.id, k.vorname || ' ' || k.nachname as kunde, a.status,
+               strftime('%d.%m.%Y', a.erstellt_am) as datum""",
+    from_clause="auftraege a LEFT JOIN kunden k ON a.kunden_id = k.id",
+    sort_key="a.erstellt_am",
+    id_key="a.id",
+    descending=True
+)
+
+# Reihenfolge der Status beim Weiterschalten
+STATUS_FOLGE = ["Offen", "In Bearbeitung", "Warten auf Teile", "Abgeschlossen"]
+
+
+@dataclass
+class AuftragsPosition:
+    """Eine Position der Detailansicht (Ersatzteil oder Arbeitszeit)"""
+    bezeichnung: str
+    menge: float
+    einzelpreis: float
+    rabatt: float
+    gesamtpreis: float
+    arbeitszeit: bool = False
+
+
+@dataclass
+class AuftragDetails:
+    """Daten der Detailansicht eines Auftrags"""
+    id: int
+    beschreibung: str
+    status: str
+    prioritaet: str
+    arbeitszeit: float
+    erstellt_am: str
+    abgeschlossen_am: Optional[str]
+    notizen: Optional[str]
+    kunde: str
+    telefon: Optional[str]
+    email: Optional[str]
+    # (Typ, Kennzeichen, Fahrgestellnummer) oder None
+    fahrzeug: Optional[Tuple[str, Optional[str], Optional[str]]] = None
+    positionen: List[AuftragsPosition] = field(default_factory=list)
+
+    @property
+    def gesamtsumme(self):
+        return sum(position.gesamtpreis for position in self.positionen)
+
+
+def auftraege_filter(status="Alle"):
+    """WHERE-Bedingung und Parameter für die Auftragsübersicht"""
+    if status != "Alle":
+        return "WHERE a.status = ?", (status,)
+    return "", ()
+
+
+def get_auftrag_details(conn, auftrag_id):
+    """Liest Auftrag, Kunde, Fahrzeug und Positionen (None, wenn der Auftrag fehlt)"""
+    cursor = conn.cursor()
+    cursor.execute("""
+    SELECT a.id, a.beschreibung, a.status, a.prioritaet, a.arbeitszeit,
+           strftime('%d.%m.%Y', a.erstellt_am) as erstellt_am,
+           strftime('%d.%m.%Y', a.abgeschlossen_am) as abgeschlossen_am,
+           a.notizen, k.vorname || ' ' || k.nachname as kunde,
+           k.telefon, k.email
+    FROM auftraege a
+    JOIN kunden k ON a.kunden_id = k.id
+    WHERE a.id = ?
+    """, (auftrag_id,))
+
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    details = AuftragDetails(*row)
+
+    # Fahrzeug des Auftrags, sonst erstes Fahrzeug des Kunden
+    cursor.execute("""
+    SELECT f.fahrzeug_typ, f.kennzeichen, f.fahrgestellnummer
+    FROM auftraege a
+    LEFT JOIN fahrzeuge f ON a.fahrzeug_id = f.id
+    WHERE a.id = ?
+    """, (auftrag_id,))
+    fahrzeug = cursor.fetchone()
+    if not (fahrzeug and fahrzeug[0]):
+        cursor.execute("""
+        SELECT f.fahrzeug_typ, f.kennzeichen, f.fahrgestellnummer
+        FROM fahrzeuge f
+        JOIN auftraege a ON f.kunden_id = a.kunden_id
+        WHERE a.id = ?
+        ORDER BY f.id
+        LIMIT 1
+        """, (auftrag_id,))
+        fahrzeug = cursor.fetchone()
+    if fahrzeug and fahrzeug[0]:
+        details.fahrzeug = tuple(fahrzeug)
+
+    # Verwendete Ersatzteile (Gesamtpreis abzüglich Rabatt)
+    cursor.execute("""
+    SELECT e.bezeichnung, ae.menge, ae.einzelpreis, COALESCE(ae.rabatt, 0) as rabatt
+    FROM auftrag_ersatzteile ae
+    JOIN ersatzteile e ON ae.ersatzteil_id = e.id
+    WHERE ae.auftrag_id = ?
+    """, (auftrag_id,))
+    for bezeichnung, menge, einzelpreis, rabatt in cursor.fetchall():
+        einzelpreis, rabatt = float(einzelpreis), float(rabatt)
+        gesamtpreis = einzelpreis * menge - einzelpreis * menge * (rabatt / 100)
+        details.positionen.append(AuftragsPosition(bezeichnung, menge, einzelpreis, rabatt, gesamtpreis))
+
+    # Arbeitszeit zum Standard-Stundensatz
+    if details.arbeitszeit and details.arbeitszeit > 0:
+        stundensatz = get_default_stundenlohn(conn)
+        details.positionen.append(AuftragsPosition(
+            f"Arbeitszeit: {details.beschreibung}", details.arbeitszeit, stundensatz, 0.0,
+            details.arbeitszeit * stundensatz, arbeitszeit=True
+        ))
+
+    return details
+
+
+def get_auftrag_status(conn, auftrag_id):
+    """Status des Auftrags (None, wenn der Auftrag fehlt)"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT status FROM auftraege WHERE id = ?", (auftrag_id,))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def next_status(status):
+    """Status nach dem angegebenen in STATUS_FOLGE (nach dem letzten wieder der erste)"""
+    try:
+        return STATUS_FOLGE[(STATUS_FOLGE.index(status) + 1) % len(STATUS_FOLGE)]
+    except ValueError:
+        # Unbekannter Status
+        return STATUS_FOLGE[0]
+
+
+def advance_auftrag_status(conn, auftrag_id):
+    """Schaltet den Auftrag auf den nächsten Status (mit Commit) und gibt diesen zurück
+
+    Beim Abschluss wird das Abschlussdatum gesetzt.
+    """
+    status = next_status(get_auftrag_status(conn, auftrag_id))
+    cursor = conn.cursor()
+    try:
+        if status == "Abgeschlossen":
+            cursor.execute(
+                "UPDATE auftraege SET status = ?, abgeschlossen_am = datetime('now') WHERE id = ?",
+                (status, auftrag_id)
+            )
+        else:
+            cursor.execute("UPDATE auftraege SET status = ? WHERE id = ?", (status, auftrag_id))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return status
+
+
+def save_auftrag_notizen(conn, auftrag_id, notizen):
+    """Speichert die Notizen des Auftrags (mit Commit)"""
+    cursor = conn.cursor()
+    cursor.execute("UPDATE auftraege SET notizen = ? WHERE id = ?", (notizen, auftrag_id))
+    conn.commit()
+
+
+def get_rechnung_id(conn, auftrag_id):
+    """ID der Rechnung zum Auftrag (None, wenn noch keine existiert)"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT id FROM rechnungen WHERE auftrag_id = ?", (auftrag_id,))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def delete_auftrag(conn, auftrag_id):
+    """Löscht den Auftrag samt zugeordneten Ersatzteilen (mit Commit)
+
+    Termine zum Auftrag bleiben erhalten und verlieren nur die Zuordnung.
+    Existiert eine Rechnung, schlägt das Löschen an der Fremdschlüsselprüfung
+    fehl (vorher get_rechnung_id prüfen).
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("DELETE FROM auftrag_ersatzteile WHERE auftrag_id = ?", (auftrag_id,))
+        cursor.execute("UPDATE termine SET auftrag_id = NULL WHERE auftrag_id = ?", (auftrag_id,))
+        cursor.execute("DELETE FROM auftraege WHERE id = ?", (auftrag_id,))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
\ No newline at end of file
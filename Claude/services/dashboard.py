@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Abfragen für das Dashboard und die To-Do-Liste (ohne Tkinter)
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from db.finance import get_finanz_uebersicht, FinanzUebersicht
+from db.schema import has_table, ensure_table
+
+TODOS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS todos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    text TEXT NOT NULL,
+    erledigt INTEGER DEFAULT 0,
+    erstellt_am TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+@dataclass
+class DashboardDaten:
+    """Werte der Dashboard-Karten"""
+    offene_auftraege: int = 0
+    aktive_kunden: int = 0
+    uebersicht: FinanzUebersicht = field(default_factory=FinanzUebersicht)
+    # None, wenn die To-Do-Liste nicht gelesen werden konnte
+    todos: Optional[List[str]] = None
+
+
+def get_dashboard_daten(conn):
+    """Liest alle Werte des Dashboards; fehlerhafte Einzelabfragen behalten ihren Standardwert"""
+    daten = DashboardDaten()
+    cursor = conn.cursor()
+
+    # Offene Aufträge zählen
+    try:
+        cursor.execute("SELECT COUNT(*) FROM auftraege WHERE status != 'Abgeschlossen'")
+        daten.offene_auftraege = cursor.fetchone()[0]
+    except Exception as e:
+        logging.error(f"Fehler bei Zählung offener Aufträge: {e}")
+
+    # Aktive Kunden (mit Aufträgen in den letzten 3 Monaten)
+    try:
+        cursor.execute("""
+        SELECT COUNT(DISTINCT k.id)
+        FROM kunden k
+        JOIN auftraege a ON k.id = a.kunden_id
+        WHERE a.erstellt_am >= date('now', '-3 months')
+        """)
+        daten.aktive_kunden = cursor.fetchone()[0]
+    except Exception as e:
+        logging.error(f"Fehler bei Zählung aktiver Kunden: {e}")
+
+    # Finanzkennzahlen (Lagerwert und Umsatzverlauf) aus der Finanzübersicht
+    try:
+        daten.uebersicht = get_finanz_uebersicht(conn, "Dieser Monat")
+    except Exception as e:
+        logging.error(f"Fehler bei Berechnung der Finanzübersicht: {e}")
+
+    # Offene TODOs
+    try:
+        daten.todos = list_todos(conn)
+    except Exception as e:
+        logging.error(f"Fehler beim Laden der Todo-Liste: {e}")
+
+    return daten
+
+
+def list_todos(conn):
+    """Texte der offenen To-Dos, neueste zuerst (None, wenn die Tabelle fehlt)"""
+    if not has_table(conn, 'todos'):
+        return None
+    cursor = conn.cursor()
+    cursor.execute("SELECT text FROM todos WHERE erledigt = 0 ORDER BY erstellt_am DESC")
+    return [row[0] for row in cursor.fetchall()]
+
+
+def add_todo(conn, text):
+    """Legt ein To-Do an (Tabelle bei Bedarf, mit Commit)"""
+    ensure_table(conn, 'todos', TODOS_TABLE_SQL)
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO todos (text) VALUES (?)", (text,))
+    conn.commit()
+
+
+def complete_todo(conn, text):
+    """Markiert die To-Dos mit dem Text als erledigt (mit Commit)"""
+    cursor = conn.cursor()
+    cursor.execute("UPDATE todos SET erledigt = 1 WHERE text = ?", (text,))
+    conn.commit()
\ No newline at end of file
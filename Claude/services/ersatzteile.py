@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Abfragen und Änderungen für Ersatzteile (ohne Tkinter)
+"""
+
+from services.listen import Liste
+
+# Artikelübersicht
+ERSATZTEILE_LISTE = Liste(
+    columns="""id, artikelnummer, bezeichnung, kategorie, lagerbestand, mindestbestand,
+               printf("%.2f", einkaufspreis) as einkaufspreis,
+               printf("%.2f", verkaufspreis) as verkaufspreis, lagerort, einheit""",
+    from_clause="ersatzteile",
+    sort_key="bezeichnung",
+    id_key="id"
+)
+
+
+def ersatzteile_filter(kategorie="Alle", nur_niedriger_bestand=False):
+    """WHERE-Bedingung und Parameter für die Artikelübersicht"""
+    where_clause = "WHERE 1=1"
+    params = []
+
+    if kategorie != "Alle":
+        where_clause += " AND kategorie = ?"
+        params.append(kategorie)
+
+    if nur_niedriger_bestand:
+        where_clause += " AND lagerbestand <= mindestbestand"
+
+    return where_clause, params
+
+
+def list_kategorien(conn):
+    """Vorhandene Artikelkategorien"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT DISTINCT kategorie FROM ersatzteile WHERE kategorie IS NOT NULL AND kategorie != ''")
+    return [row[0] for row in cursor.fetchall()]
+
+
+def get_lieferant(conn, ersatzteil_id):
+    """Lieferant des Artikels (None, wenn nicht angegeben)"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT lieferant FROM ersatzteile WHERE id = ?", (ersatzteil_id,))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def count_verwendungen(conn, ersatzteil_id):
+    """Anzahl Auftragspositionen, in denen der Artikel verwendet wird"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM auftrag_ersatzteile WHERE ersatzteil_id = ?", (ersatzteil_id,))
+    return cursor.fetchone()[0]
+
+
+def delete_ersatzteil(conn, ersatzteil_id):
+    """Löscht den Artikel samt seinen Bestandsänderungen (mit Commit)
+
+    Wird der Artikel in Aufträgen verwendet, schlägt das Löschen an der
+    Fremdschlüsselprüfung fehl (vorher count_verwendungen prüfen).
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("DELETE FROM bestandsaenderungen WHERE ersatzteil_id = ?", (ersatzteil_id,))
+        cursor.execute("DELETE FROM ersatzteile WHERE id = ?", (ersatzteil_id,))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
\ No newline at end of file
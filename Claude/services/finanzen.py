@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Abfragen für Einnahmen, Ausgaben und Finanzberichte (ohne Tkinter)
+
+Die Kennzahlen der Finanzübersicht berechnet db.finance.
+"""
+
+from datetime import datetime, timedelta
+
+from db.finance import get_finanz_uebersicht
+from utils.periods import period_condition
+
+# Verfügbare Berichtstypen
+BERICHT_TYPEN = ["Umsatzübersicht", "Gewinn und Verlust", "Einnahmen nach Kunden",
+                 "Ausgaben nach Kategorien", "Lagerbestandswert", "Werkstattauslastung"]
+
+
+def list_einnahmen(conn, zeitraum="Alle"):
+    """Bezahlte Rechnungen im Zeitraum, neueste zuerst
+
+    Zeilen: (id, Zahlungsdatum, Rechnungsnummer, Kunde, Betrag, Zahlungsart)
+    """
+    zeitraum_filter, zeitraum_params = period_condition("r.bezahlt_am", zeitraum)
+
+    cursor = conn.cursor()
+    cursor.execute(f"""
+    SELECT r.id, strftime('%d.%m.%Y', r.bezahlt_am) as datum, r.rechnungsnummer,
+           k.vorname || ' ' || k.nachname as kunde,
+           printf("%.2f", r.gesamtbetrag) as betrag, r.zahlungsart
+    FROM rechnungen r
+    LEFT JOIN auftraege a ON r.auftrag_id = a.id
+    LEFT JOIN kunden k ON a.kunden_id = k.id
+    WHERE r.bezahlt = 1 {('AND ' + zeitraum_filter) if zeitraum_filter else ''}
+    ORDER BY r.bezahlt_am DESC
+    """, zeitraum_params)
+    return cursor.fetchall()
+
+
+def list_ausgaben(conn, kategorie="Alle", zeitraum="Alle"):
+    """Ausgaben der Kategorie im Zeitraum, neueste zuerst
+
+    Zeilen: (id, Datum, Kategorie, Beschreibung, Betrag, Belegnummer)
+    """
+    conditions = []
+    params = []
+
+    if kategorie != "Alle":
+        conditions.append("kategorie = ?")
+        params.append(kategorie)
+
+    zeitraum_filter, zeitraum_params = period_condition("ausgaben.datum", zeitraum)
+    if zeitraum_filter:
+        conditions.append(zeitraum_filter)
+        params.extend(zeitraum_params)
+
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    cursor = conn.cursor()
+    cursor.execute(f"""
+    SELECT id, strftime('%d.%m.%Y', datum) as datum, kategorie, beschreibung,
+           printf("%.2f", betrag) as betrag, beleg_nr
+    FROM ausgaben
+    {where_clause}
+    ORDER BY datum DESC
+    """, params)
+    return cursor.fetchall()
+
+
+def list_ausgaben_kategorien(conn):
+    """Vorhandene Ausgabenkategorien"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT DISTINCT kategorie FROM ausgaben WHERE kategorie IS NOT NULL AND kategorie != ''")
+    return [row[0] for row in cursor.fetchall()]
+
+
+def delete_ausgabe(conn, ausgabe_id):
+    """Löscht die Ausgabe (mit Commit)"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("DELETE FROM ausgaben WHERE id = ?", (ausgabe_id,))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def zeitraum_beschreibung(zeitraum, heute=None):
+    """Zeitraum-Zeile für den Berichtskopf"""
+    heute = heute or datetime.now()
+    if zeitraum == "Dieser Monat":
+        return f"Zeitraum: {zeitraum} ({heute.strftime('%B %Y')})"
+    if zeitraum == "Letzter Monat":
+        vormonat = (heute.replace(day=1) - timedelta(days=1)).strftime('%B %Y')
+        return f"Zeitraum: {zeitraum} ({vormonat})"
+    if zeitraum == "Dieses Jahr":
+        return f"Zeitraum: {zeitraum} ({heute.year})"
+    if zeitraum == "Letztes Jahr":
+        return f"Zeitraum: {zeitraum} ({heute.year - 1})"
+    return "Zeitraum: Benutzerdefiniert"
+
+
+def create_finanzbericht(conn, bericht_typ, zeitraum, heute=None):
+    """Erstellt den Text eines Finanzberichts (Berichtstyp aus BERICHT_TYPEN)"""
+    heute = heute or datetime.now()
+
+    # Zeitraum für SQL-Abfrage bestimmen
+    zeitraum_bedingung, zeitraum_params = period_condition("datum", zeitraum)
+    zeitraum_filter = f"WHERE {zeitraum_bedingung}" if zeitraum_bedingung else ""
+
+    cursor = conn.cursor()
+
+    # Bericht-Header
+    text = "AUTOMMEISTER BY GIANNI - FINANZBERICHT\n"
+    text += f"Bericht: {bericht_typ}\n"
+    text += f"{zeitraum_beschreibung(zeitraum, heute)}\n"
+    text += f"Erstellt am: {heute.strftime('%d.%m.%Y')}\n"
+    text += "=" * 60 + "\n\n"
+
+    # Berichtsinhalt je nach Typ
+    if bericht_typ == "Umsatzübersicht":
+        text += "UMSATZÜBERSICHT\n\n"
+
+        # Gesamtumsatz
+        cursor.execute(f"""
+        SELECT SUM(gesamtbetrag) as umsatz
+        FROM rechnungen
+        {zeitraum_filter}
+        """, zeitraum_params)
+        gesamtumsatz = cursor.fetchone()[0] or 0
+
+        # Monatliche Umsätze
+        cursor.execute(f"""
+        SELECT strftime('%m/%Y', datum) as monat, SUM(gesamtbetrag) as umsatz
+        FROM rechnungen
+        {zeitraum_filter}
+        GROUP BY strftime('%Y-%m', datum)
+        ORDER BY strftime('%Y-%m', datum)
+        """, zeitraum_params)
+        monats_umsaetze = cursor.fetchall()
+
+        text += f"Gesamtumsatz: {gesamtumsatz:.2f} CHF\n\n"
+        text += "Monatliche Umsätze:\n"
+        if monats_umsaetze:
+            for monat, umsatz in monats_umsaetze:
+                text += f"{monat}: {umsatz:.2f} CHF\n"
+        else:
+            text += "Keine Umsätze im gewählten Zeitraum.\n"
+
+    elif bericht_typ == "Gewinn und Verlust":
+        text += "GEWINN UND VERLUST RECHNUNG\n\n"
+
+        # Einnahmen, Ausgaben und Materialkosten aus der Finanzübersicht
+        uebersicht = get_finanz_uebersicht(conn, zeitraum, months=0)
+        einnahmen = uebersicht.umsatz_gesamt
+        ausgaben = uebersicht.sonstige_ausgaben
+        materialkosten = uebersicht.materialkosten
+        gewinn = einnahmen - ausgaben - materialkosten
+
+        text += f"Einnahmen: {einnahmen:.2f} CHF\n"
+        text += f"Ausgaben: {ausgaben:.2f} CHF\n"
+        text += f"Materialkosten: {materialkosten:.2f} CHF\n"
+        text += f"Gewinn/Verlust: {gewinn:.2f} CHF\n"
+
+    elif bericht_typ == "Einnahmen nach Kunden":
+        text += "EINNAHMEN NACH KUNDEN\n\n"
+
+        cursor.execute(f"""
+        SELECT k.vorname || ' ' || k.nachname as kunde,
+               SUM(r.gesamtbetrag) as umsatz,
+               COUNT(r.id) as anzahl_rechnungen
+        FROM rechnungen r
+        JOIN auftraege a ON r.auftrag_id = a.id
+        JOIN kunden k ON a.kunden_id = k.id
+        {zeitraum_filter.replace('datum', 'r.datum')}
+        GROUP BY k.id
+        ORDER BY umsatz DESC
+        """, zeitraum_params)
+        kunden_umsaetze = cursor.fetchall()
+
+        if kunden_umsaetze:
+            text += f"{'Kunde':<30} {'Umsatz':<15} {'Anzahl Rechnungen':<20}\n"
+            text += "-" * 65 + "\n"
+            for kunde, umsatz, anzahl in kunden_umsaetze:
+                text += f"{kunde:<30} {umsatz:>12.2f} CHF {anzahl:>10}\n"
+        else:
+            text += "Keine Einnahmen im gewählten Zeitraum.\n"
+
+    elif bericht_typ == "Ausgaben nach Kategorien":
+        text += "AUSGABEN NACH KATEGORIEN\n\n"
+
+        cursor.execute(f"""
+        SELECT kategorie, SUM(betrag) as summe
+        FROM ausgaben
+        {zeitraum_filter}
+        GROUP BY kategorie
+        ORDER BY summe DESC
+        """, zeitraum_params)
+        kategorien_ausgaben = cursor.fetchall()
+
+        if kategorien_ausgaben:
+            text += f"{'Kategorie':<30} {'Betrag':<15}\n"
+            text += "-" * 45 + "\n"
+            gesamt_ausgaben = 0
+            for kategorie, betrag in kategorien_ausgaben:
+                text += f"{kategorie:<30} {betrag:>12.2f} CHF\n"
+                gesamt_ausgaben += betrag
+            text += "-" * 45 + "\n"
+            text += f"{'Gesamt':<30} {gesamt_ausgaben:>12.2f} CHF\n"
+        else:
+            text += "Keine Ausgaben im gewählten Zeitraum.\n"
+
+    elif bericht_typ == "Lagerbestandswert":
+        text += "LAGERBESTANDSWERT\n\n"
+
+        cursor.execute("""
+        SELECT kategorie,
+               COUNT(*) as anzahl_artikel,
+               SUM(lagerbestand) as gesamtbestand,
+               SUM(lagerbestand * einkaufspreis) as bestandswert
+        FROM ersatzteile
+        GROUP BY kategorie
+        ORDER BY bestandswert DESC
+        """)
+        kategorien_bestand = cursor.fetchall()
+
+        if kategorien_bestand:
+            text += f"{'Kategorie':<20} {'Anzahl Artikel':<15} {'Gesamtbestand':<15} {'Bestandswert':<15}\n"
+            text += "-" * 65 + "\n"
+            gesamt_wert = 0
+            for kategorie, anzahl, bestand, wert in kategorien_bestand:
+                text += f"{kategorie:<20} {anzahl:>13} {bestand:>15} {wert:>12.2f} CHF\n"
+                gesamt_wert += wert
+            text += "-" * 65 + "\n"
+            text += f"{'Gesamt':<50} {gesamt_wert:>12.2f} CHF\n"
+        else:
+            text += "Keine Artikel im Lager.\n"
+
+    elif bericht_typ == "Werkstattauslastung":
+        text += "WERKSTATTAUSLASTUNG\n\n"
+
+        # Gesamte Arbeitszeit im Zeitraum
+        cursor.execute(f"""
+        SELECT SUM(arbeitszeit) as gesamtzeit
+        FROM auftraege
+        {zeitraum_filter.replace('datum', 'erstellt_am')}
+        """, zeitraum_params)
+        gesamtzeit = cursor.fetchone()[0] or 0
+
+        # Anzahl Aufträge pro Status
+        cursor.execute(f"""
+        SELECT status, COUNT(*) as anzahl
+        FROM auftraege
+        {zeitraum_filter.replace('datum', 'erstellt_am')}
+        GROUP BY status
+        """, zeitraum_params)
+        status_counts = cursor.fetchall()
+
+        text += f"Gesamte Arbeitszeit: {gesamtzeit:.2f} Stunden\n\n"
+        if status_counts:
+            text += "Aufträge nach Status:\n"
+            for status, anzahl in status_counts:
+                text += f"{status}: {anzahl} Aufträge\n"
+        else:
+            text += "Keine Aufträge im gewählten Zeitraum.\n"
+
+    # Fußzeile
+    text += "\n\n"
+    text += "=" * 60 + "\n"
+    text += "Hinweis: Dieser Bericht dient nur zu Informationszwecken.\n"
+    text += "© AutoMeister by Gianni\n"
+    return text
\ No newline at end of file
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Abfragen und Änderungen für Kunden (ohne Tkinter)
+"""
+
+from services.listen import Liste
+
+# Kundenübersicht
+KUNDEN_LISTE = Liste(
+    columns="id, vorname || ' ' || nachname as name, telefon, email, fahrzeug_typ, kennzeichen",
+    from_clause="kunden",
+    sort_key="vorname || ' ' || nachname",
+    id_key="id"
+)
+
+
+def count_offene_auftraege(conn, kunden_id):
+    """Anzahl nicht abgeschlossener Aufträge des Kunden"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM auftraege WHERE kunden_id = ? AND status != 'Abgeschlossen'",
+                   (kunden_id,))
+    return cursor.fetchone()[0]
+
+
+def count_auftraege(conn, kunden_id):
+    """Anzahl aller Aufträge des Kunden (auch abgeschlossene)"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM auftraege WHERE kunden_id = ?", (kunden_id,))
+    return cursor.fetchone()[0]
+
+
+def delete_kunde(conn, kunden_id):
+    """Löscht den Kunden samt seinen Fahrzeugen (mit Commit)
+
+    Termine des Kunden bleiben erhalten und verlieren nur die Zuordnung.
+    Aufträge werden nicht gelöscht; solange welche existieren, schlägt das
+    Löschen an der Fremdschlüsselprüfung fehl (vorher count_auftraege prüfen).
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("DELETE FROM fahrzeuge WHERE kunden_id = ?", (kunden_id,))
+        cursor.execute("UPDATE termine SET kunde_id = NULL WHERE kunde_id = ?", (kunden_id,))
+        cursor.execute("DELETE FROM kunden WHERE id = ?", (kunden_id,))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
\ No newline at end of file
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Listenabfragen für die Übersichtstabellen
+
+Eine Liste beschreibt, welche Spalten aus welchen Tabellen in welcher
+Reihenfolge angezeigt werden. Die Funktionen lesen daraus seitenweise
+(Keyset-Paginierung) oder gezielt über IDs und verändern keine Widgets;
+gui.virtual_tree.VirtualTreeModel überträgt die Ergebnisse in die Treeview.
+"""
+
+from dataclasses import dataclass
+
+# Anzahl Zeilen pro Seite
+PAGE_SIZE = 100
+
+# Maximale Anzahl IDs pro IN(...)-Abfrage
+ID_CHUNK_SIZE = 500
+
+
+@dataclass(frozen=True)
+class Liste:
+    """Definition einer Übersichtsliste"""
+    columns: str            # SELECT-Liste der angezeigten Spalten (erste Spalte = ID)
+    from_clause: str        # FROM-Teil inkl. JOINs
+    sort_key: str           # SQL-Ausdruck, nach dem sortiert wird
+    id_key: str             # Eindeutiger SQL-Ausdruck als zweites Sortierkriterium
+    descending: bool = False
+
+
+def count_rows(conn, liste, where_clause="", params=()):
+    """Anzahl Zeilen der Liste für den Filter"""
+    cursor = conn.cursor()
+    cursor.execute(count_query(liste, where_clause), tuple(params))
+    return cursor.fetchone()[0]
+
+
+def count_query(liste, where_clause=""):
+    """SQL für die Anzahl Zeilen der Liste"""
+    return f"SELECT COUNT(*) FROM {liste.from_clause} {where_clause}"
+
+
+def fetch_page(conn, liste, where_clause="", params=(), last_key=None, limit=PAGE_SIZE):
+    """Zeilen hinter dem Sortierschlüssel last_key (None = erste Seite)
+
+    Jede Zeile enthält nach den angezeigten Spalten den Sortierschlüssel und
+    die ID, (row[-2], row[-1]) ist also der last_key für die nächste Seite.
+    """
+    query, query_params = page_query(liste, where_clause, params, last_key, limit)
+    cursor = conn.cursor()
+    cursor.execute(query, query_params)
+    return cursor.fetchall()
+
+
+def first_page(conn, liste, where_clause="", params=(), limit=PAGE_SIZE):
+    """Gesamtanzahl und erste Seite als (anzahl, zeilen)"""
+    return count_rows(conn, liste, where_clause, params), fetch_page(conn, liste, where_clause, params,
+                                                                     None, limit)
+
+
+def page_query(liste, where_clause, params, last_key, limit=PAGE_SIZE):
+    """SQL und Parameter für die Seite hinter last_key (None = erste Seite)"""
+    params = list(params)
+
+    if last_key is not None:
+        keyset_sql, keyset_params = keyset_condition(liste, last_key)
+        params.extend(keyset_params)
+        if where_clause:
+            where_clause += f" AND {keyset_sql}"
+        else:
+            where_clause = f"WHERE {keyset_sql}"
+
+    direction = "DESC" if liste.descending else "ASC"
+    query = f"""
+    SELECT {liste.columns}, {liste.sort_key} AS _sort_key, {liste.id_key} AS _id_key
+    FROM {liste.from_clause}
+    {where_clause}
+    ORDER BY _sort_key {direction}, _id_key {direction}
+    LIMIT ?
+    """
+    params.append(limit)
+    return query, params
+
+
+def plan_queries(liste, where_clause="", params=()):
+    """Abfragen, die das Blättern in der Liste ausführt, als [(SQL, Parameter)]
+
+    Anzahl, erste Seite und Folgeseite (mit einem Beispiel-Schlüssel); gedacht
+    für EXPLAIN QUERY PLAN (db.indexes.find_full_table_scans).
+    """
+    return [
+        (count_query(liste, where_clause), tuple(params)),
+        tuple(page_query(liste, where_clause, params, None)),
+        tuple(page_query(liste, where_clause, params, ('', 0))),
+    ]
+
+
+def keyset_condition(liste, last_key):
+    """Bedingung für alle Zeilen hinter dem zuletzt geladenen Sortierschlüssel"""
+    last_sort, last_id = last_key
+    key, id_key = liste.sort_key, liste.id_key
+
+    # NULL-Werte sortiert SQLite vor allen anderen Werten ein
+    if liste.descending:
+        if last_sort is None:
+            return f"({key} IS NULL AND {id_key} < ?)", [last_id]
+        return f"(({key}, {id_key}) < (?, ?) OR {key} IS NULL)", [last_sort, last_id]
+
+    if last_sort is None:
+        return f"(({key} IS NULL AND {id_key} > ?) OR {key} IS NOT NULL)", [last_id]
+    return f"(({key}, {id_key}) > (?, ?))", [last_sort, last_id]
+
+
+def fetch_rows_by_id(conn, liste, ids, where_clause="", params=(), with_sort_key=False):
+    """Zeilen zu den IDs als {ID: Zeile} (nicht zum Filter passende IDs fehlen)
+
+    Mit with_sort_key=True enthält jede Zeile als letzten Wert den Sortierschlüssel.
+    """
+    sort_column = f", {liste.sort_key} AS _sort_key" if with_sort_key else ""
+    cursor = conn.cursor()
+    rows_by_id = {}
+
+    # In Blöcken abfragen, um das Limit für SQL-Parameter nicht zu überschreiten
+    for start in range(0, len(ids), ID_CHUNK_SIZE):
+        chunk = list(ids[start:start + ID_CHUNK_SIZE])
+        condition = f"{liste.id_key} IN ({', '.join('?' * len(chunk))})"
+        if where_clause:
+            chunk_where = f"{where_clause} AND {condition}"
+        else:
+            chunk_where = f"WHERE {condition}"
+
+        cursor.execute(f"""
+        SELECT {liste.columns}{sort_column}, {liste.id_key} AS _id_key
+        FROM {liste.from_clause}
+        {chunk_where}
+        """, list(params) + chunk)
+
+        for row in cursor.fetchall():
+            rows_by_id[row[-1]] = row[:-1]
+
+    return rows_by_id
\ No newline at end of file
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Abfragen und Änderungen für Rechnungen (ohne Tkinter)
+"""
+
+from dataclasses import dataclass, field
+from typing import List
+
+from services.listen import Liste
+from utils.config import get_default_stundenlohn
+from utils.periods import period_condition
+
+# Rechnungsübersicht
+RECHNUNGEN_LISTE = Liste(
+    columns="""r.id, r.rechnungsnummer, k.vorname || ' ' || k.nachname as kunde,
+               strftime('%d.%m.%Y', r.datum) as datum,
+               printf("%.2f", r.gesamtbetrag) as betrag,
+               CASE WHEN r.bezahlt = 1 THEN 'Bezahlt' ELSE 'Offen' END as status,
+               r.zahlungsart""",
+    from_clause="""rechnungen r
+                   LEFT JOIN auftraege a ON r.auftrag_id = a.id
+                   LEFT JOIN kunden k ON a.kunden_id = k.id""",
+    sort_key="r.datum",
+    id_key="r.id",
+    descending=True
+)
+
+
+@dataclass
+class RechnungsPosition:
+    """Eine Position der Detailansicht (Ersatzteil oder Arbeitszeit)"""
+    bezeichnung: str
+    menge: float
+    einzelpreis: float
+    gesamtpreis: float
+    arbeitszeit: bool = False
+
+
+@dataclass
+class RechnungDetails:
+    """Daten der Detailansicht einer Rechnung"""
+    rechnungsnummer: str
+    kunde: str
+    datum: str
+    bezahlt: bool
+    bezahlt_am: str
+    positionen: List[RechnungsPosition] = field(default_factory=list)
+
+    @property
+    def status(self):
+        return f"Bezahlt am {self.bezahlt_am}" if self.bezahlt else "Offen"
+
+
+def rechnungen_filter(status="Alle", zeitraum="Alle"):
+    """WHERE-Bedingung und Parameter für die Rechnungsübersicht"""
+    where_clause = "WHERE 1=1"
+    params = []
+
+    if status != "Alle":
+        where_clause += f" AND r.bezahlt = {1 if status == 'Bezahlt' else 0}"
+
+    # Zeitraum als Datumsbereich, damit der Index auf r.datum genutzt werden kann
+    zeitraum_bedingung, zeitraum_params = period_condition("r.datum", zeitraum)
+    if zeitraum_bedingung:
+        where_clause += f" AND {zeitraum_bedingung}"
+        params.extend(zeitraum_params)
+
+    return where_clause, params
+
+
+def get_rechnung_details(conn, rechnung_id):
+    """Liest Kopfdaten und Positionen der Rechnung (None, wenn die Rechnung fehlt)"""
+    cursor = conn.cursor()
+    cursor.execute("""
+    SELECT r.rechnungsnummer, k.vorname || ' ' || k.nachname as kunde,
+           strftime('%d.%m.%Y', r.datum) as datum, r.bezahlt = 1,
+           strftime('%d.%m.%Y', r.bezahlt_am) as bezahlt_am,
+           a.id, a.beschreibung, a.arbeitszeit
+    FROM rechnungen r
+    LEFT JOIN auftraege a ON r.auftrag_id = a.id
+    LEFT JOIN kunden k ON a.kunden_id = k.id
+    WHERE r.id = ?
+    """, (rechnung_id,))
+
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    details = RechnungDetails(row[0], row[1], row[2], bool(row[3]), row[4])
+    auftrag_id, beschreibung, arbeitszeit = row[5:]
+    if auftrag_id is None:
+        return details
+
+    # Ersatzteile des Auftrags
+    cursor.execute("""
+    SELECT e.bezeichnung, ae.menge, ae.einzelpreis, ae.menge * ae.einzelpreis as gesamtpreis
+    FROM auftrag_ersatzteile ae
+    JOIN ersatzteile e ON ae.ersatzteil_id = e.id
+    WHERE ae.auftrag_id = ?
+    """, (auftrag_id,))
+    for bezeichnung, menge, einzelpreis, gesamtpreis in cursor.fetchall():
+        details.positionen.append(RechnungsPosition(bezeichnung, menge, einzelpreis, gesamtpreis))
+
+    # Arbeitszeit zum Standard-Stundensatz
+    if arbeitszeit and arbeitszeit > 0:
+        stundensatz = get_default_stundenlohn(conn)
+        details.positionen.append(RechnungsPosition(
+            f"Arbeitszeit: {beschreibung}", arbeitszeit, stundensatz, arbeitszeit * stundensatz,
+            arbeitszeit=True
+        ))
+
+    return details
+
+
+def get_rechnungsnummer(conn, rechnung_id):
+    """Rechnungsnummer der Rechnung (None, wenn die Rechnung fehlt)"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT rechnungsnummer FROM rechnungen WHERE id = ?", (rechnung_id,))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def mark_rechnung_paid(conn, rechnung_id, zahlungsart):
+    """Markiert die Rechnung mit heutigem Datum als bezahlt (mit Commit)"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            "UPDATE rechnungen SET bezahlt = 1, bezahlt_am = datetime('now'), zahlungsart = ? WHERE id = ?",
+            (zahlungsart, rechnung_id)
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def delete_rechnung(conn, rechnung_id):
+    """Löscht die Rechnung (mit Commit)"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("DELETE FROM rechnungen WHERE id = ?", (rechnung_id,))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
\ No newline at end of file
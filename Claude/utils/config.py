@@ -1,119 +1,250 @@
-"""
-Schnyders Werkstattverwaltung - Konfigurationshilfen
-===================================================
-Dieses Modul enthält Hilfsfunktionen für die Konfiguration der Anwendung.
-"""
-
-def get_config_value(conn, key, default=None):
-    """Konfigurationswert aus der Datenbank auslesen"""
-    cursor = conn.cursor()
-    cursor.execute("SELECT wert FROM konfiguration WHERE schluessel = ?", (key,))
-    result = cursor.fetchone()
-    if result:
-        return result[0]
-    return default
-
-def set_config_value(conn, key, value, description=None):
-    """Konfigurationswert in der Datenbank setzen"""
-    cursor = conn.cursor()
-    cursor.execute("SELECT 1 FROM konfiguration WHERE schluessel = ?", (key,))
-    if cursor.fetchone():
-        cursor.execute("UPDATE konfiguration SET wert = ? WHERE schluessel = ?", (value, key))
-    else:
-        cursor.execute("INSERT INTO konfiguration (schluessel, wert, beschreibung) VALUES (?, ?, ?)", 
-                      (key, value, description or key))
-    conn.commit()
-
-def init_default_config(conn):
-    """Initialisiert Standardkonfigurationswerte, falls nicht vorhanden"""
-    print("Initialisiere Standardkonfiguration...")
-    
-    # Prüfen, ob die Tabelle konfiguration existiert
-    cursor = conn.cursor()
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='konfiguration'")
-    if not cursor.fetchone():
-        cursor.execute('''
-        CREATE TABLE konfiguration (
-            schluessel TEXT PRIMARY KEY,
-            wert TEXT NOT NULL,
-            beschreibung TEXT
-        )
-        ''')
-        conn.commit()
-    
-    defaults = {
-        'standard_stundenlohn': ('50.0', 'Standard-Stundenlohn in CHF'),
-        'firmenname': ('Schnyders Werkstatt', 'Name der Firma'),
-        'adresse': ('Musterstraße 123, 8000 Zürich', 'Adresse der Firma'),
-        'telefon': ('044 123 45 67', 'Telefonnummer'),
-        'email': ('info@schnyders-werkstatt.ch', 'E-Mail-Adresse'),
-        'website': ('www.schnyders-werkstatt.ch', 'Website der Firma'),
-        'mwst_satz': ('7.7', 'MwSt-Satz in %'),
-        'bank_name': ('Schweizer Kantonalbank', 'Name der Bank'),
-        'bank_iban': ('CH93 0076 2011 6238 5295 7', 'IBAN-Nummer'),
-        'bank_bic': ('POFICHBEXXX', 'BIC/SWIFT-Code'),
-        'zahlungsfrist': ('30', 'Zahlungsfrist in Tagen'),
-        'standard_rabatt': ('0', 'Standard-Rabatt in %')
-    }
-    
-    for key, (value, description) in defaults.items():
-        if get_config_value(conn, key) is None:
-            set_config_value(conn, key, value, description)
-    
-    print("Standardkonfiguration initialisiert.")
-
-def get_default_stundenlohn(conn):
-    """Standard-Stundenlohn aus der Konfiguration auslesen"""
-    stundenlohn = get_config_value(conn, 'standard_stundenlohn', '50.0')
-    try:
-        return float(stundenlohn)
-    except (ValueError, TypeError):
-        return 50.0  # Fallback-Wert, falls keine valide Konfiguration vorhanden
-
-def set_default_stundenlohn(conn, stundenlohn):
-    """Standard-Stundenlohn in der Konfiguration setzen"""
-    set_config_value(conn, 'standard_stundenlohn', str(stundenlohn), 
-                    'Standard-Stundenlohn in CHF')
-
-def get_company_info(conn):
-    """Firmendaten aus der Konfiguration auslesen"""
-    return {
-        'name': get_config_value(conn, 'firmenname', 'Schnyders Werkstatt'),
-        'address': get_config_value(conn, 'adresse', 'Musterstraße 123, 8000 Zürich'),
-        'phone': get_config_value(conn, 'telefon', '044 123 45 67'),
-        'email': get_config_value(conn, 'email', 'info@schnyders-werkstatt.ch'),
-        'website': get_config_value(conn, 'website', 'www.schnyders-werkstatt.ch'),
-        'mwst': get_config_value(conn, 'mwst_satz', '7.7'),
-        'bank_name': get_config_value(conn, 'bank_name', 'Schweizer Kantonalbank'),
-        'bank_iban': get_config_value(conn, 'bank_iban', 'CH93 0076 2011 6238 5295 7'),
-        'bank_bic': get_config_value(conn, 'bank_bic', 'POFICHBEXXX'),
-        'zahlungsfrist': get_config_value(conn, 'zahlungsfrist', '30'),
-        'standard_rabatt': get_config_value(conn, 'standard_rabatt', '0')
-    }
-
-def set_company_info(conn, info):
-    """Firmendaten in der Konfiguration setzen"""
-    for key, value in info.items():
-        if key == 'name':
-            set_config_value(conn, 'firmenname', value, 'Name der Firma')
-        elif key == 'address':
-            set_config_value(conn, 'adresse', value, 'Adresse der Firma')
-        elif key == 'phone':
-            set_config_value(conn, 'telefon', value, 'Telefonnummer')
-        elif key == 'email':
-            set_config_value(conn, 'email', value, 'E-Mail-Adresse')
-        elif key == 'website':
-            set_config_value(conn, 'website', value, 'Website der Firma')
-        elif key == 'mwst':
-            set_config_value(conn, 'mwst_satz', value, 'MwSt-Satz in %')
-        elif key == 'bank_name':
-            set_config_value(conn, 'bank_name', value, 'Name der Bank')
-        elif key == 'bank_iban':
-            set_config_value(conn, 'bank_iban', value, 'IBAN-Nummer')
-        elif key == 'bank_bic':
-            set_config_value(conn, 'bank_bic', value, 'BIC/SWIFT-Code')
-        elif key == 'zahlungsfrist':
-            set_config_value(conn, 'zahlungsfrist', value, 'Zahlungsfrist in Tagen')
-        elif key == 'standard_rabatt':
-            set_config_value(conn, 'standard_rabatt', value, 'Standard-Rabatt in %')
-
+"""
+Schnyders Werkstattverwaltung - Konfigurationshilfen
+===================================================
+Dieses Modul enthält Hilfsfunktionen für die Konfiguration der Anwendung.
+"""
+
+import threading
+
+# Prozessweiter Zwischenspeicher der Tabelle konfiguration: {schluessel: wert}
+# None = noch nicht geladen. Schreibzugriffe über set_config_value/set_config_values
+# aktualisieren ihn direkt (write-through); Änderungen anderer Arbeitsplätze
+# übernimmt reload_config (über das Änderungsprotokoll, siehe db.change_tracking).
+_cache = None
+_lock = threading.RLock()
+
+# Registrierte Beobachter: [(callback, schluessel oder None für alle)]
+_listeners = []
+
+def load_config(conn):
+    """Lädt die gesamte Konfiguration mit einer Abfrage in den Zwischenspeicher"""
+    global _cache
+    cursor = conn.cursor()
+    cursor.execute("SELECT schluessel, wert FROM konfiguration")
+    values = dict(cursor.fetchall())
+    with _lock:
+        _cache = values
+    return values
+
+def invalidate_config():
+    """Verwirft den Zwischenspeicher; der nächste Zugriff lädt die Konfiguration neu"""
+    global _cache
+    with _lock:
+        _cache = None
+
+def reload_config(conn):
+    """Lädt die Konfiguration neu, z.B. nachdem ein anderer Arbeitsplatz sie geändert hat
+    
+    Beobachter werden mit den Werten benachrichtigt, die sich gegenüber dem
+    bisherigen Zwischenspeicher geändert haben; diese werden auch zurückgegeben.
+    """
+    with _lock:
+        previous = _cache
+        values = load_config(conn)
+    if previous is None:
+        return {}
+    changes = {key: value for key, value in values.items() if previous.get(key) != value}
+    changes.update({key: None for key in previous.keys() - values.keys()})
+    _notify(changes)
+    return changes
+
+def _get_cache(conn):
+    values = _cache
+    if values is None:
+        values = load_config(conn)
+    return values
+
+def add_config_listener(callback, keys=None):
+    """Registriert callback(changes) für Änderungen der Konfiguration
+    
+    changes ist ein Dict {schluessel: neuer Wert oder None wenn gelöscht}. Mit keys
+    wird callback nur aufgerufen, wenn einer dieser Schlüssel geändert wurde.
+    Der Aufruf erfolgt im Thread, der die Änderung speichert (in der Anwendung
+    der Tk-Hauptthread).
+    """
+    with _lock:
+        _listeners.append((callback, frozenset(keys) if keys else None))
+    return callback
+
+def remove_config_listener(callback):
+    """Entfernt einen mit add_config_listener registrierten Beobachter"""
+    with _lock:
+        _listeners[:] = [entry for entry in _listeners if entry[0] != callback]
+
+def _notify(changes):
+    if not changes:
+        return
+    with _lock:
+        listeners = list(_listeners)
+    for callback, keys in listeners:
+        if keys is None or keys & changes.keys():
+            try:
+                callback(changes)
+            except Exception as e:
+                # Ein fehlerhafter Beobachter darf das Speichern nicht abbrechen
+                print(f"Fehler beim Benachrichtigen über Konfigurationsänderung: {e}")
+
+def get_config_value(conn, key, default=None):
+    """Konfigurationswert auslesen (aus dem Zwischenspeicher)"""
+    value = _get_cache(conn).get(key)
+    if value is None:
+        return default
+    return value
+
+def get_config_float(conn, key, default):
+    """Konfigurationswert als Zahl; default, falls nicht vorhanden oder ungültig"""
+    try:
+        return float(get_config_value(conn, key, default))
+    except (ValueError, TypeError):
+        return default
+
+def get_config_int(conn, key, default):
+    """Konfigurationswert als Ganzzahl; default, falls nicht vorhanden oder ungültig"""
+    try:
+        return int(get_config_value(conn, key, default))
+    except (ValueError, TypeError):
+        return default
+
+def _write_config_value(cursor, key, value, description):
+    cursor.execute("UPDATE konfiguration SET wert = ? WHERE schluessel = ?", (value, key))
+    if cursor.rowcount == 0:
+        cursor.execute("INSERT INTO konfiguration (schluessel, wert, beschreibung) VALUES (?, ?, ?)", 
+                      (key, value, description or key))
+
+def set_config_values(conn, values, descriptions=None):
+    """Mehrere Konfigurationswerte in einer Transaktion setzen
+    
+    values: {schluessel: wert}; wert None löscht den Schlüssel.
+    descriptions: optionale Beschreibungen für neu angelegte Schlüssel.
+    Beobachter werden einmal mit allen tatsächlich geänderten Werten benachrichtigt.
+    """
+    descriptions = descriptions or {}
+    current = _get_cache(conn)
+    changes = {key: value for key, value in values.items() if current.get(key) != value}
+    
+    cursor = conn.cursor()
+    try:
+        for key, value in changes.items():
+            if value is None:
+                cursor.execute("DELETE FROM konfiguration WHERE schluessel = ?", (key,))
+            else:
+                _write_config_value(cursor, key, value, descriptions.get(key))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    
+    with _lock:
+        if _cache is not None:
+            for key, value in changes.items():
+                if value is None:
+                    _cache.pop(key, None)
+                else:
+                    _cache[key] = value
+    
+    _notify(changes)
+    return changes
+
+def set_config_value(conn, key, value, description=None):
+    """Konfigurationswert in der Datenbank setzen"""
+    set_config_values(conn, {key: value}, {key: description})
+
+def delete_config_value(conn, key):
+    """Konfigurationswert löschen"""
+    set_config_values(conn, {key: None})
+
+def init_default_config(conn):
+    """Initialisiert Standardkonfigurationswerte, falls nicht vorhanden"""
+    print("Initialisiere Standardkonfiguration...")
+    
+    # Prüfen, ob die Tabelle konfiguration existiert
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='konfiguration'")
+    if not cursor.fetchone():
+        cursor.execute('''
+        CREATE TABLE konfiguration (
+            schluessel TEXT PRIMARY KEY,
+            wert TEXT NOT NULL,
+            beschreibung TEXT
+        )
+        ''')
+        conn.commit()
+    
+    # Nach Migrationen die Konfiguration neu laden
+    invalidate_config()
+    
+    defaults = {
+        'standard_stundenlohn': ('50.0', 'Standard-Stundenlohn in CHF'),
+        'firmenname': ('Schnyders Werkstatt', 'Name der Firma'),
+        'adresse': ('Musterstraße 123, 8000 Zürich', 'Adresse der Firma'),
+        'telefon': ('044 123 45 67', 'Telefonnummer'),
+        'email': ('info@schnyders-werkstatt.ch', 'E-Mail-Adresse'),
+        'website': ('www.schnyders-werkstatt.ch', 'Website der Firma'),
+        'mwst_satz': ('7.7', 'MwSt-Satz in %'),
+        'bank_name': ('Schweizer Kantonalbank', 'Name der Bank'),
+        'bank_iban': ('CH93 0076 2011 6238 5295 7', 'IBAN-Nummer'),
+        'bank_bic': ('POFICHBEXXX', 'BIC/SWIFT-Code'),
+        'zahlungsfrist': ('30', 'Zahlungsfrist in Tagen'),
+        'standard_rabatt': ('0', 'Standard-Rabatt in %'),
+        'backup_intervall': ('60', 'Automatische Datensicherung alle x Minuten (0 = aus)'),
+        'backup_anzahl': ('10', 'Anzahl aufbewahrter Datensicherungen'),
+        'suche_verzoegerung': ('250', 'Wartezeit nach der letzten Eingabe im Suchfeld in Millisekunden')
+    }
+    
+    current = load_config(conn)
+    missing = {key: value for key, (value, description) in defaults.items() if key not in current}
+    if missing:
+        set_config_values(conn, missing, {key: description for key, (value, description) in defaults.items()})
+    
+    print("Standardkonfiguration initialisiert.")
+
+def get_default_stundenlohn(conn):
+    """Standard-Stundenlohn aus der Konfiguration auslesen"""
+    # Fallback-Wert, falls keine valide Konfiguration vorhanden
+    return get_config_float(conn, 'standard_stundenlohn', 50.0)
+
+def set_default_stundenlohn(conn, stundenlohn):
+    """Standard-Stundenlohn in der Konfiguration setzen"""
+    set_config_value(conn, 'standard_stundenlohn', str(stundenlohn), 
+                    'Standard-Stundenlohn in CHF')
+
+def get_backup_settings(conn):
+    """Intervall der automatischen Datensicherung (Minuten) und Anzahl aufbewahrter Sicherungen"""
+    return (max(0, get_config_int(conn, 'backup_intervall', 60)),
+            max(0, get_config_int(conn, 'backup_anzahl', 10)))
+
+def get_search_delay(conn):
+    """Wartezeit nach der letzten Eingabe, bevor ein Suchfeld sucht (Millisekunden)"""
+    return max(0, get_config_int(conn, 'suche_verzoegerung', 250))
+
+# Firmendaten: Schlüssel in get_company_info -> (Konfigurationsschlüssel, Standardwert, Beschreibung)
+COMPANY_KEYS = {
+    'name': ('firmenname', 'Schnyders Werkstatt', 'Name der Firma'),
+    'address': ('adresse', 'Musterstraße 123, 8000 Zürich', 'Adresse der Firma'),
+    'phone': ('telefon', '044 123 45 67', 'Telefonnummer'),
+    'email': ('email', 'info@schnyders-werkstatt.ch', 'E-Mail-Adresse'),
+    'website': ('website', 'www.schnyders-werkstatt.ch', 'Website der Firma'),
+    'mwst': ('mwst_satz', '7.7', 'MwSt-Satz in %'),
+    'bank_name': ('bank_name', 'Schweizer Kantonalbank', 'Name der Bank'),
+    'bank_iban': ('bank_iban', 'CH93 0076 2011 6238 5295 7', 'IBAN-Nummer'),
+    'bank_bic': ('bank_bic', 'POFICHBEXXX', 'BIC/SWIFT-Code'),
+    'zahlungsfrist': ('zahlungsfrist', '30', 'Zahlungsfrist in Tagen'),
+    'standard_rabatt': ('standard_rabatt', '0', 'Standard-Rabatt in %')
+}
+
+def get_company_info(conn):
+    """Firmendaten aus der Konfiguration auslesen"""
+    return {name: get_config_value(conn, key, default)
+            for name, (key, default, description) in COMPANY_KEYS.items()}
+
+def set_company_info(conn, info):
+    """Firmendaten in der Konfiguration setzen"""
+    values = {}
+    descriptions = {}
+    for name, value in info.items():
+        if name in COMPANY_KEYS:
+            key, default, description = COMPANY_KEYS[name]
+            values[key] = value
+            descriptions[key] = description
+    set_config_values(conn, values, descriptions)
+
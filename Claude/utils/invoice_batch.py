@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sammelerstellung von Rechnungs-PDFs (z.B. zum Monatsende)
+
+Die Daten aller Rechnungen werden vorab mit wenigen mengenbasierten
+Abfragen gelesen (utils.pdf_generator.fetch_invoices), die Firmendaten
+einmal pro Durchlauf. Einzelne PDF-Dateien werden anschließend parallel in
+einem ProcessPoolExecutor erzeugt; die Worker-Prozesse greifen nicht auf
+die Datenbank zu. Alternativ werden alle Rechnungen in eine gemeinsame
+PDF-Datei geschrieben.
+"""
+
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from utils.pdf_generator import (fetch_invoices, get_render_context, InvoiceRenderContext,
+                                 render_invoice_pdf, render_invoices_pdf)
+
+# Anzahl Worker-Prozesse (None = Anzahl der Prozessorkerne)
+MAX_WORKERS = None
+
+
+class BatchAborted(Exception):
+    """Die Sammelerstellung wurde abgebrochen"""
+
+
+def select_rechnung_ids(conn, where_clause="", params=()):
+    """IDs der Rechnungen zu einem Filter, älteste zuerst
+
+    where_clause bezieht sich auf rechnungen r, auftraege a und kunden k,
+    z.B. "WHERE r.bezahlt = 0".
+    """
+    cursor = conn.cursor()
+    cursor.execute(f"""
+    SELECT r.id
+    FROM rechnungen r
+    LEFT JOIN auftraege a ON r.auftrag_id = a.id
+    LEFT JOIN kunden k ON a.kunden_id = k.id
+    {where_clause}
+    ORDER BY r.datum, r.id
+    """, tuple(params))
+    return [row[0] for row in cursor.fetchall()]
+
+
+def invoice_filename(rechnungsnr):
+    """Dateiname für die PDF-Datei einer Rechnung"""
+    return f"Rechnung_{re.sub(r'[^A-Za-z0-9_.-]', '_', str(rechnungsnr))}.pdf"
+
+
+# Render-Kontext im Worker-Prozess (einmal pro Prozess über den Initializer erzeugt,
+# Stile und Logo werden also nur einmal je Prozess aufbereitet)
+_worker_context = None
+
+
+def _init_worker(settings):
+    global _worker_context
+    _worker_context = InvoiceRenderContext(settings)
+
+
+def _render_worker(invoice, output_path):
+    return render_invoice_pdf(invoice, _worker_context, output_path)
+
+
+def generate_invoice_pdfs(conn, rechnung_ids, output_dir=None, merged_path=None,
+                          max_workers=MAX_WORKERS, progress=None, abort=None):
+    """Erzeugt PDFs für mehrere Rechnungen
+
+    Entweder output_dir (eine Datei je Rechnung, parallel erzeugt) oder
+    merged_path (alle Rechnungen in einer Datei) angeben.
+    progress(erledigt, gesamt, rechnung_id) wird im aufrufenden Thread nach jeder
+    Rechnung aufgerufen; ist abort (threading.Event) gesetzt, werden ausstehende
+    Rechnungen verworfen und BatchAborted ausgelöst.
+
+    Gibt eine Liste (rechnung_id, pfad, fehler) in der Reihenfolge von
+    rechnung_ids zurück; pfad ist None, wenn die Rechnung nicht erstellt wurde.
+    """
+    if (output_dir is None) == (merged_path is None):
+        raise ValueError("Entweder output_dir oder merged_path angeben")
+
+    rechnung_ids = list(dict.fromkeys(rechnung_ids))
+    invoices = fetch_invoices(conn, rechnung_ids)
+    context = get_render_context(conn)
+
+    results = {}
+    renderable = []
+    for rechnung_id in rechnung_ids:
+        invoice = invoices.get(rechnung_id)
+        if invoice is None:
+            results[rechnung_id] = (None, "Rechnung nicht gefunden")
+        elif 'fehler' in invoice:
+            results[rechnung_id] = (None, invoice['fehler'])
+        else:
+            renderable.append((rechnung_id, invoice))
+
+    total = len(rechnung_ids)
+    done = len(results)
+
+    def report(rechnung_id):
+        nonlocal done
+        done += 1
+        if progress:
+            progress(done, total, rechnung_id)
+        if abort is not None and abort.is_set():
+            raise BatchAborted("PDF-Erstellung abgebrochen")
+
+    if merged_path is not None:
+        if renderable:
+            render_invoices_pdf(renderable, context, merged_path, report)
+            for rechnung_id, invoice in renderable:
+                results[rechnung_id] = (merged_path, None)
+    else:
+        os.makedirs(output_dir, exist_ok=True)
+        paths = {rechnung_id: os.path.join(output_dir, invoice_filename(invoice['rechnungsnr']))
+                 for rechnung_id, invoice in renderable}
+
+        if len(renderable) <= 1 or max_workers == 1:
+            # Für einzelne Rechnungen lohnt sich der Start von Worker-Prozessen nicht
+            for rechnung_id, invoice in renderable:
+                try:
+                    results[rechnung_id] = (render_invoice_pdf(invoice, context, paths[rechnung_id]), None)
+                except Exception as e:
+                    results[rechnung_id] = (None, str(e))
+                report(rechnung_id)
+        else:
+            pool = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(context.settings,))
+            try:
+                futures = {pool.submit(_render_worker, invoice, paths[rechnung_id]): rechnung_id
+                           for rechnung_id, invoice in renderable}
+                for future in as_completed(futures):
+                    rechnung_id = futures[future]
+                    error = future.exception()
+                    if error is None:
+                        results[rechnung_id] = (future.result(), None)
+                    else:
+                        results[rechnung_id] = (None, str(error))
+                    report(rechnung_id)
+            finally:
+                # Bei Abbruch noch nicht begonnene Rechnungen verwerfen
+                pool.shutdown(wait=True, cancel_futures=True)
+
+    return [(rechnung_id,) + results[rechnung_id] for rechnung_id in rechnung_ids]
+
+
+class InvoiceBatchJob:
+    """Führt eine Sammelerstellung in einem Hintergrund-Thread aus
+
+    Der Zustand (running, progress, result) wird vom Tk-Hauptthread abgefragt;
+    der Job selbst ruft keine Widgets auf.
+    """
+
+    def __init__(self, db_manager, max_workers=MAX_WORKERS):
+        self.db_manager = db_manager
+        self.max_workers = max_workers
+
+        self._thread = None
+        self._abort = threading.Event()
+
+        # (erledigte Rechnungen, Rechnungen gesamt)
+        self.progress = (0, 0)
+        # Ergebnis: (Liste aus generate_invoice_pdfs oder None, Fehler oder None)
+        self.result = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, rechnung_ids, output_dir=None, merged_path=None):
+        """Startet die Erstellung im Hintergrund; False, wenn bereits ein Job läuft"""
+        if self.running:
+            return False
+
+        self.progress = (0, len(rechnung_ids))
+        self.result = None
+        self._abort.clear()
+        self._thread = threading.Thread(target=self._run, args=(list(rechnung_ids), output_dir, merged_path),
+                                        name="pdf-batch", daemon=True)
+        self._thread.start()
+        return True
+
+    def close(self):
+        """Bricht einen laufenden Job ab und wartet auf sein Ende"""
+        self._abort.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, rechnung_ids, output_dir, merged_path):
+        try:
+            # Eigene Lese-Verbindung, da der Job nicht im Tk-Hauptthread läuft
+            conn = self.db_manager.open_reader()
+            try:
+                results = generate_invoice_pdfs(conn, rechnung_ids, output_dir, merged_path,
+                                                self.max_workers, self._on_progress, self._abort)
+            finally:
+                conn.close()
+            self.result = (results, None)
+        except Exception as e:
+            self.result = (None, e)
+
+    def _on_progress(self, done, total, rechnung_id):
+        self.progress = (done, total)
\ No newline at end of file
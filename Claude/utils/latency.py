@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Gemeinsame Grundlage der Laufzeitmessungen (db.profiling, gui.ui_profiler)
+
+LatencyStats sammelt die Laufzeiten eines Messpunkts (Anzahl, Summe, Maximum,
+Histogramm in festen Klassen), LatencyProfiler verwaltet die Messpunkte, das
+Protokoll der Überschreitungen und die Ausgabe als JSON. Die Aktivierung über
+Umgebungsvariablen liest settings_from_environment.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import deque
+from datetime import datetime
+
+
+class LatencyStats:
+    """Laufzeiten eines Messpunkts"""
+    # Obergrenzen der Histogramm-Klassen in ms (die letzte Klasse ist offen)
+    buckets_ms = ()
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.histogram = [0] * (len(self.buckets_ms) + 1)
+
+    def add_time(self, elapsed_ms):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.histogram[self._bucket(elapsed_ms)] += 1
+
+    def _bucket(self, elapsed_ms):
+        for index, limit in enumerate(self.buckets_ms):
+            if elapsed_ms <= limit:
+                return index
+        return len(self.buckets_ms)
+
+    @property
+    def mean_ms(self):
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile_ms(self, percent):
+        """Obergrenze der Histogramm-Klasse, in die das Perzentil fällt (ms)"""
+        if not self.count:
+            return 0.0
+        needed = self.count * percent / 100
+        seen = 0
+        for index, count in enumerate(self.histogram):
+            seen += count
+            if seen >= needed:
+                return self.buckets_ms[index] if index < len(self.buckets_ms) else self.max_ms
+        return self.max_ms
+
+    def as_dict(self):
+        return {
+            'anzahl': self.count,
+            'gesamt_ms': round(self.total_ms, 3),
+            'mittel_ms': round(self.mean_ms, 3),
+            'p95_ms': round(self.percentile_ms(95), 3),
+            'max_ms': round(self.max_ms, 3),
+            'histogramm': self.histogram,
+        }
+
+
+class LatencyProfiler:
+    """Messpunkte (stats_class je Name) und Protokoll der Überschreitungen (thread-sicher)"""
+    stats_class = LatencyStats
+
+    def __init__(self, threshold_ms, dump_path=None, log_size=100):
+        self.threshold_ms = threshold_ms
+        # Ziel für dump_json beim Beenden der Anwendung (None = nicht speichern)
+        self.dump_path = dump_path
+        self.started = datetime.now()
+        self._stats = {}
+        self._log = deque(maxlen=log_size)
+        self._lock = threading.Lock()
+
+    def _stats_for(self, name):
+        """Messwerte eines Messpunkts, bei Bedarf neu angelegt (nur unter self._lock aufrufen)"""
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = self.stats_class(name)
+        return stats
+
+    def _sorted_stats(self):
+        """Messwerte aller Messpunkte, nach Gesamtzeit absteigend"""
+        with self._lock:
+            stats = [stats.as_dict() for stats in self._stats.values()]
+        return sorted(stats, key=lambda entry: entry['gesamt_ms'], reverse=True)
+
+    def _recent_log(self):
+        """Die zuletzt protokollierten Überschreitungen, neueste zuerst"""
+        with self._lock:
+            return list(reversed(self._log))
+
+    def reset(self):
+        """Verwirft alle Messwerte"""
+        with self._lock:
+            self._stats.clear()
+            self._log.clear()
+            self.started = datetime.now()
+
+    def as_dict(self):
+        return {
+            'gestartet': self.started.isoformat(timespec='seconds'),
+            'erstellt': datetime.now().isoformat(timespec='seconds'),
+            'schwelle_ms': self.threshold_ms,
+            'histogramm_grenzen_ms': list(self.stats_class.buckets_ms),
+        }
+
+    def dump_json(self, path):
+        """Speichert alle Messwerte als JSON-Datei (zur späteren Auswertung)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.as_dict(), f, indent=2, ensure_ascii=False)
+
+
+def settings_from_environment(profil_env, schwelle_env, default_threshold_ms, environ=None):
+    """(Schwelle in ms, JSON-Ziel oder None) gemäß den Umgebungsvariablen, None = Messung aus
+
+    profil_env=1 schaltet die Messung ein, ein Wert mit Endung .json zusätzlich
+    das Speichern beim Beenden; schwelle_env überschreibt die Schwelle.
+    """
+    environ = os.environ if environ is None else environ
+    value = environ.get(profil_env, "").strip()
+    if value in ("", "0"):
+        return None
+
+    try:
+        threshold = float(environ.get(schwelle_env, default_threshold_ms))
+    except ValueError:
+        logging.warning(f"Ungültiger Wert für {schwelle_env}, verwende {default_threshold_ms} ms")
+        threshold = default_threshold_ms
+
+    dump_path = value if value.lower().endswith(".json") else None
+    return threshold, dump_path
\ No newline at end of file
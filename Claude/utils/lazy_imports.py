@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Verzögertes Laden schwerer Bibliotheken
+
+matplotlib (samt numpy) und PIL verlängern den Programmstart deutlich,
+werden aber nur für Diagramme bzw. das Firmenlogo gebraucht. Sie werden
+deshalb erst beim ersten Aufruf der folgenden Funktionen importiert;
+weitere Aufrufe liefern die bereits geladenen Module.
+"""
+
+
+def matplotlib_tk():
+    """Lädt matplotlib mit dem Tk-Backend und gibt (pyplot, FigureCanvasTkAgg) zurück"""
+    import matplotlib
+    matplotlib.use("TkAgg")
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    return plt, FigureCanvasTkAgg
+
+
+def pil_image():
+    """Lädt PIL und gibt (Image, ImageTk) zurück"""
+    from PIL import Image, ImageTk
+    return Image, ImageTk
\ No newline at end of file
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Auflösung der Zeiträume ("Dieser Monat", "Dieses Quartal", ...) in Datumsgrenzen
+
+Ein Zeitraum wird als halboffenes Intervall [start, ende) zurückgegeben. Die
+Grenzen werden als Parameter an SQLite übergeben, so dass die Datumsspalte
+nicht in eine Funktion verpackt werden muss und ein Index genutzt werden kann.
+"""
+
+from datetime import date, datetime, timedelta
+
+DATE_FORMAT = '%d.%m.%Y'
+
+
+def _month_start(year, month):
+    """Erster Tag eines Monats, Monate außerhalb 1-12 werden ins Vor-/Folgejahr übertragen"""
+    year += (month - 1) // 12
+    month = (month - 1) % 12 + 1
+    return date(year, month, 1)
+
+
+def parse_date(value):
+    """Wandelt ein Datum im Format TT.MM.JJJJ (oder ein date-Objekt) in ein date um"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value.strip(), DATE_FORMAT).date()
+
+
+def resolve_period(period, date_from=None, date_to=None, today=None):
+    """Liefert die Grenzen (start, ende) des Zeitraums als date-Objekte
+
+    Das Ende ist exklusiv. Für unbekannte Zeiträume (z.B. "Alle") werden
+    beide Grenzen als None zurückgegeben. Bei "Benutzerdefiniert" sind
+    date_from und date_to inklusive anzugeben (TT.MM.JJJJ oder date); ein
+    ungültiges Datum löst einen ValueError aus.
+    """
+    today = today or date.today()
+
+    if period == "Heute":
+        return today, today + timedelta(days=1)
+    if period == "Diese Woche":
+        start = today - timedelta(days=today.weekday())
+        return start, start + timedelta(days=7)
+    if period == "Dieser Monat":
+        return _month_start(today.year, today.month), _month_start(today.year, today.month + 1)
+    if period == "Letzter Monat":
+        return _month_start(today.year, today.month - 1), _month_start(today.year, today.month)
+    if period == "Dieses Quartal":
+        quarter_month = ((today.month - 1) // 3) * 3 + 1
+        return _month_start(today.year, quarter_month), _month_start(today.year, quarter_month + 3)
+    if period == "Dieses Jahr":
+        return date(today.year, 1, 1), date(today.year + 1, 1, 1)
+    if period == "Letztes Jahr":
+        return date(today.year - 1, 1, 1), date(today.year, 1, 1)
+    if period == "Benutzerdefiniert":
+        start = parse_date(date_from) if date_from else None
+        end = parse_date(date_to) + timedelta(days=1) if date_to else None
+        return start, end
+
+    return None, None
+
+
+def range_condition(column, start, end):
+    """Erstellt die Bedingung "column >= ? AND column < ?" für die Grenzen [start, end)
+
+    Fehlende Grenzen (None) werden weggelassen; ohne Grenzen wird ("", []) zurückgegeben.
+    """
+    conditions = []
+    params = []
+    if start is not None:
+        conditions.append(f"{column} >= ?")
+        params.append(start.isoformat())
+    if end is not None:
+        conditions.append(f"{column} < ?")
+        params.append(end.isoformat())
+
+    return " AND ".join(conditions), params
+
+
+def period_condition(column, period, date_from=None, date_to=None, today=None):
+    """Erstellt die Bedingung "column >= ? AND column < ?" samt Parametern
+
+    Gibt ("", []) zurück, wenn der Zeitraum nicht eingeschränkt ist.
+    """
+    start, end = resolve_period(period, date_from, date_to, today)
+    return range_condition(column, start, end)
\ No newline at end of file